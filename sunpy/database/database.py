@@ -11,7 +11,7 @@ from datetime import datetime
 from contextlib import contextmanager
 import os.path
 
-from sqlalchemy import create_engine, exists
+from sqlalchemy import create_engine, exists, func, inspect
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from astropy import units
@@ -323,10 +323,31 @@ class Database(object):
                 except TypeError:
                     this[1] = value
         self._create_tables()
+        # The (first, last) ID ranges of the entries added in bulk which have
+        # not been loaded into the cache yet
+        self._uncached_ids = []
         self._cache = Cache(cache_size)
         for entry in self:
             self._cache[entry.id] = entry
 
+    @property
+    def _cache(self):
+        """The cache of database entries. The entries added in bulk are only
+        loaded into it the first time it is used after they were added.
+
+        """
+        if self._uncached_ids:
+            uncached_ids, self._uncached_ids = self._uncached_ids, []
+            for first_id, last_id in uncached_ids:
+                for entry in self.session.query(tables.DatabaseEntry).filter(
+                        tables.DatabaseEntry.id.between(first_id, last_id)):
+                    self._entry_cache[entry.id] = entry
+        return self._entry_cache
+
+    @_cache.setter
+    def _cache(self, cache):
+        self._entry_cache = cache
+
     @property
     def url(self):
         """The sqlalchemy url of the database instance"""
@@ -376,6 +397,14 @@ class Database(object):
         """
         metadata = tables.Base.metadata
         metadata.create_all(self._engine, checkfirst=checkfirst)
+        # Tables created by earlier versions of sunpy lack some of the
+        # indexes, which create_all does not add to existing tables
+        inspector = inspect(self._engine)
+        for table in metadata.sorted_tables:
+            existing = set(index['name'] for index in inspector.get_indexes(table.name))
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(self._engine)
 
     def commit(self):
         """Flush pending changes and commit the current transaction. This is a
@@ -743,7 +772,8 @@ class Database(object):
             raise EntryAlreadyUnstarredError(database_entry)
         self.edit(database_entry, starred=False)
 
-    def add_many(self, database_entries, ignore_already_added=False):
+    def add_many(self, database_entries, ignore_already_added=False,
+                 bulk=False, batch_size=1000):
         """Add a row of database entries "at once". If this method is used,
         only one entry is saved in the undo history.
 
@@ -755,13 +785,28 @@ class Database(object):
         ignore_already_added : bool, optional
             See Database.add
 
+        bulk : bool, optional
+            If True, the entries are written with batched inserts into the
+            database tables instead of one by one through the session, which
+            is much faster for large numbers of entries. Entries added this
+            way are not saved in the undo history, and the given entry
+            objects are not attached to the database; get the stored entries
+            by searching the database instead. Each batch is flushed to the
+            database as soon as it has been written, so that the entries can
+            be generated incrementally from an iterator of any length. As with
+            the other additions, the entries are only committed by
+            :meth:`sunpy.database.Database.commit`.
+
+        batch_size : int, optional
+            The number of entries written at once if ``bulk`` is True.
+
         """
+        if bulk:
+            self._bulk_add(database_entries, ignore_already_added, batch_size)
+            return
         cmds = CompositeOperation()
         for database_entry in database_entries:
-            # use list(self) instead of simply self because __contains__ checks
-            # for existence in the database and not only all attributes except
-            # ID.
-            if database_entry in list(self) and not ignore_already_added:
+            if not ignore_already_added and self._is_already_added(database_entry):
                 raise EntryAlreadyAddedError(database_entry)
             cmd = commands.AddEntry(self.session, database_entry)
             if self._enable_history:
@@ -775,6 +820,92 @@ class Database(object):
         if cmds:
             self._command_manager.do(cmds)
 
+    def _is_already_added(self, database_entry):
+        """Return True if an entry equal to the given one is saved in the
+        database. The candidates are looked up through the indexed columns
+        rather than by comparing against every entry.
+
+        """
+        entry_cls = tables.DatabaseEntry
+        candidates = self.session.query(entry_cls).filter(
+            entry_cls.observation_time_start == database_entry.observation_time_start,
+            entry_cls.observation_time_end == database_entry.observation_time_end,
+            entry_cls.instrument == database_entry.instrument,
+            entry_cls.fileid == database_entry.fileid,
+            entry_cls.path == database_entry.path)
+        return any(candidate == database_entry for candidate in candidates)
+
+    def _bulk_add(self, database_entries, ignore_already_added, batch_size):
+        """Write the given entries, their FITS header entries, key comments
+        and tags to the database tables with one insert statement per table
+        and batch of entries.
+
+        """
+        entry_table = tables.DatabaseEntry.__table__
+        header_table = tables.FitsHeaderEntry.__table__
+        comment_table = tables.FitsKeyComment.__table__
+        tag_table = tables.Tag.__table__
+
+        # Pending entries need to be written first to find the next free ID
+        self.session.flush()
+        next_id = (self.session.query(func.max(tables.DatabaseEntry.id)).scalar() or 0) + 1
+        known_tags = set(name for name, in self.session.query(tables.Tag.name))
+
+        database_entries = iter(database_entries)
+        while True:
+            batch = list(itertools.islice(database_entries, batch_size))
+            if not batch:
+                break
+            entry_rows, header_rows, comment_rows, tag_rows = [], [], [], []
+            # The entries of this batch, which are not in the database yet
+            batch_entries = {}
+            for database_entry in batch:
+                if not ignore_already_added:
+                    key = (database_entry.observation_time_start,
+                           database_entry.observation_time_end,
+                           database_entry.instrument, database_entry.fileid,
+                           database_entry.path)
+                    same_key = batch_entries.setdefault(key, [])
+                    if (any(other == database_entry for other in same_key) or
+                            self._is_already_added(database_entry)):
+                        raise EntryAlreadyAddedError(database_entry)
+                    same_key.append(database_entry)
+                row = dict((column.name, getattr(database_entry, column.name))
+                           for column in entry_table.columns)
+                row['id'] = next_id
+                row['starred'] = bool(database_entry.starred)
+                entry_rows.append(row)
+                header_rows.extend(
+                    {'dbentry_id': next_id, 'key': header_entry.key, 'value': header_entry.value}
+                    for header_entry in database_entry.fits_header_entries)
+                comment_rows.extend(
+                    {'dbentry_id': next_id, 'key': comment.key, 'value': comment.value}
+                    for comment in database_entry.fits_key_comments)
+                tag_rows.extend(
+                    {'tag_name': tag.name, 'entry_id': next_id}
+                    for tag in database_entry.tags)
+                next_id += 1
+
+            new_tags = set(row['tag_name'] for row in tag_rows) - known_tags
+            for table, rows in [(entry_table, entry_rows), (header_table, header_rows),
+                                (comment_table, comment_rows),
+                                (tag_table, [{'name': name} for name in new_tags]),
+                                (tables.association_table, tag_rows)]:
+                if rows:
+                    self.session.execute(table.insert(), rows)
+            known_tags |= new_tags
+
+            # Leave the commit to the caller, so that the entries are added in
+            # the current transaction
+            self.session.flush()
+
+            # Load the new entries into the cache only when it is next used
+            first_id, last_id = entry_rows[0]['id'], entry_rows[-1]['id']
+            if self._uncached_ids and self._uncached_ids[-1][1] == first_id - 1:
+                self._uncached_ids[-1] = (self._uncached_ids[-1][0], last_id)
+            else:
+                self._uncached_ids.append((first_id, last_id))
+
     def add(self, database_entry, ignore_already_added=False):
         """Add the given database entry to the database table.
 
@@ -888,7 +1019,9 @@ class Database(object):
                       ignore_already_added)
 
     def add_from_dir(self, path, recursive=False, pattern='*',
-                     ignore_already_added=False, time_string_parse_format=None):
+                     ignore_already_added=False, time_string_parse_format=None,
+                     bulk=False, batch_size=1000, parallel=False, max_workers=None,
+                     incremental=False):
         """Search the given directory for FITS files and use their FITS headers
         to add new entries to the database. Note that one entry in the database
         is assigned to a list of FITS headers, so not the number of FITS headers
@@ -923,13 +1056,48 @@ class Database(object):
             `~datetime.datetime.strftime` if `sunpy.time.parse_time` is unable to
             automatically read the `date-obs` metadata.
 
+        bulk : bool, optional
+            See :meth:`sunpy.database.Database.add_many`.
+
+        batch_size : int, optional
+            See :meth:`sunpy.database.Database.add_many`.
+
+        parallel : bool, optional
+            If True, the FITS headers are read in a pool of processes.
+
+        max_workers : int, optional
+            The number of processes used if ``parallel`` is True.
+
+        incremental : bool, optional
+            If True, the path, modification time and size of every file read
+            are recorded, and files that were read by an earlier call and
+            have not changed since are skipped. The entries of files that have
+            changed are replaced, and the entries of files that no longer give
+            any entries or have been deleted are removed.
+
         """
         cmds = CompositeOperation()
+        known_files = None
+        scanned = None
+        if incremental:
+            known_files = dict(
+                (scanned_file.path, (scanned_file.mtime, scanned_file.size))
+                for scanned_file in self.session.query(tables.ScannedFile))
+            scanned = []
         entries = tables.entries_from_dir(
             path, recursive, pattern, self.default_waveunit,
-            time_string_parse_format=time_string_parse_format)
+            time_string_parse_format=time_string_parse_format,
+            parallel=parallel, max_workers=max_workers, known_files=known_files,
+            scanned=scanned)
+        if incremental:
+            entries = self._record_scanned_files(entries, known_files, scanned,
+                                                 path, recursive)
+        if bulk:
+            self.add_many((database_entry for database_entry, filepath in entries),
+                          ignore_already_added, bulk=True, batch_size=batch_size)
+            return
         for database_entry, filepath in entries:
-            if database_entry in list(self) and not ignore_already_added:
+            if not ignore_already_added and self._is_already_added(database_entry):
                 raise EntryAlreadyAddedError(database_entry)
             cmd = commands.AddEntry(self.session, database_entry)
             if self._enable_history:
@@ -940,6 +1108,52 @@ class Database(object):
         if cmds:
             self._command_manager.do(cmds)
 
+    def _record_scanned_files(self, entries, known_files, scanned, fitsdir, recursive):
+        """Pass through the (entry, path) pairs generated by
+        :func:`sunpy.database.tables.entries_from_dir`, recording each file
+        and removing the entries made from earlier versions of it.
+
+        Once all the entries have been generated, the files in ``scanned``
+        which gave no entries are recorded as well, and the entries and
+        records of the files of ``known_files`` in the scanned directory which
+        have been deleted are removed.
+
+        """
+        recorded = set()
+        for database_entry, path in entries:
+            if path not in recorded:
+                recorded.add(path)
+                self._record_scanned_file(path, known_files)
+            yield database_entry, path
+
+        for path in scanned:
+            if path not in recorded:
+                self._record_scanned_file(path, known_files)
+
+        fitsdir = os.path.abspath(fitsdir)
+        for path in known_files:
+            if os.path.exists(path):
+                continue
+            dirpath = os.path.abspath(os.path.dirname(path))
+            if dirpath == fitsdir or (recursive and dirpath.startswith(fitsdir + os.sep)):
+                self._remove_entries_from_path(path)
+                self.session.query(tables.ScannedFile).filter(
+                    tables.ScannedFile.path == path).delete()
+
+    def _record_scanned_file(self, path, known_files):
+        """Record the modification time and size of a file which has been
+        read, removing the entries made from an earlier version of it.
+
+        """
+        stat = os.stat(path)
+        if path in known_files:
+            self._remove_entries_from_path(path)
+        self.session.merge(tables.ScannedFile(path, stat.st_mtime, stat.st_size))
+
+    def _remove_entries_from_path(self, path):
+        self.remove_many(self.session.query(tables.DatabaseEntry).filter(
+            tables.DatabaseEntry.path == path).all())
+
     def add_from_file(self, file, ignore_already_added=False):
         """Generate as many database entries as there are FITS headers in the
         given file and add them to the database.
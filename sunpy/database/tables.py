@@ -6,13 +6,16 @@ from __future__ import absolute_import, print_function
 
 from time import strptime, mktime
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import itertools
 import fnmatch
 import os
 
 from astropy.units import Unit, nm, equivalencies, quantity
 import astropy.table
 from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean,\
-    Table, ForeignKey
+    Table, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 import numpy as np
@@ -31,7 +34,7 @@ TIME_FORMAT = config.get("general", "time_format")
 
 __all__ = [
     'WaveunitNotFoundError', 'WaveunitNotConvertibleError', 'JSONDump',
-    'FitsHeaderEntry', 'FitsKeyComment', 'Tag', 'DatabaseEntry',
+    'FitsHeaderEntry', 'FitsKeyComment', 'Tag', 'ScannedFile', 'DatabaseEntry',
     'entries_from_query_result', 'entries_from_file', 'entries_from_dir',
     'display_entries']
 
@@ -101,8 +104,11 @@ class JSONDump(Base):
 
 class FitsHeaderEntry(Base):
     __tablename__ = 'fitsheaderentries'
+    __table_args__ = (
+        Index('ix_fitsheaderentries_key_value', 'key', 'value'),
+    )
 
-    dbentry_id = Column(Integer, ForeignKey('data.id'))
+    dbentry_id = Column(Integer, ForeignKey('data.id'), index=True)
     id = Column(Integer, primary_key=True)
     key = Column(String, nullable=False)
     value = Column(String)
@@ -131,7 +137,7 @@ class FitsHeaderEntry(Base):
 class FitsKeyComment(Base):
     __tablename__ = 'fitskeycomments'
 
-    dbentry_id = Column(Integer, ForeignKey('data.id'))
+    dbentry_id = Column(Integer, ForeignKey('data.id'), index=True)
     id = Column(Integer, primary_key=True)
     key = Column(String, nullable=False)
     value = Column(String)
@@ -185,6 +191,28 @@ class Tag(Base):
         return '<{0}(name {1!r})>'.format(self.__class__.__name__, self.name)
 
 
+class ScannedFile(Base):
+    """
+    A file that has been read by :meth:`sunpy.database.Database.add_from_dir`,
+    with its modification time and size at the time it was read. Used to skip
+    unchanged files when a directory is scanned again.
+    """
+    __tablename__ = 'scannedfiles'
+
+    path = Column(String, nullable=False, primary_key=True)
+    mtime = Column(Float)
+    size = Column(Integer)
+
+    def __init__(self, path, mtime, size):
+        self.path = path
+        self.mtime = mtime
+        self.size = size
+
+    def __repr__(self):  # pragma: no cover
+        return '<{0}(path {1!r}, mtime {2!r}, size {3!r})>'.format(
+            self.__class__.__name__, self.path, self.mtime, self.size)
+
+
 class DatabaseEntry(Base):
     """
     DatabaseEntry()
@@ -250,12 +278,12 @@ class DatabaseEntry(Base):
     provider = Column(String)
     physobs = Column(String)
     fileid = Column(String)
-    observation_time_start = Column(DateTime)
-    observation_time_end = Column(DateTime)
-    instrument = Column(String)
+    observation_time_start = Column(DateTime, index=True)
+    observation_time_end = Column(DateTime, index=True)
+    instrument = Column(String, index=True)
     size = Column(Float)
-    wavemin = Column(Float)
-    wavemax = Column(Float)
+    wavemin = Column(Float, index=True)
+    wavemax = Column(Float, index=True)
     hdu_index = Column(Integer)
     path = Column(String)
     download_time = Column(DateTime)
@@ -707,7 +735,9 @@ def entries_from_file(file, default_waveunit=None,
 
 
 def entries_from_dir(fitsdir, recursive=False, pattern='*',
-                     default_waveunit=None, time_string_parse_format=None):
+                     default_waveunit=None, time_string_parse_format=None,
+                     parallel=False, max_workers=None, known_files=None,
+                     scanned=None):
     """Search the given directory for FITS files and use the corresponding FITS
     headers to generate instances of :class:`DatabaseEntry`. FITS files are
     detected by reading the content of each file, the `pattern` argument may be
@@ -740,6 +770,22 @@ def entries_from_dir(fitsdir, recursive=False, pattern='*',
         `~datetime.datetime.strftime` if `sunpy.time.parse_time` is unable to
         automatically read the `date-obs` metadata.
 
+    parallel : bool, optional
+        If True, the headers are read and the entries are made in a pool of
+        processes. The entries are still generated in the order of the files.
+
+    max_workers : int, optional
+        The number of processes used if ``parallel`` is True. Defaults to
+        the number of CPUs.
+
+    known_files : dict, optional
+        A mapping of file paths to ``(mtime, size)`` pairs. Files whose
+        modification time and size match are skipped.
+
+    scanned : list, optional
+        If given, the path of every file that is read is appended to it, also
+        for the files which are not FITS files or give no entries.
+
     Returns
     -------
     generator of (DatabaseEntry, str) pairs
@@ -758,26 +804,69 @@ def entries_from_dir(fitsdir, recursive=False, pattern='*',
     >>> len(entries)
     13
 
+    """
+    paths = _paths_from_dir(fitsdir, recursive, pattern, known_files)
+    read = functools.partial(_entries_from_path, default_waveunit=default_waveunit,
+                             time_string_parse_format=time_string_parse_format)
+    if not parallel:
+        for path in paths:
+            entries = read(path)
+            if scanned is not None:
+                scanned.append(path)
+            for entry in entries:
+                yield entry, path
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Submit the files in chunks, so that walking a large tree does not
+        # queue up all of it at once
+        chunk_size = 64 * (max_workers or os.cpu_count() or 1)
+        while True:
+            chunk = list(itertools.islice(paths, chunk_size))
+            if not chunk:
+                break
+            for path, entries in zip(chunk, executor.map(read, chunk, chunksize=16)):
+                if scanned is not None:
+                    scanned.append(path)
+                for entry in entries:
+                    yield entry, path
+
+
+def _paths_from_dir(fitsdir, recursive, pattern, known_files):
+    """Generate the paths of the files in a directory that match the
+    pattern and are not unchanged entries of ``known_files``.
+
     """
     for dirpath, dirnames, filenames in os.walk(fitsdir):
         filename_paths = (os.path.join(dirpath, name) for name in filenames)
         for path in fnmatch.filter(filename_paths, pattern):
-            try:
-                filetype = sunpy_filetools._detect_filetype(path)
-            except (
-                    sunpy_filetools.UnrecognizedFileTypeError,
-                    sunpy_filetools.InvalidJPEG2000FileExtension):
-                continue
-            if filetype == 'fits':
-                for entry in entries_from_file(
-                        path, default_waveunit,
-                        time_string_parse_format=time_string_parse_format
-                ):
-                    yield entry, path
+            if known_files and path in known_files:
+                stat = os.stat(path)
+                if tuple(known_files[path]) == (stat.st_mtime, stat.st_size):
+                    continue
+            yield path
         if not recursive:
             break
 
 
+def _entries_from_path(path, default_waveunit=None, time_string_parse_format=None):
+    """Return the list of entries made from the file at ``path``, which is
+    empty if it is not a FITS file.
+
+    """
+    try:
+        filetype = sunpy_filetools._detect_filetype(path)
+    except (
+            sunpy_filetools.UnrecognizedFileTypeError,
+            sunpy_filetools.InvalidJPEG2000FileExtension):
+        return []
+    if filetype != 'fits':
+        return []
+    return list(entries_from_file(
+        path, default_waveunit,
+        time_string_parse_format=time_string_parse_format))
+
+
 def _create_display_table(database_entries, columns=None, sort=False):
     """Generate a table to display the database entries.
 
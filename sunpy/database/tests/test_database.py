@@ -13,6 +13,7 @@ import shutil
 import pytest
 import sqlalchemy
 
+import astropy.io.fits
 from astropy import units
 
 import sunpy
@@ -20,7 +21,7 @@ from sunpy.database import Database, EntryAlreadyAddedError,\
     EntryAlreadyStarredError, EntryAlreadyUnstarredError, NoSuchTagError,\
     EntryNotFoundError, TagAlreadyAssignedError, disable_undo, split_database
 from sunpy.database.tables import DatabaseEntry, Tag, FitsHeaderEntry,\
-    FitsKeyComment, JSONDump
+    FitsKeyComment, JSONDump, ScannedFile
 from sunpy.database.commands import EmptyCommandStackError, NoSuchEntryError
 from sunpy.database.caching import LRUCache, LFUCache
 from sunpy.database import attrs
@@ -410,6 +411,54 @@ def test_add_many_with_existing_entry(database):
         database.add_many([evil_entry])
 
 
+def test_add_many_bulk(database):
+    entries = [DatabaseEntry(instrument='EIT'), DatabaseEntry(instrument='AIA', starred=True)]
+    entries[0].fits_header_entries = [FitsHeaderEntry('NAXIS', 2)]
+    entries[1].tags = [Tag('foo')]
+    database.add_many(entries * 3, ignore_already_added=True, bulk=True, batch_size=4)
+    database.commit()
+    assert len(database) == 6
+    assert database.cache_size == 6
+    assert sorted(entry.id for entry in database) == list(range(1, 7))
+    assert [entry.instrument for entry in database] == ['EIT', 'AIA'] * 3
+    assert [entry.starred for entry in database] == [False, True] * 3
+    assert database[0].fits_header_entries[0].key == 'NAXIS'
+    assert database.get_tag('foo').name == 'foo'
+    assert len(database.get_tag('foo').data) == 3
+    # Bulk additions are not saved in the undo history
+    with pytest.raises(EmptyCommandStackError):
+        database.undo()
+
+
+def test_add_many_bulk_cache(database):
+    database.add_many([DatabaseEntry(instrument='EIT')] * 5, ignore_already_added=True,
+                      bulk=True, batch_size=2)
+    # The entries are only loaded into the cache when it is next used
+    assert database._uncached_ids == [(1, 5)]
+    assert database.get_entry_by_id(5).instrument == 'EIT'
+    assert not database._uncached_ids
+    assert database.cache_size == 5
+
+
+def test_add_many_bulk_rollback(database):
+    database.commit()
+    database.add_many([DatabaseEntry(instrument='EIT')] * 3, ignore_already_added=True,
+                      bulk=True, batch_size=2)
+    database.session.rollback()
+    assert database.session.query(DatabaseEntry).count() == 0
+
+
+def test_add_many_bulk_with_existing_entry(database):
+    database.add_many([DatabaseEntry()], bulk=True)
+    with pytest.raises(EntryAlreadyAddedError):
+        database.add_many([DatabaseEntry()], bulk=True)
+
+
+def test_add_many_bulk_with_duplicate_in_batch(database):
+    with pytest.raises(EntryAlreadyAddedError):
+        database.add_many([DatabaseEntry(instrument='EIT')] * 2, bulk=True)
+
+
 def test_add_entry(database):
     entry = DatabaseEntry()
     assert entry.id is None
@@ -636,6 +685,71 @@ def test_add_fom_path_ignore_duplicates(database):
     assert len(database) == 8
 
 
+def test_add_fom_path_bulk(database):
+    database.add_from_dir(waveunitdir, bulk=True)
+    assert len(database) == 4
+    entries = sorted(database, key=lambda entry: entry.path)
+    database.clear()
+    database.add_from_dir(waveunitdir)
+    assert sorted(entry.path for entry in database) == [entry.path for entry in entries]
+
+
+def test_add_fom_path_parallel(database):
+    database.add_from_dir(waveunitdir, parallel=True, max_workers=2)
+    assert len(database) == 4
+    with pytest.raises(EntryAlreadyAddedError):
+        database.add_from_dir(waveunitdir, parallel=True, max_workers=2)
+
+
+def test_add_fom_path_incremental(database, tmpdir):
+    for filename in glob.glob(os.path.join(waveunitdir, '*.f*ts')):
+        shutil.copy(filename, str(tmpdir))
+    database.add_from_dir(str(tmpdir), incremental=True, bulk=True)
+    assert len(database) == 4
+    # Unchanged files are skipped
+    database.add_from_dir(str(tmpdir), incremental=True, bulk=True)
+    assert len(database) == 4
+    # The entries of a changed file are replaced
+    path = database[0].path
+    with astropy.io.fits.open(path, mode='update') as hdulist:
+        hdulist[0].header['INSTRUME'] = 'CHANGED'
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    database.add_from_dir(str(tmpdir), incremental=True)
+    database.commit()
+    assert len(database) == 4
+    assert [entry.instrument for entry in database if entry.path == path] == ['CHANGED']
+
+
+def test_add_fom_path_incremental_without_entries(database, tmpdir):
+    for filename in glob.glob(os.path.join(waveunitdir, '*.f*ts')):
+        shutil.copy(filename, str(tmpdir))
+    tmpdir.join('notes.txt').write('not a FITS file')
+    database.add_from_dir(str(tmpdir), incremental=True)
+    database.commit()
+    assert len(database) == 4
+    # Files that give no entries are recorded too
+    scanned = set(scanned_file.path for scanned_file in
+                  database.session.query(ScannedFile))
+    assert str(tmpdir.join('notes.txt')) in scanned
+    assert len(scanned) == len(os.listdir(str(tmpdir)))
+
+    # The entries of a file which now gives none, or has been deleted, are removed
+    changed_path, deleted_path = sorted(set(entry.path for entry in database))[:2]
+    with open(changed_path, 'w') as changed_file:
+        changed_file.write('not a FITS file any more')
+    os.remove(deleted_path)
+    database.add_from_dir(str(tmpdir), incremental=True)
+    database.commit()
+    paths = set(entry.path for entry in database)
+    assert changed_path not in paths
+    assert deleted_path not in paths
+    scanned = set(scanned_file.path for scanned_file in
+                  database.session.query(ScannedFile))
+    assert changed_path in scanned
+    assert deleted_path not in scanned
+
+
 def test_add_from_file(database):
     assert len(database) == 0
     database.add_from_file(RHESSI_IMAGE)
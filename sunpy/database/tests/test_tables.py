@@ -416,6 +416,39 @@ def test_entries_from_dir_recursively_false():
     assert len(entries) == 81
 
 
+def test_entries_from_dir_parallel():
+    entries = list(entries_from_dir(testdir, True,
+                                    default_waveunit='angstrom',
+                                    time_string_parse_format='%d/%m/%Y'))
+    parallel_entries = list(entries_from_dir(testdir, True,
+                                             default_waveunit='angstrom',
+                                             time_string_parse_format='%d/%m/%Y',
+                                             parallel=True, max_workers=2))
+    assert [path for entry, path in parallel_entries] == [path for entry, path in entries]
+    for (entry, path), (parallel_entry, parallel_path) in zip(entries, parallel_entries):
+        assert parallel_entry.instrument == entry.instrument
+        assert parallel_entry.observation_time_start == entry.observation_time_start
+        assert parallel_entry.hdu_index == entry.hdu_index
+        assert len(parallel_entry.fits_header_entries) == len(entry.fits_header_entries)
+
+
+def test_entries_from_dir_known_files():
+    entries = list(entries_from_dir(
+        waveunitdir, time_string_parse_format='%d/%m/%Y'))
+    path = entries[0][1]
+    stat = os.stat(path)
+    known_files = {path: (stat.st_mtime, stat.st_size)}
+    new_entries = list(entries_from_dir(
+        waveunitdir, time_string_parse_format='%d/%m/%Y', known_files=known_files))
+    assert [filename for entry, filename in new_entries] == [
+        filename for entry, filename in entries if filename != path]
+    # A file that has changed since is read again
+    known_files[path] = (stat.st_mtime - 1, stat.st_size)
+    assert len(list(entries_from_dir(
+        waveunitdir, time_string_parse_format='%d/%m/%Y',
+        known_files=known_files))) == len(entries)
+
+
 @pytest.mark.remote_data
 def test_entries_from_query_result(query_result):
     entries = list(entries_from_query_result(query_result))
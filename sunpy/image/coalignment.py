@@ -6,7 +6,11 @@ Which is partially inspired by the SSWIDL routine
 `tr_get_disp.pro <http://www.heliodocs.com/php/xdoc_print.php?file=$SSW/trace/idl/util/tr_get_disp.pro>`_.
 
 In this implementation, the template matching is handled via the scikit-image
-routine :func:`skimage.feature.match_template`.
+routine :func:`skimage.feature.match_template`.  For long mapcubes the layers
+can instead be matched in batches, using FFTs of a whole stack of layers and a
+precomputed template spectrum, and shifted in batches using the Fourier shift
+theorem.  See the ``batch`` keyword of
+:func:`~sunpy.image.coalignment.mapcube_coalign_by_match_template`.
 
 References
 ----------
@@ -19,8 +23,11 @@ Template matching algorithm:
 """
 from __future__ import absolute_import, division, print_function
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from scipy.ndimage.interpolation import shift
+from scipy.fftpack import next_fast_len
 from copy import deepcopy
 from astropy import units as u
 # Image co-registration by matching templates
@@ -33,7 +40,8 @@ import sunpy.map
 __author__ = 'J. Ireland'
 
 __all__ = ['calculate_shift', 'clip_edges', 'calculate_clipping',
-           'match_template_to_layer', 'find_best_match_location',
+           'match_template_to_layer', 'match_template_to_layers',
+           'find_best_match_location', 'fourier_shift_layers',
            'get_correlation_shifts', 'parabolic_turning_point',
            'repair_image_nonfinite', 'apply_shifts',
            'mapcube_coalign_by_match_template',
@@ -199,6 +207,81 @@ def match_template_to_layer(layer, template):
     return match_template(layer, template)
 
 
+def match_template_to_layers(layers, template):
+    """
+    Calculate the correlation arrays that describe how well the template
+    matches each layer in a stack of layers.  The correlation is calculated
+    using FFTs of the whole stack at once, and gives the same result as calling
+    `~sunpy.image.coalignment.match_template_to_layer` on each layer.
+
+    Parameters
+    ----------
+    layers : `~numpy.ndarray`
+        A numpy array of size (nt, ny, nx).
+    template : `~numpy.ndarray`
+        A numpy array of size (N, M) where N < ny and M < nx.
+
+    Returns
+    -------
+    correlationarrays : `~numpy.ndarray`
+        A numpy array of size (nt, ny - N + 1, nx - M + 1) holding the
+        correlation array between each layer and the template.
+    """
+    layers = np.asarray(layers, dtype=np.float64)
+    template = np.asarray(template, dtype=np.float64)
+    return _TemplateMatcher(template, layers.shape[1:])(layers)
+
+
+class _TemplateMatcher(object):
+    """
+    Normalized cross-correlation of a template with stacks of layers of a
+    given shape, following the algorithm of `skimage.feature.match_template`.
+    The spectrum of the template is calculated once, and reused for every
+    stack of layers.
+    """
+    def __init__(self, template, layer_shape):
+        self.template_shape = template.shape
+        self.layer_shape = tuple(layer_shape)
+        self.fft_shape = tuple(next_fast_len(n + m - 1) for n, m in
+                               zip(self.layer_shape, self.template_shape))
+        self.template_spectrum = np.fft.rfft2(template[::-1, ::-1], s=self.fft_shape)
+        self.template_mean = template.mean()
+        self.template_volume = template.size
+        self.template_ssd = np.sum((template - self.template_mean) ** 2)
+
+    def __call__(self, layers):
+        ny, nx = self.layer_shape
+        n, m = self.template_shape
+        xcorr = np.fft.irfft2(np.fft.rfft2(layers, s=self.fft_shape) * self.template_spectrum,
+                              s=self.fft_shape)[:, n - 1:ny, m - 1:nx]
+
+        window_sum = _window_sum(layers, self.template_shape)
+        window_sum2 = _window_sum(layers ** 2, self.template_shape)
+
+        numerator = xcorr - window_sum * self.template_mean
+        denominator = window_sum2 - window_sum ** 2 / self.template_volume
+        denominator *= self.template_ssd
+        np.maximum(denominator, 0, out=denominator)
+        np.sqrt(denominator, out=denominator)
+
+        response = np.zeros_like(xcorr)
+        mask = denominator > np.finfo(np.float64).eps
+        response[mask] = numerator[mask] / denominator[mask]
+        return response
+
+
+def _window_sum(layers, window_shape):
+    """
+    The sum of each layer in a stack of layers over every (N, M) window that
+    lies entirely inside the layer, calculated using cumulative sums.
+    """
+    n, m = window_shape
+    cumulative = np.cumsum(np.cumsum(layers, axis=1), axis=2)
+    cumulative = np.pad(cumulative, ((0, 0), (1, 0), (1, 0)), mode='constant')
+    return (cumulative[:, n:, m:] - cumulative[:, :-n, m:] -
+            cumulative[:, n:, :-m] + cumulative[:, :-n, :-m])
+
+
 def find_best_match_location(corr):
     """
     Calculate an estimate of the location of the peak of the correlation
@@ -351,8 +434,56 @@ def repair_image_nonfinite(image):
     return repaired_image
 
 
+def fourier_shift_layers(layers, yshift, xshift):
+    """
+    Shift each layer in a stack of layers by a (sub-)pixel amount, using the
+    Fourier shift theorem on the whole stack at once.
+
+    Parameters
+    ----------
+    layers : `~numpy.ndarray`
+        A numpy array of size (nt, ny, nx).
+    yshift : `~numpy.ndarray`
+        An array of nt pixel shifts in the y-direction.
+    xshift : `~numpy.ndarray`
+        An array of nt pixel shifts in the x-direction.
+
+    Returns
+    -------
+    shifted_layers : `~numpy.ndarray`
+        A numpy array of size (nt, ny, nx) holding the shifted layers.
+
+    Notes
+    -----
+    The shifted layers are periodic, so that data shifted off one edge of a
+    layer wraps around to the opposite edge.
+    """
+    ny, nx = layers.shape[1:]
+    yshift = np.asarray(yshift, dtype=np.float64)[:, np.newaxis, np.newaxis]
+    xshift = np.asarray(xshift, dtype=np.float64)[:, np.newaxis, np.newaxis]
+    ky = np.fft.fftfreq(ny)[:, np.newaxis]
+    kx = np.fft.fftfreq(nx)[np.newaxis, :]
+    phase = np.exp(-2j * np.pi * (yshift * ky + xshift * kx))
+    return np.fft.ifft2(np.fft.fft2(layers) * phase).real
+
+
+def _map_chunks(function, nt, chunk_size, max_workers):
+    """
+    Call ``function(start, stop)`` on consecutive chunks of ``chunk_size``
+    layers out of ``nt`` layers, optionally using a pool of threads, and
+    return the results in order.
+    """
+    chunks = [(start, min(start + chunk_size, nt)) for start in range(0, nt, chunk_size)]
+    if max_workers is None:
+        return [function(start, stop) for start, stop in chunks]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda chunk: function(*chunk), chunks))
+
+
 @u.quantity_input(yshift=u.pix, xshift=u.pix)
-def apply_shifts(mc, yshift, xshift, clip=True, **kwargs):
+def apply_shifts(mc, yshift, xshift, clip=True, batch=False, chunk_size=16,
+                 max_workers=None, **kwargs):
     """
     Apply a set of pixel shifts to a `~sunpy.map.MapCube`, and return a new
     `~sunpy.map.MapCube`.
@@ -374,6 +505,22 @@ def apply_shifts(mc, yshift, xshift, clip=True, **kwargs):
         If True, then clip off x, y edges in the datacube that are potentially
         affected by edges effects.
 
+    batch : bool
+        If True, then the layers are shifted in chunks of ``chunk_size``
+        layers at a time using `~sunpy.image.coalignment.fourier_shift_layers`
+        rather than one at a time using `scipy.ndimage.interpolation.shift`.
+        All the layers must have the same shape. As the Fourier shift wraps
+        the data around the edges, it is only used when ``clip`` is True, no
+        other keywords are given and the data of the chunk is all finite.
+        Otherwise the layers of the chunk are shifted one at a time.
+
+    chunk_size : int
+        The number of layers shifted at once when ``batch`` is True.
+
+    max_workers : int
+        If given when ``batch`` is True, the chunks are shifted using a pool
+        of this many threads.
+
     All other keywords are passed to `scipy.ndimage.interpolation.shift`.
 
     Returns
@@ -389,9 +536,31 @@ def apply_shifts(mc, yshift, xshift, clip=True, **kwargs):
     if clip:
         yclips, xclips = calculate_clipping(-yshift, -xshift)
 
-    # Shift the data and construct the mapcube
-    for i, m in enumerate(mc):
-        shifted_data = shift(deepcopy(m.data), [yshift[i].value, xshift[i].value], **kwargs)
+    if batch:
+        if not mc.all_maps_same_shape():
+            raise ValueError('Maps in mapcube do not all have the same shape.')
+
+        def shift_chunk(start, stop):
+            layers = np.stack([mc[i].data for i in range(start, stop)])
+            if not clip or kwargs or not np.all(np.isfinite(layers)):
+                return [shift(layer, [yshift[i].value, xshift[i].value], **kwargs)
+                        for i, layer in zip(range(start, stop), layers)]
+            shifted = fourier_shift_layers(layers, yshift[start:stop].value,
+                                           xshift[start:stop].value)
+            # Return the type of the input, as scipy.ndimage.shift does
+            if np.issubdtype(layers.dtype, np.integer):
+                shifted = np.round(shifted)
+            return shifted.astype(layers.dtype, copy=False)
+
+        shifted_chunks = _map_chunks(shift_chunk, len(mc), chunk_size, max_workers)
+        shifted_layers = (layer for chunk in shifted_chunks for layer in chunk)
+    else:
+        shifted_layers = (shift(m.data, [yshift[i].value, xshift[i].value], **kwargs)
+                          for i, m in enumerate(mc))
+
+    # Construct the mapcube from the shifted data
+    for i, shifted_data in enumerate(shifted_layers):
+        m = mc[i]
         new_meta = deepcopy(m.meta)
         # Clip if required.  Use the submap function to return the appropriate
         # portion of the data.
@@ -411,7 +580,8 @@ def apply_shifts(mc, yshift, xshift, clip=True, **kwargs):
 
 
 def calculate_match_template_shift(mc, template=None, layer_index=0,
-                                   func=_default_fmap_function):
+                                   func=_default_fmap_function, batch=False,
+                                   chunk_size=16, max_workers=None):
     """
     Calculate the arcsecond shifts necessary to co-register the layers in a
     `~sunpy.map.MapCube` according to a template taken from that
@@ -449,6 +619,18 @@ def calculate_match_template_shift(mc, template=None, layer_index=0,
         func = F(data).  The default function ensures that the data are
         floats.
 
+    batch : bool
+        If True, then the template is matched to chunks of ``chunk_size``
+        layers at a time using `~sunpy.image.coalignment.match_template_to_layers`,
+        reusing the spectrum of the template, rather than one layer at a time.
+        All the layers must have the same shape.
+
+    chunk_size : int
+        The number of layers matched at once when ``batch`` is True.
+
+    max_workers : int
+        If given when ``batch`` is True, the chunks are matched using a pool
+        of this many threads.
     """
 
     # Size of the data
@@ -480,16 +662,35 @@ def calculate_match_template_shift(mc, template=None, layer_index=0,
     yshift_arcseconds = np.zeros_like(xshift_arcseconds)
 
     # Match the template and calculate shifts
-    for i, m in enumerate(mc.maps):
-        # Get the next 2-d data array
-        this_layer = func(m.data)
+    if batch:
+        if not mc.all_maps_same_shape():
+            raise ValueError('Maps in mapcube do not all have the same shape.')
+
+        matcher = _TemplateMatcher(repair_image_nonfinite(np.float64(tplate)), (ny, nx))
+
+        def match_chunk(start, stop):
+            layers = np.stack([np.float64(func(mc[i].data)) for i in range(start, stop)])
+            for j, layer in enumerate(layers):
+                if not np.all(np.isfinite(layer)):
+                    layers[j] = repair_image_nonfinite(layer)
+            return [find_best_match_location(corr) for corr in matcher(layers)]
+
+        chunks = _map_chunks(match_chunk, nt, chunk_size, max_workers)
+        locations = (location for chunk in chunks for location in chunk)
+        for i, (yshift, xshift) in enumerate(locations):
+            yshift_keep[i] = yshift
+            xshift_keep[i] = xshift
+    else:
+        for i, m in enumerate(mc.maps):
+            # Get the next 2-d data array
+            this_layer = func(m.data)
 
-        # Calculate the y and x shifts in pixels
-        yshift, xshift = calculate_shift(this_layer, tplate)
+            # Calculate the y and x shifts in pixels
+            yshift, xshift = calculate_shift(this_layer, tplate)
 
-        # Keep shifts in pixels
-        yshift_keep[i] = yshift
-        xshift_keep[i] = xshift
+            # Keep shifts in pixels
+            yshift_keep[i] = yshift
+            xshift_keep[i] = xshift
 
     # Calculate shifts relative to the template layer
     yshift_keep = yshift_keep - yshift_keep[layer_index]
@@ -507,7 +708,8 @@ def calculate_match_template_shift(mc, template=None, layer_index=0,
 # Coalignment by matching a template
 def mapcube_coalign_by_match_template(mc, template=None, layer_index=0,
                                       func=_default_fmap_function, clip=True,
-                                      shift=None, **kwargs):
+                                      shift=None, batch=False, chunk_size=16,
+                                      max_workers=None, **kwargs):
     """
     Co-register the layers in a `~sunpy.map.MapCube` according to a template
     taken from that `~sunpy.map.MapCube`.  This method REQUIRES that
@@ -557,6 +759,16 @@ def mapcube_coalign_by_match_template(mc, template=None, layer_index=0,
         `~sunpy.map.MapCube`.  If a shift is passed in to the function, that
         shift is applied to the input `~sunpy.map.MapCube` and the template
         matching algorithm is not used.
+    batch : bool
+        If True, then the template matching and the shifts are done on chunks
+        of ``chunk_size`` layers at a time using FFTs, rather than one layer at
+        a time.  See `~sunpy.image.coalignment.calculate_match_template_shift`
+        and `~sunpy.image.coalignment.apply_shifts`.
+    chunk_size : int
+        The number of layers processed at once when ``batch`` is True.
+    max_workers : int
+        If given when ``batch`` is True, the chunks are processed using a pool
+        of this many threads.
 
     The remaining keyword arguments are sent to `sunpy.image.coalignment.apply_shifts`.
 
@@ -575,6 +787,7 @@ def mapcube_coalign_by_match_template(mc, template=None, layer_index=0,
     >>> coaligned_mc = mc_coalign(mc, template=sunpy_map)   # doctest: +SKIP
     >>> coaligned_mc = mc_coalign(mc, template=two_dimensional_ndarray)   # doctest: +SKIP
     >>> coaligned_mc = mc_coalign(mc, func=np.log)   # doctest: +SKIP
+    >>> coaligned_mc = mc_coalign(mc, batch=True, max_workers=8)   # doctest: +SKIP
     """
 
     # Number of maps
@@ -587,7 +800,9 @@ def mapcube_coalign_by_match_template(mc, template=None, layer_index=0,
     if shift is None:
         shifts = calculate_match_template_shift(mc, template=template,
                                                 layer_index=layer_index,
-                                                func=func)
+                                                func=func, batch=batch,
+                                                chunk_size=chunk_size,
+                                                max_workers=max_workers)
         xshift_arcseconds = shifts['x']
         yshift_arcseconds = shifts['y']
     else:
@@ -600,4 +815,5 @@ def mapcube_coalign_by_match_template(mc, template=None, layer_index=0,
         yshift_keep[i] = (yshift_arcseconds[i] / m.scale[1])
 
     # Apply the shifts and return the coaligned mapcube
-    return apply_shifts(mc, -yshift_keep, -xshift_keep, clip=clip, **kwargs)
+    return apply_shifts(mc, -yshift_keep, -xshift_keep, clip=clip, batch=batch,
+                        chunk_size=chunk_size, max_workers=max_workers, **kwargs)
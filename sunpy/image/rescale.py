@@ -2,11 +2,17 @@
 from __future__ import absolute_import, division, print_function
 
 import numpy as np
-import scipy.interpolate
 import scipy.ndimage
+from sunpy.extern import six
 from sunpy.extern.six.moves import range
 
-__all__ = ['resample', 'reshape_image_to_4d_superpixel']
+__all__ = ['resample', 'reshape_image_to_4d_superpixel', 'superpixel']
+
+
+# The 1D index and weight tables of the most recently used resamplings, so
+# that they are only worked out once for a sequence of images of the same shape
+_resample_tables = {}
+_RESAMPLE_TABLES_SIZE = 64
 
 
 def resample(orig, dimensions, method='linear', center=False, minusone=False):
@@ -26,12 +32,17 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
         Original inout array.
     dimensions : tuple
         Dimensions that new `~numpy.ndarray` should have.
-    method : {'neighbor' | 'nearest' | 'linear' | 'spline'}
+    method : {'neighbor' | 'nearest' | 'linear' | 'spline' | 'area'}
         Method to use for resampling interpolation.
             * neighbor - Closest value from original data
-            * nearest and linear - Uses n x 1-D interpolations calculated by
-              `scipy.interpolate.interp1d`.
-            * spline - Uses ndimage.map_coordinates
+            * nearest and linear - Nearest and linear interpolation, which
+              are zero beyond the edges of the original data.
+            * spline - Cubic spline interpolation, as done by
+              `scipy.ndimage.map_coordinates`
+            * area - The mean of the original data over the area of each
+              new element, which conserves the total flux for both integer
+              and non-integer factors. ``center`` and ``minusone`` do not
+              apply.
     center : bool
         If True, interpolation points are at the centers of the bins,
         otherwise points are at the front edge of the bin.
@@ -48,6 +59,15 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
         A new `~numpy.ndarray` which has been resampled to the desired
         dimensions.
 
+    Notes
+    -----
+    The resampling is separable, and is done one axis at a time from a table
+    of the indices and weights of the original elements that make up each
+    new element. The tables of recent resamplings are kept, so resampling a
+    sequence of arrays of the same shape only works them out once. Axes
+    which keep their size are not resampled, so the frames of a (nt, ny, nx)
+    array can be resampled at once with dimensions of (nt, y, x).
+
     References
     ----------
     | https://scipy-cookbook.readthedocs.io/items/Rebinning.html
@@ -57,104 +77,119 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
     if len(dimensions) != orig.ndim:
         raise UnequalNumDimensions("Number of dimensions must remain the same "
                                    "when calling resample.")
+    if method not in ['neighbor', 'nearest', 'linear', 'spline', 'area']:
+        raise UnrecognizedInterpolationMethod("Unrecognized interpolation "
+                                              "method requested.")
 
     #@note: will this be okay for integer (e.g. JPEG 2000) data?
     if orig.dtype not in [np.float64, np.float32]:
         orig = orig.astype(np.float64)
 
-    dimensions = np.asarray(dimensions, dtype=np.float64)
-    m1 = np.array(minusone, dtype=np.int64)  # array(0) or array(1)
-    offset = np.float64(center * 0.5)       # float64(0.) or float64(0.5)
-
-    # Resample data
-    if method == 'neighbor':
-        data = _resample_neighbor(orig, dimensions, offset, m1)
-    elif method in ['nearest', 'linear']:
-        data = _resample_nearest_linear(orig, dimensions, method,
-                                        offset, m1)
-    elif method == 'spline':
-        data = _resample_spline(orig, dimensions, offset, m1)
-    else:
-        raise UnrecognizedInterpolationMethod("Unrecognized interpolation "
-                                              "method requested.")
+    dimensions = [int(dim) for dim in np.asarray(dimensions, dtype=np.float64)]
+    m1 = int(minusone)
+    offset = center * 0.5
+
+    # Shrink the axes which shrink the most first, so that the later passes
+    # have the least data to go through
+    data = orig
+    for axis in sorted(range(orig.ndim), key=lambda i: dimensions[i] / orig.shape[i]):
+        if dimensions[axis] == orig.shape[axis]:
+            continue
+        if method == 'spline':
+            data = scipy.ndimage.spline_filter1d(data, order=3, axis=axis, mode='mirror',
+                                                 output=data.dtype)
+        indices, weights = _resample_table(orig.shape[axis], dimensions[axis],
+                                           method, offset, m1)
+        data = _resample_axis(data, axis, indices, weights)
+
+    # Always return a new array, even when no axis was resampled
+    if data is orig:
+        data = orig.copy()
 
     return data
 
 
-def _resample_nearest_linear(orig, dimensions, method, offset, m1):
-    """Resample Map using either linear or nearest interpolation."""
-
-    dimlist = []
-
-    # calculate new dims
-    for i in range(orig.ndim):
-        base = np.arange(dimensions[i])
-        dimlist.append((orig.shape[i] - m1) / (dimensions[i] - m1) *
-                       (base + offset) - offset)
-
-    # specify old coordinates
-    old_coords = [np.arange(i, dtype=np.float) for i in orig.shape]
-
-    # first interpolation - for ndims = any
-    mint = scipy.interpolate.interp1d(old_coords[-1], orig, bounds_error=False,
-                                      fill_value=min(old_coords[-1]), kind=method)
-
-    new_data = mint(dimlist[-1])
-
-    trorder = [orig.ndim - 1] + list(range(orig.ndim - 1))
-    for i in range(orig.ndim - 2, -1, -1):
-        new_data = new_data.transpose(trorder)
-
-        mint = scipy.interpolate.interp1d(old_coords[i], new_data,
-                                          bounds_error=False, fill_value=min(old_coords[i]), kind=method)
-        new_data = mint(dimlist[i])
-
-    if orig.ndim > 1:
-        # need one more transpose to return to original dimensions
-        new_data = new_data.transpose(trorder)
-
-    return new_data
-
-
-def _resample_neighbor(orig, dimensions, offset, m1):
-    """Resample Map using closest-value interpolation."""
-
-    dimlist = []
-    dimensions = np.asarray(dimensions, dtype=int)
-
-    for i in range(orig.ndim):
-        base = np.indices(dimensions)[i]
-        dimlist.append((orig.shape[i] - m1) / (dimensions[i] - m1) *
-                       (base + offset) - offset)
-    cd = np.array(dimlist).round().astype(int)
-
-    return orig[list(cd)]
-
-
-def _resample_spline(orig, dimensions, offset, m1):
-    """Resample Map using spline-based interpolation."""
-
-    oslices = [slice(0, j) for j in orig.shape]
-    # FIXME: not used?!
-    old_coords = np.ogrid[oslices]  # pylint: disable=W0612
-    nslices = [slice(0, j) for j in list(dimensions)]
-    newcoords = np.mgrid[nslices]
-
-    newcoords_dims = list(range(np.rank(newcoords)))
+def _resample_table(n_in, n_out, method, offset, m1):
+    """
+    The indices and weights of the elements of an axis of ``n_in`` elements
+    that make up each of the ``n_out`` elements it is resampled to.
+    """
+    key = (n_in, n_out, method, offset, m1)
+    table = _resample_tables.get(key)
+    if table is None:
+        table = _make_resample_table(*key)
+        if len(_resample_tables) >= _RESAMPLE_TABLES_SIZE:
+            _resample_tables.clear()
+        _resample_tables[key] = table
+    return table
 
-    # make first index last
-    newcoords_dims.append(newcoords_dims.pop(0))
-    newcoords_tr = newcoords.transpose(newcoords_dims)  # pylint: disable=W0612
 
-    # makes a view that affects newcoords
-    newcoords_tr += offset
+def _make_resample_table(n_in, n_out, method, offset, m1):
+    """
+    Work out the (n_out, taps) arrays of indices and weights for
+    `_resample_table`.
+    """
+    if method == 'area':
+        # The edges of the new elements, in units of the original elements
+        factor = n_in / n_out
+        low = np.arange(n_out) * factor
+        high = low + factor
+        first = np.floor(low).astype(int)
+        taps = int(np.ceil(factor)) + 1
+        indices = first[:, np.newaxis] + np.arange(taps)
+        overlap = (np.minimum(high[:, np.newaxis], indices + 1) -
+                   np.maximum(low[:, np.newaxis], indices))
+        weights = np.clip(overlap, 0, None) / factor
+        weights[indices >= n_in] = 0
+        return np.minimum(indices, n_in - 1), weights
+
+    # The coordinates of the new elements in the original axis
+    x = (n_in - m1) / (n_out - m1) * (np.arange(n_out) + offset) - offset
+    inside = ((x >= 0) & (x <= n_in - 1))[:, np.newaxis]
 
-    deltas = (np.asarray(orig.shape) - m1) / (dimensions - m1)
-    newcoords_tr *= deltas
+    if method == 'neighbor':
+        indices = np.clip(np.round(x).astype(int), 0, n_in - 1)[:, np.newaxis]
+        return indices, np.ones(indices.shape)
+
+    if method == 'nearest':
+        # Half way between two elements goes to the lower one
+        indices = np.clip(np.ceil(x - 0.5).astype(int), 0, n_in - 1)[:, np.newaxis]
+        return indices, inside.astype(float)
+
+    if method == 'linear':
+        first = np.clip(np.floor(x).astype(int), 0, max(n_in - 2, 0))
+        fraction = x - first
+        indices = np.minimum(np.column_stack([first, first + 1]), n_in - 1)
+        weights = np.column_stack([1 - fraction, fraction]) * inside
+        return indices, weights
+
+    # Cubic B-spline weights of the spline coefficients, which are reflected
+    # about the edges of the axis beyond them
+    indices = np.floor(x).astype(int)[:, np.newaxis] + np.arange(-1, 3)
+    distance = np.abs(x[:, np.newaxis] - indices)
+    weights = np.where(distance < 1, 2 / 3. - distance ** 2 + distance ** 3 / 2,
+                       np.where(distance < 2, (2 - distance) ** 3 / 6, 0))
+    if n_in > 1:
+        period = 2 * (n_in - 1)
+        indices = np.abs(indices) % period
+        indices = np.where(indices >= n_in, period - indices, indices)
+    else:
+        indices = np.zeros_like(indices)
+    return indices, weights * inside
 
-    newcoords_tr -= offset
 
-    return scipy.ndimage.map_coordinates(orig, newcoords)
+def _resample_axis(data, axis, indices, weights):
+    """
+    Resample one axis of ``data`` with the indices and weights from
+    `_resample_table`.
+    """
+    data = np.moveaxis(data, axis, 0)
+    shape = (-1,) + (1,) * (data.ndim - 1)
+    weights = weights.astype(data.dtype)
+    new_data = weights[:, 0].reshape(shape) * data[indices[:, 0]]
+    for tap in range(1, indices.shape[1]):
+        new_data += weights[:, tap].reshape(shape) * data[indices[:, tap]]
+    return np.moveaxis(new_data, 0, axis)
 
 
 def reshape_image_to_4d_superpixel(img, dimensions, offset):
@@ -231,6 +266,91 @@ def reshape_image_to_4d_superpixel(img, dimensions, offset):
                 int(offset[1]):int(offset[1] + nb * dimensions[1])]).reshape(na, dimensions[0], nb, dimensions[1])
 
 
+
+# The reductions which superpixel does in one pass over the superpixel axes,
+# and the masked array reductions used for them if the image is masked
+_superpixel_funcs = {'sum': (np.sum, np.ma.sum),
+                     'mean': (np.mean, np.ma.mean),
+                     'max': (np.max, np.ma.max),
+                     'min': (np.min, np.ma.min),
+                     'median': (np.median, np.ma.median),
+                     'nansum': (np.nansum, np.ma.sum),
+                     'nanmean': (np.nanmean, np.ma.mean),
+                     'nanmax': (np.nanmax, np.ma.max),
+                     'nanmin': (np.nanmin, np.ma.min),
+                     'nanmedian': (np.nanmedian, np.ma.median)}
+# The numpy functions whose result is the same in one pass as in two, even
+# when some of the elements are masked or NaN
+_one_pass_funcs = {np.sum: 'sum', np.max: 'max', np.amax: 'max', np.min: 'min',
+                   np.amin: 'min', np.nansum: 'nansum', np.nanmax: 'nanmax',
+                   np.nanmin: 'nanmin'}
+
+
+def superpixel(img, dimensions, offset=(0, 0), func='sum'):
+    """Returns the superpixels of the last two axes of an array.
+
+    The superpixels are formed from a view of the array, which is never
+    copied, and the built-in reductions are done over each superpixel in one
+    pass. The same binning is applied to each image of a stack of images,
+    such as an (nt, ny, nx) array.
+
+    Parameters
+    ----------
+    img : `numpy.ndarray` or `numpy.ma.MaskedArray`
+        An array of the form (..., y, x). Masked elements are left out of the
+        reductions, and superpixels with no unmasked elements are masked.
+    dimensions : array-like
+        A two element array-like object containing integers that describe the
+        superpixel size in the (y, x) directions.
+    offset : array-like
+        A two element array-like object containing integers that describe
+        where in the input image the superpixels begin in the (y, x)
+        directions.
+    func : str or function
+        One of 'sum', 'mean', 'max', 'min', 'median' or their NaN-ignoring
+        versions 'nansum', 'nanmean', 'nanmax', 'nanmin' and 'nanmedian'.
+        Otherwise a function which takes a numpy array as its first argument
+        and supports the axis keyword, which is applied over the x and then
+        over the y direction of the superpixels.
+
+    Returns
+    -------
+    out : `numpy.ndarray` or `numpy.ma.MaskedArray`
+        The array of superpixels, of the form (..., y, x).
+    """
+    dimensions = [int(dim) for dim in dimensions]
+    offset = [int(off) for off in offset]
+
+    # New dimensions of the final image
+    ny = (img.shape[-2] - offset[0]) // dimensions[0]
+    nx = (img.shape[-1] - offset[1]) // dimensions[1]
+
+    # Splitting the axes of a slice of the array always gives a view
+    reshaped = img[..., offset[0]:offset[0] + ny * dimensions[0],
+                   offset[1]:offset[1] + nx * dimensions[1]]
+    reshaped = reshaped.reshape(img.shape[:-2] + (ny, dimensions[0], nx, dimensions[1]))
+
+    func = _one_pass_funcs.get(func, func)
+    if not isinstance(func, six.string_types):
+        return func(func(reshaped, axis=-1), axis=-2)
+    if func not in _superpixel_funcs:
+        raise ValueError("Unrecognized superpixel function {0}.".format(func))
+
+    reduction, masked_reduction = _superpixel_funcs[func]
+    if np.ma.isMaskedArray(img):
+        if func.startswith('nan'):
+            # Build a new mask so the mask of the input is left alone
+            reshaped = np.ma.array(reshaped.data, copy=False,
+                                   mask=np.ma.getmaskarray(reshaped) | ~np.isfinite(reshaped.data))
+        if masked_reduction is np.ma.median:
+            # Older versions of numpy.ma.median only take a single axis, so
+            # bring the elements of each superpixel together on the last axis
+            reshaped = reshaped.swapaxes(-3, -2).reshape(img.shape[:-2] + (ny, nx, -1))
+            return masked_reduction(reshaped, axis=-1)
+        return masked_reduction(reshaped, axis=(-3, -1))
+    return reduction(reshaped, axis=(-3, -1))
+
+
 class UnrecognizedInterpolationMethod(ValueError):
     """Unrecognized interpolation method specified."""
     pass
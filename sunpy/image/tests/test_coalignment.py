@@ -16,8 +16,8 @@ import sunpy.data.test
 from sunpy.image.coalignment import parabolic_turning_point, \
     repair_image_nonfinite, _default_fmap_function, _lower_clip, _upper_clip, \
     calculate_clipping, get_correlation_shifts, find_best_match_location, \
-    match_template_to_layer, clip_edges, \
-    calculate_match_template_shift, mapcube_coalign_by_match_template,\
+    match_template_to_layer, match_template_to_layers, fourier_shift_layers, \
+    clip_edges, calculate_match_template_shift, mapcube_coalign_by_match_template,\
     apply_shifts
 from sunpy.extern.six.moves import range
 
@@ -89,6 +89,24 @@ def test_match_template_to_layer(aia171_test_map_layer,
     assert_allclose(np.max(result), 1.00, rtol=1e-2, atol=0)
 
 
+def test_match_template_to_layers(aia171_test_map_layer,
+                                  aia171_test_template):
+    layers = np.stack([aia171_test_map_layer, aia171_test_map_layer[::-1, :]])
+    result = match_template_to_layers(layers, aia171_test_template)
+    for layer, layer_result in zip(layers, result):
+        assert_allclose(layer_result, match_template_to_layer(layer, aia171_test_template),
+                        rtol=0, atol=1e-8)
+
+
+def test_fourier_shift_layers(aia171_test_map_layer):
+    layers = np.stack([aia171_test_map_layer, aia171_test_map_layer])
+    # Integer shifts wrap around the edges of the layer
+    result = fourier_shift_layers(layers, [0, 3], [0, -5])
+    assert_allclose(result[0], aia171_test_map_layer, rtol=0, atol=1e-6)
+    assert_allclose(result[1], np.roll(aia171_test_map_layer, (3, -5), axis=(0, 1)),
+                    rtol=0, atol=1e-6)
+
+
 def test_get_correlation_shifts():
     # Input array is 3 by 3, the most common case
     test_array = np.zeros((3, 3))
@@ -211,6 +229,12 @@ def test_calculate_match_template_shift(aia171_test_mc,
     assert_allclose(test_displacements['x'], aia171_mc_arcsec_displacements['x'], rtol=5e-2, atol=0)
     assert_allclose(test_displacements['y'], aia171_mc_arcsec_displacements['y'], rtol=5e-2, atol=0)
 
+    # Test matching the template to all the layers at once
+    test_displacements = calculate_match_template_shift(aia171_test_mc, batch=True,
+                                                        chunk_size=1, max_workers=2)
+    assert_allclose(test_displacements['x'], aia171_mc_arcsec_displacements['x'], rtol=5e-2, atol=0)
+    assert_allclose(test_displacements['y'], aia171_mc_arcsec_displacements['y'], rtol=5e-2, atol=0)
+
     # Test setting the template as something other than a ndarray and a
     # GenericMap.  This should throw a ValueError.
     with pytest.raises(ValueError):
@@ -270,6 +294,33 @@ def test_mapcube_coalign_by_match_template(aia171_test_mc,
                             test_displacements[s][im] / m.scale[i_s],
                             rtol=5e-2, atol=0)
 
+
+def test_mapcube_coalign_by_match_template_batch(aia171_test_mc):
+    test_mc = mapcube_coalign_by_match_template(aia171_test_mc, clip=True)
+    batch_mc = mapcube_coalign_by_match_template(aia171_test_mc, clip=True, batch=True)
+    assert(isinstance(batch_mc, map.MapCube))
+    for im in range(len(test_mc)):
+        assert(batch_mc[im].data.shape == test_mc[im].data.shape)
+        for i_s in range(2):
+            assert_allclose(batch_mc[im].reference_pixel[i_s], test_mc[im].reference_pixel[i_s],
+                            rtol=1e-3, atol=0)
+
+
+def test_apply_shifts_batch_fallback(aia171_test_map):
+    # Without clipping, with keywords or with non-finite data the layers are
+    # shifted one at a time, as without batch.
+    data = aia171_test_map.data.astype(np.float32)
+    data[0, 0] = np.nan
+    mc = map.Map([map.Map(data, aia171_test_map.meta)] * 2, cube=True)
+    yshift, xshift = [0.0, -10.4] * u.pix, [0.0, -2.7] * u.pix
+    for kwargs in [{'clip': False}, {'order': 1}, {}]:
+        batch_mc = apply_shifts(mc, yshift, xshift, batch=True, **kwargs)
+        test_mc = apply_shifts(mc, yshift, xshift, **kwargs)
+        for im in range(len(test_mc)):
+            assert batch_mc[im].data.dtype == np.float32
+            assert_allclose(batch_mc[im].data, test_mc[im].data)
+
+
 def test_apply_shifts(aia171_test_map):
     # take two copies of the AIA image and create a test mapcube.
     mc = map.Map([aia171_test_map, aia171_test_map], cube=True)
@@ -2,7 +2,7 @@ from __future__ import absolute_import, division, print_function
 # Author: Tomas Meszaros <exo@tty.sk>
 
 import astropy.units as u
-from sunpy.image.rescale import reshape_image_to_4d_superpixel
+from sunpy.image.rescale import reshape_image_to_4d_superpixel, resample, superpixel
 import pytest
 import os
 import numpy as np
@@ -81,3 +81,67 @@ def test_reshape(aia171_test_map, shape):
     im = reshape_image_to_4d_superpixel(aia171_test_map.data, d, o)
     assert im.shape == (_n(shape[0], o[0], d[0]), d[0],
                         _n(shape[1], o[1], d[1]), d[1])
+
+def test_resample_area():
+    arr = np.random.RandomState(0).rand(60, 90)
+    # Integer factors average the blocks of the original array
+    resampled = resample(arr, (20, 30), method='area')
+    np.testing.assert_allclose(resampled, arr.reshape(20, 3, 30, 3).mean(axis=(1, 3)))
+    # Non-integer factors conserve the total flux
+    for dimensions in [(7, 11), (130, 200)]:
+        resampled = resample(arr, dimensions, method='area')
+        np.testing.assert_allclose(resampled.sum() * arr.size / resampled.size, arr.sum())
+
+@pytest.mark.parametrize('method', ['neighbor', 'nearest', 'linear', 'spline', 'area'])
+def test_resample_frames(method):
+    # Axes which keep their size are not resampled, so a stack of frames is
+    # resampled frame by frame
+    cube = np.random.RandomState(0).rand(3, 40, 30)
+    resampled = resample(cube, (3, 25, 45), method=method)
+    assert resampled.shape == (3, 25, 45)
+    for frame, resampled_frame in zip(cube, resampled):
+        np.testing.assert_allclose(resampled_frame, resample(frame, (25, 45), method=method))
+
+
+@pytest.mark.parametrize('func', ['sum', 'mean', 'max', 'min', 'median', 'nansum',
+                                  'nanmean', 'nanmax', 'nanmin', 'nanmedian'])
+def test_superpixel(func):
+    # The one pass reductions of a stack of images are the same as the
+    # reductions of each superpixel
+    cube = np.random.RandomState(0).rand(2, 20, 30)
+    cube[1, 3, 5] = np.nan
+    binned = superpixel(cube, (3, 4), (1, 2), func=func)
+    assert binned.shape == (2, 6, 7)
+    reduction = getattr(np, func)
+    for t, y, x in [(0, 0, 0), (1, 0, 0), (1, 5, 6)]:
+        block = cube[t, 1 + 3 * y:4 + 3 * y, 2 + 4 * x:6 + 4 * x]
+        np.testing.assert_allclose(binned[t, y, x], reduction(block))
+
+
+def test_superpixel_masked():
+    arr = np.ma.array(np.arange(24.).reshape(4, 6), mask=np.zeros((4, 6), dtype=bool))
+    arr.mask[0:2, 0:2] = True
+    arr.mask[2, 2] = True
+    binned = superpixel(arr, (2, 2), func='sum')
+    assert binned.mask[0, 0]
+    assert not binned.mask[1, 1]
+    assert binned[1, 1] == 15 + 20 + 21
+
+
+@pytest.mark.parametrize('func', ['median', 'nanmedian'])
+def test_superpixel_masked_median(func):
+    # The median of each superpixel leaves out the masked elements
+    cube = np.ma.array(np.random.RandomState(0).rand(2, 8, 9),
+                       mask=np.zeros((2, 8, 9), dtype=bool))
+    cube.mask[0, 0, 0:2] = True
+    cube.mask[1, 4:6, 3:6] = True
+    binned = superpixel(cube, (2, 3), func=func)
+    assert binned.shape == (2, 4, 3)
+    for t in range(2):
+        for y in range(4):
+            for x in range(3):
+                block = cube[t, 2 * y:2 * y + 2, 3 * x:3 * x + 3]
+                if block.mask.all():
+                    assert binned.mask[t, y, x]
+                else:
+                    np.testing.assert_allclose(binned[t, y, x], np.ma.median(block))
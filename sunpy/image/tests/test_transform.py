@@ -221,3 +221,34 @@ def test_int(identity):
     in_arr = np.array([[100]], dtype=int)
     out_arr = affine_transform(in_arr, rmatrix=identity)
     assert np.issubdtype(out_arr.dtype, np.float)
+
+
+@pytest.mark.parametrize("use_scipy, order", [(False, 1), (False, 4), (True, 3)])
+def test_output_shape(use_scipy, order):
+    # Test that a larger output shape gives the same image as padding the
+    # input, and that a smaller one crops it
+    angle = np.radians(30.0)
+    c = np.cos(angle); s = np.sin(angle)
+    rmatrix = np.array([[c, -s], [s, c]])
+    image = original[100:200, 150:230]
+    padded = np.pad(image, ((40, 40), (30, 30)), mode='constant', constant_values=-1.0)
+    expected = affine_transform(padded, rmatrix=rmatrix, order=order, missing=-1.0,
+                                use_scipy=use_scipy)[30:-30, 20:-20]
+    result = affine_transform(image, rmatrix=rmatrix, order=order, missing=-1.0,
+                              use_scipy=use_scipy, output_shape=(120, 100))
+    assert result.shape == (120, 100)
+    assert np.allclose(expected, result, atol=1e-3)
+
+
+@pytest.mark.parametrize("use_scipy", [False, True])
+def test_dtype_out(identity, use_scipy):
+    # Test that the transform can be done in the native float type and
+    # written into an output array
+    in_arr = original.astype(np.int16)
+    out_arr = affine_transform(in_arr, rmatrix=identity, dtype=None, use_scipy=use_scipy)
+    assert out_arr.dtype == np.float32
+    out = np.empty((400, 500), dtype=np.float32)
+    result = affine_transform(in_arr, rmatrix=identity, dtype=None, out=out,
+                              use_scipy=use_scipy)
+    assert result is out
+    assert np.allclose(out, in_arr[56:-56, 6:-6])
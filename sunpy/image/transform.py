@@ -20,7 +20,8 @@ __all__ = ['affine_transform']
 
 
 def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
-                     recenter=False, missing=0.0, use_scipy=False):
+                     recenter=False, missing=0.0, use_scipy=False, output_shape=None,
+                     dtype=np.float64, out=None):
     """
     Rotates, shifts and scales an image using :func:`skimage.transform.warp`,
     or :func:`scipy.ndimage.interpolation.affine_transform` if specified. Falls
@@ -54,6 +55,20 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
         Force use of :func:`scipy.ndimage.interpolation.affine_transform`.
         Will set all NaNs in image to zero before doing the transform.
         Default: False, unless scikit-image can't be imported
+    output_shape : tuple
+        The shape of the output image, centered on the center of the input
+        image. A larger shape holds the parts of the image which are moved
+        beyond the edges of the array, as if the input was padded with
+        ``missing``, and a smaller shape crops the output.
+        Default: the shape of the input image.
+    dtype : `numpy.dtype` or None
+        The floating point type the transformation is done in and returned
+        as. If None, float images keep their type and integer images use the
+        smallest float type that holds them, e.g. float32 for int16.
+        Default: float64
+    out : `numpy.ndarray`
+        An array of the output shape to write the output image into, which
+        is returned.
 
     Returns
     -------
@@ -72,8 +87,8 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
     replaced with zero prior to rotation.  No attempt is made to retain the NaN
     values.
 
-    Input arrays with integer data are cast to float64 and can be re-cast using
-    :func:`numpy.ndarray.astype` if desired.
+    Input arrays with integer data are cast to float64, or to ``dtype``, and
+    can be re-cast using :func:`numpy.ndarray.astype` if desired.
 
     Although this function is analogous to the IDL's rot() function, it does not
     use the same algorithm as the IDL rot() function.
@@ -84,8 +99,22 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
     algorithm to map the original to target pixel values.
     """
 
+    if out is not None:
+        output_shape = out.shape
+    rmatrix, shift = _affine_parameters(image.shape, rmatrix, scale, image_center, recenter,
+                                        output_shape=output_shape)
+    return _warp(image, rmatrix, shift, order=order, missing=missing, use_scipy=use_scipy,
+                 output_shape=output_shape, dtype=dtype, out=out)
+
+
+def _affine_parameters(shape, rmatrix, scale=1.0, image_center=None, recenter=False,
+                       output_shape=None):
+    """
+    The scaled rotation matrix and the shift of the transform done by
+    `affine_transform` on an image of this shape.
+    """
     rmatrix = rmatrix / scale
-    array_center = (np.array(image.shape)[::-1]-1)/2.0
+    array_center = (np.array(shape)[::-1]-1)/2.0
 
     # Make sure the image center is an array and is where it's supposed to be
     if image_center is not None:
@@ -102,33 +131,107 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
     displacement = np.dot(rmatrix, rot_center)
     shift = image_center - displacement
 
+    # Move the origin of the output so that it is centered on the input
+    if output_shape is not None:
+        offset = (np.array(output_shape)[::-1] - np.array(shape)[::-1]) / 2.0
+        shift = shift - np.dot(rmatrix, offset)
+    return rmatrix, shift
+
+
+def _margin(shape, output_shape, order=3, use_scipy=False):
+    """
+    The number of pixels of ``missing`` to pad an image of this shape with
+    before it is transformed to the output shape.
+
+    The fast scikit-image path for orders 1 and 3 interpolates between the
+    edge of the image and ``missing``, as if the image was padded with it. The
+    spline interpolations set any point beyond the edge to ``missing``, so the
+    image is padded with enough pixels for the spline prefilter to die away
+    well before the edge of the padding.
+    """
+    if output_shape is None or tuple(output_shape) == tuple(shape):
+        return 0
+    if not (use_scipy or scikit_image_not_found) and order in (1, 3):
+        return 0
+    return 16
+
+
+def _warp_coordinates(shape, output_shape, rmatrix, shift, order=3, use_scipy=False):
+    """
+    The input coordinates of every output pixel of the transform of an image
+    of this shape, for the interpolations that would otherwise compute them on
+    each call of `_warp`.
+
+    Returns None if the transform is done without a coordinate array, by
+    :func:`scipy.ndimage.interpolation.affine_transform` or by the fast
+    scikit-image path for orders 1 and 3.
+    """
+    if use_scipy or scikit_image_not_found or order in (1, 3):
+        return None
+    shift = shift + _margin(shape, output_shape, order, use_scipy)
+    return skimage.transform.warp_coords(_skimage_transform(rmatrix, shift), output_shape)
+
+
+def _skimage_transform(rmatrix, shift):
+    # Make the rotation matrix 3x3 to include translation of the image
+    skmatrix = np.zeros((3, 3))
+    skmatrix[:2, :2] = rmatrix
+    skmatrix[2, 2] = 1.0
+    skmatrix[:2, 2] = shift
+    return skimage.transform.AffineTransform(skmatrix)
+
+
+def _warp(image, rmatrix, shift, order=3, missing=0.0, use_scipy=False, coordinates=None,
+          output_shape=None, dtype=np.float64, out=None):
+    """
+    Transform an image with the parameters from `_affine_parameters`, using
+    the coordinates from `_warp_coordinates` if they are given.
+    """
+    if dtype is None:
+        dtype = np.result_type(image.dtype, np.float32)
+    dtype = np.dtype(dtype)
+    if output_shape is None:
+        output_shape = image.shape if out is None else out.shape
+    margin = _margin(image.shape, output_shape, order, use_scipy)
+    shift = shift + margin
+
     if use_scipy or scikit_image_not_found:
         if np.any(np.isnan(image)):
             warnings.warn("Setting NaNs to 0 for SciPy rotation", RuntimeWarning)
-        # Transform the image using the scipy affine transform
+        adjusted_image = np.nan_to_num(image)
+        if margin:
+            adjusted_image = np.pad(adjusted_image, margin, mode='constant',
+                                    constant_values=missing)
+        # Transform the image using the scipy affine transform, which writes
+        # straight into the output array if there is one
         rotated_image = scipy.ndimage.interpolation.affine_transform(
-                np.nan_to_num(image).T, rmatrix, offset=shift, order=order,
+                adjusted_image.T, rmatrix, offset=shift,
+                output_shape=tuple(output_shape)[::-1],
+                output=dtype if out is None else out.T, order=order,
                 mode='constant', cval=missing).T
-    else:
-        # Make the rotation matrix 3x3 to include translation of the image
-        skmatrix = np.zeros((3, 3))
-        skmatrix[:2, :2] = rmatrix
-        skmatrix[2, 2] = 1.0
-        skmatrix[:2, 2] = shift
-        tform = skimage.transform.AffineTransform(skmatrix)
-
-        # Transform the image using the skimage function
-        if not np.issubdtype(image.dtype, np.float64):
-            warnings.warn("Input data has been cast to float64", RuntimeWarning)
-            adjusted_image = image.astype(np.float64)
-        else:
-            adjusted_image = image.copy()
-        if np.any(np.isnan(adjusted_image)) and order >= 4:
-            warnings.warn("Setting NaNs to 0 for higher-order scikit-image rotation",
-                          RuntimeWarning)
-            adjusted_image = np.nan_to_num(adjusted_image)
-
-        rotated_image = skimage.transform.warp(adjusted_image, tform, order=order,
-                                               mode='constant', cval=missing)
-
-    return rotated_image
+        return rotated_image if out is None else out
+
+    if coordinates is None:
+        coordinates = _skimage_transform(rmatrix, shift)
+
+    # Transform the image using the skimage function. It does not change the
+    # input, so the image is only copied if it has to be cast.
+    if image.dtype.type is not dtype.type:
+        warnings.warn("Input data has been cast to {0}".format(dtype), RuntimeWarning)
+    adjusted_image = image.astype(dtype, copy=False)
+    if np.any(np.isnan(adjusted_image)) and order >= 4:
+        warnings.warn("Setting NaNs to 0 for higher-order scikit-image rotation",
+                      RuntimeWarning)
+        adjusted_image = np.nan_to_num(adjusted_image)
+    if margin:
+        adjusted_image = np.pad(adjusted_image, margin, mode='constant',
+                                constant_values=missing)
+
+    rotated_image = skimage.transform.warp(adjusted_image, coordinates, order=order,
+                                           output_shape=output_shape,
+                                           mode='constant', cval=missing)
+    if out is None:
+        # Older versions of skimage always return float64
+        return rotated_image.astype(dtype, copy=False)
+    out[...] = rotated_image
+    return out
@@ -5,19 +5,21 @@ Provides processing routines for data captured with the AIA instrument on SDO.
 import numpy as np
 import astropy.units as u
 
+from sunpy.map import MapCube
 from sunpy.map.sources.sdo import AIAMap
 
 __all__ = ['aiaprep']
 
 
-def aiaprep(aiamap):
+def aiaprep(aiamap, dtype=np.float64, max_workers=None):
     """
     Processes a level 1 `~sunpy.map.sources.sdo.AIAMap` into a level 1.5
     `~sunpy.map.sources.sdo.AIAMap`. Rotates, scales and
     translates the image so that solar North is aligned with the y axis, each
     pixel is 0.6 arcsec across, and the center of the sun is at the center of
     the image. The actual transformation is done by Map's
-    :meth:`~sunpy.map.mapbase.GenericMap.rotate` method.
+    :meth:`~sunpy.map.mapbase.GenericMap.rotate` method, or by
+    :meth:`~sunpy.map.MapCube.rotate` for a list of maps or a MapCube.
 
     This function is similar in functionality to aia_prep() in SSWIDL, but
     it does not use the same transformation to rotate the image and it handles
@@ -26,12 +28,21 @@ def aiaprep(aiamap):
 
     Parameters
     ----------
-    aiamap : `~sunpy.map.sources.sdo.AIAMap` instance
-        A `sunpy.map.Map` from AIA
+    aiamap : `~sunpy.map.sources.sdo.AIAMap` instance, list or `~sunpy.map.MapCube`
+        A `sunpy.map.Map` from AIA, or a list or MapCube of them.
+    dtype : `numpy.dtype` or None
+        The floating point type of the level 1.5 data. If None, the level 1
+        int16 data gives float32 data.
+        Default: float64
+    max_workers : int or None
+        If given, the maps of a list or MapCube are processed in a pool of
+        this many threads.
+        Default: None, process the maps one after the other.
 
     Returns
     -------
-    newmap : A level 1.5 copy of `~sunpy.map.sources.sdo.AIAMap`
+    newmap : A level 1.5 copy of `~sunpy.map.sources.sdo.AIAMap`, or a list or
+        MapCube of them in the same order as the input.
 
     Notes
     -----
@@ -40,25 +51,64 @@ def aiaprep(aiamap):
     formalism.
     The FITS header resulting in saving a file after this procedure will
     therefore differ from the original file.
+
+    The maps of a list or MapCube which have the same shape, pointing and
+    scale share the coordinates of the transform, which are only worked out
+    once.
     """
+    if isinstance(aiamap, (list, MapCube)):
+        maps = aiamap.maps if isinstance(aiamap, MapCube) else aiamap
+        for m in maps:
+            if not isinstance(m, AIAMap):
+                raise ValueError("Input must be an AIAMap")
+        cube = MapCube(maps, sortby=None)
+        tempmaps = cube.rotate(recenter=True,
+                               scale=[_scale_factor(m) for m in maps],
+                               missing=np.min,
+                               dtype=dtype, max_workers=max_workers)
+        newmaps = [_level_one_five(m, tempmap) for m, tempmap in zip(maps, tempmaps)]
+        if isinstance(aiamap, MapCube):
+            return MapCube(newmaps, sortby=None)
+        return newmaps
 
     if not isinstance(aiamap, AIAMap):
         raise ValueError("Input must be an AIAMap")
 
+    tempmap = aiamap.rotate(recenter=True, scale=_scale_factor(aiamap),
+                            missing=aiamap.min(), dtype=dtype)
+    return _level_one_five(aiamap, tempmap)
+
+
+def _shape(aiamap):
+    """
+    The shape of the data of ``aiamap``, without reading the data of a lazy map.
+    """
+    return tuple(int(n) for n in u.Quantity(aiamap.dimensions).value[::-1])
+
+
+def _scale_factor(aiamap):
+    """
+    The scale factor which takes an AIA map to 0.6 arcsec/pixel.
+    """
     # Target scale is 0.6 arcsec/pixel, but this needs to be adjusted if the map
     # has already been rescaled.
-    if (aiamap.scale[0] / 0.6).round() != 1.0 * u.arcsec and aiamap.data.shape != (4096, 4096):
+    if (aiamap.scale[0] / 0.6).round() != 1.0 * u.arcsec and _shape(aiamap) != (4096, 4096):
         scale = (aiamap.scale[0] / 0.6).round() * 0.6 * u.arcsec
     else:
         scale = 0.6 * u.arcsec  # pragma: no cover # can't test this because it needs a full res image
     scale_factor = aiamap.scale[0] / scale
+    return scale_factor.value
 
-    tempmap = aiamap.rotate(recenter=True, scale=scale_factor.value, missing=aiamap.min())
 
+def _level_one_five(aiamap, tempmap):
+    """
+    Crop the rotated ``tempmap`` of ``aiamap`` to the shape of ``aiamap``, and
+    update its meta data to level 1.5.
+    """
     # extract center from padded aiamap.rotate output
     # crpix1 and crpix2 will be equal (recenter=True), as aiaprep does not work with submaps
     center = np.floor(tempmap.meta['crpix1'])
-    range_side = (center + np.array([-1, 1]) * aiamap.data.shape[0] / 2) * u.pix
+    range_side = (center + np.array([-1, 1]) * _shape(aiamap)[0] / 2) * u.pix
     newmap = tempmap.submap(u.Quantity([range_side[0], range_side[0]]),
                             u.Quantity([range_side[1], range_side[1]]))
 
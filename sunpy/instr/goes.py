@@ -37,6 +37,10 @@ Meanwhile, the X-ray luminosity in the two GOES passbands can be obtained by
 `~sunpy.instr.goes.calculate_xray_luminosity`. To do so, this function calls
 `~sunpy.instr.goes._goes_lx` and `~sunpy.instr.goes.calc_xraylum`.
 
+All of the above can be found for many lightcurves at once with
+`~sunpy.instr.goes.calculate_goes_properties`. The look up tables are only
+read once per session in any case.
+
 References
 ----------
 
@@ -76,7 +80,8 @@ GOES_CONVERSION_DICT = {'X': u.Quantity(1e-4, "W/m^2"),
                         'A': u.Quantity(1e-8, "W/m^2")}
 
 __all__ = ['get_goes_event_list', 'calculate_temperature_em',
-           'calculate_radiative_loss_rate', 'calculate_xray_luminosity', 'flux_to_flareclass',
+           'calculate_radiative_loss_rate', 'calculate_xray_luminosity',
+           'calculate_goes_properties', 'flux_to_flareclass',
            'flareclass_to_flux']
 
 try:
@@ -94,6 +99,60 @@ FILE_EM_COR = "goes_chianti_em_cor.csv"
 FILE_EM_PHO = "goes_chianti_em_pho.csv"
 FILE_RAD_COR = "chianti7p1_rad_loss.txt"
 
+# Splines fitted to the CHIANTI model tables, by file path and column, along
+# with the modification time of the file they were read from.
+_chianti_splines = {}
+
+
+def _get_chianti_spline(path, label, read_table):
+    """
+    Returns the spline fitted to a CHIANTI model table, only reading and
+    fitting the table again if the file has changed since it was last used.
+
+    Parameters
+    ----------
+    path : `str`
+        Path of the file containing the model table.
+
+    label : `str`
+        Name of the column of the table the spline is fitted to.
+
+    read_table : function
+        Called without arguments to read the model table as two arrays, the
+        x and y values of the spline.
+
+    Returns
+    -------
+    xmin, xmax : `float`
+        Range of x values covered by the model table.
+
+    spline : `tuple`
+        The spline, as returned by `scipy.interpolate.splrep`.
+    """
+    mtime = os.path.getmtime(path)
+    cached = _chianti_splines.get((path, label))
+    if cached is None or cached[0] != mtime:
+        x, y = read_table()
+        cached = (mtime, (np.min(x), np.max(x),
+                          interpolate.splrep(x, y, s=0)))
+        _chianti_splines[(path, label)] = cached
+    return cached[1]
+
+
+def _read_goes_chianti_csv(path, label):
+    """
+    Reads the log10 temperature and label columns of a GOES CHIANTI csv file.
+    """
+    modeltemp = []  # modelled temperature is in log_10 space in units of MK
+    modelvalue = []
+    with open(path, "r") as csvfile:
+        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
+        csvreader = csv.DictReader(startline, delimiter=";")
+        for row in csvreader:
+            modeltemp.append(float(row["log10temp_MK"]))
+            modelvalue.append(float(row[label]))
+    return np.asarray(modeltemp), np.asarray(modelvalue)
+
 
 def get_goes_event_list(timerange, goes_class_filter=None):
     """
@@ -534,35 +593,28 @@ def _goes_get_chianti_temp(fluxratio, satellite=8, abundances="coronal",
         raise ValueError("abundances must be a string equalling "
                          "'coronal' or 'photospheric'.")
 
-    # Initialize lists to hold model data of flux ratio - temperature
-    # relationship read in from csv file
-    modeltemp = []  # modelled temperature is in log_10 space in units of MK
-    modelratio = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = "ratioGOES{0}".format(satellite)
+    path = os.path.join(download_dir, data_file)
+
     # Read data representing appropriate temperature--flux ratio
-    # relationship depending on satellite number and assumed abundances.
-    with open(os.path.join(get_and_create_download_dir(), data_file), "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelratio.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelratio = np.asarray(modelratio)
+    # relationship depending on satellite number and assumed abundances,
+    # and perform spline fit to it.  Both are done once per table.
+    def read_table():
+        modeltemp, modelratio = _read_goes_chianti_csv(path, label)
+        return modelratio, modeltemp
+    ratio_min, ratio_max, spline = _get_chianti_spline(path, label,
+                                                       read_table)
 
     # Ensure input values of flux ratio are within limits of model table
-    if np.min(fluxratio) < np.min(modelratio) or \
-       np.max(fluxratio) > np.max(modelratio):
+    if np.min(fluxratio) < ratio_min or np.max(fluxratio) > ratio_max:
         raise ValueError(
             "For GOES {0}, all values in fluxratio input must be within " +
-            "the range {1} - {2}.".format(satellite, np.min(modelratio),
-                                          np.max(modelratio)))
+            "the range {1} - {2}.".format(satellite, ratio_min, ratio_max))
 
-    # Perform spline fit to model data to get temperatures for input
+    # Use spline fit to model data to get temperatures for input
     # values of flux ratio
-    spline = interpolate.splrep(modelratio, modeltemp, s=0)
     temp = 10.**interpolate.splev(fluxratio.value, spline, der=0)
     temp = u.Quantity(temp, unit='MK')
 
@@ -696,35 +748,25 @@ def _goes_get_chianti_em(longflux, temp, satellite=8, abundances="coronal",
         raise ValueError("longflux and temp must have same number of "
                          "elements.")
 
-    # Initialize lists to hold model data of temperature - long channel
-    # flux relationship read in from csv file.
-    modeltemp = []   # modelled temperature is in log_10 space in units of MK
-    modelflux = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = "longfluxGOES{0}".format(satellite)
+    path = os.path.join(download_dir, data_file)
 
     # Read data representing appropriate temperature--long flux
-    # relationship depending on satellite number and assumed abundances.
-    with open(os.path.join(get_and_create_download_dir(), data_file), "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelflux.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelflux = np.asarray(modelflux)
+    # relationship depending on satellite number and assumed abundances,
+    # and perform spline fit to it.  Both are done once per table.
+    temp_min, temp_max, spline = _get_chianti_spline(
+        path, label, lambda: _read_goes_chianti_csv(path, label))
 
     # Ensure input values of flux ratio are within limits of model table
-    if np.min(log10_temp) < np.min(modeltemp) or \
-       np.max(log10_temp) > np.max(modeltemp) or \
+    if np.min(log10_temp) < temp_min or \
+       np.max(log10_temp) > temp_max or \
        np.isnan(np.min(log10_temp)):
         raise ValueError("All values in temp must be within the range "
-                         "{0} - {1} MK.".format(np.min(10**modeltemp),
-                                                np.max(10**modeltemp)))
+                         "{0} - {1} MK.".format(10**temp_min, 10**temp_max))
 
-    # Perform spline fit to model data
-    spline = interpolate.splrep(modeltemp, modelflux, s=0)
+    # Use spline fit to model data
     denom = interpolate.splev(log10_temp, spline, der=0)
     em = longflux.value/denom * 1e55
     em = u.Quantity(em, unit='cm**(-3)')
@@ -949,31 +991,28 @@ def _calc_rad_loss(temp, em, obstime=None, force_download=False,
     check_download_file(FILE_RAD_COR, GOES_REMOTE_PATH, download_dir,
                         replace=force_download)
 
-    # Initialize lists to hold model data of temperature - rad loss rate
-    # relationship read in from csv file
-    modeltemp = []    # modelled temperature is in log_10 space in units of MK
-    model_loss_rate = []
-
-    # Read data from csv file into lists, being sure to skip commented
-    # lines beginning with "#"
-    with open(os.path.join(get_and_create_download_dir(), FILE_RAD_COR),
-              "r") as csvfile:
-        startline = csvfile.readlines()[7:]
-        csvreader = csv.reader(startline, delimiter=" ")
-        for row in csvreader:
-            modeltemp.append(float(row[0]))
-            model_loss_rate.append(float(row[1]))
-    modeltemp = np.asarray(modeltemp)
-    model_loss_rate = np.asarray(model_loss_rate)
+    # Read data from csv file, being sure to skip commented lines, and
+    # perform spline fit to it.  Both are done once per table.
+    path = os.path.join(download_dir, FILE_RAD_COR)
+
+    def read_table():
+        modeltemp = []   # modelled temperature is in units of K
+        model_loss_rate = []
+        with open(path, "r") as csvfile:
+            startline = csvfile.readlines()[7:]
+            csvreader = csv.reader(startline, delimiter=" ")
+            for row in csvreader:
+                modeltemp.append(float(row[0]))
+                model_loss_rate.append(float(row[1]))
+        return np.asarray(modeltemp), np.asarray(model_loss_rate)
+    temp_min, temp_max, spline = _get_chianti_spline(path, "rad_loss",
+                                                     read_table)
     # Ensure input values of flux ratio are within limits of model table
-    if temp.value.min() < modeltemp.min() or \
-    temp.value.max() > modeltemp.max():
+    if temp.value.min() < temp_min or temp.value.max() > temp_max:
         raise ValueError("All values in temp must be within the range " +
-                         "{0} - {1} MK.".format(np.min(modeltemp/1e6),
-                                                np.max(modeltemp/1e6)))
-    # Perform spline fit to model data to get temperatures for input
-    # values of flux ratio
-    spline = interpolate.splrep(modeltemp, model_loss_rate, s=0)
+                         "{0} - {1} MK.".format(temp_min/1e6, temp_max/1e6))
+    # Use spline fit to model data to get radiative loss rates for input
+    # values of temperature
     rad_loss = em.value * interpolate.splev(temp.value, spline, der=0)
     rad_loss = u.Quantity(rad_loss, unit='erg/s')
     rad_loss = rad_loss.to(u.J/u.s)
@@ -1092,6 +1131,134 @@ def calculate_xray_luminosity(goeslc):
     return lc_new
 
 
+def calculate_goes_properties(goeslcs, abundances="coronal", download=False,
+                              download_dir=None):
+    """
+    Calculates the thermodynamic properties of the plasma observed in many
+    GOESLightCurves at once.
+
+    This function finds the same temperature, emission measure, radiative
+    loss rate and X-ray luminosities as `~calculate_temperature_em`,
+    `~calculate_radiative_loss_rate` and `~calculate_xray_luminosity`.
+    However, the fluxes of all lightcurves observed by the same satellite are
+    converted to temperatures and emission measures in a single pass, and the
+    radiative loss rates of all lightcurves are found in another, so that
+    long runs of GOES data are processed without calling the above functions
+    on each lightcurve.
+
+    Parameters
+    ----------
+    goeslcs : iterable of `~sunpy.lightcurve.GOESLightCurve`
+        LightCurve objects containing GOES flux data which MUST be in units of
+        W/m^2.
+
+    abundances : (optional) string equalling 'coronal' or 'photospheric'
+        States whether photospheric or coronal abundances should be
+        assumed.
+        Default='coronal'
+
+    download : (optional) `bool`
+        If True, the GOES temperature, emission measure and radiative loss
+        data files are downloaded.  See `~calculate_temperature_em`.
+        Default=False
+
+    download_dir : (optional) `string`
+        The directory to download the GOES data files to.
+        Default=SunPy default download directory
+
+    Returns
+    -------
+    lcs_new : `list` of `~sunpy.lightcurve.LightCurve`
+        For each input lightcurve, one containing its metadata and data with
+        the following additional data columns:
+
+        | lc_new.data.temperature - Array of temperatures [MK]
+        | lc_new.data.em - Array of volume emission measures [cm**-3]
+        | lc_new.data.rad_loss_rate - radiative loss rate of the coronal soft
+          X-ray-emitting plasma across all wavelengths [W]
+        | lc_new.data.luminosity_xrsa - Xray luminosity in 0.5-4A channel [W]
+        | lc_new.data.luminosity_xrsb - Xray luminosity in 1-8A channel [W]
+
+    Examples
+    --------
+    >>> from sunpy.instr.goes import calculate_goes_properties
+    >>> import sunpy.lightcurve as lc
+    >>> goeslcs = [lc.GOESLightCurve.create("2014-01-01 00:00", "2014-01-01 01:00"),
+    ...            lc.GOESLightCurve.create("2014-01-02 00:00", "2014-01-02 01:00")]  # doctest: +REMOTE_DATA
+    >>> goeslcs_new = calculate_goes_properties(goeslcs)  # doctest: +REMOTE_DATA
+
+    """
+    if not download_dir:
+        download_dir = get_and_create_download_dir()
+    goeslcs = list(goeslcs)
+    # Check that input arguments are of correct type
+    if not all(isinstance(goeslc, lightcurve.GOESLightCurve)
+               for goeslc in goeslcs):
+        raise TypeError("goeslcs must contain GOESLightCurve objects.")
+    if not goeslcs:
+        return []
+
+    # Group the lightcurves which need the same preparation of their fluxes,
+    # i.e. those from the same satellite, and for GOES 6 those from before or
+    # after the correction of its long channel on 1983-Jun-28.
+    groups = {}
+    for i, goeslc in enumerate(goeslcs):
+        satellite = int(goeslc.meta["TELESCOP"].split()[1])
+        date = parse_time(goeslc.data.index[0])
+        key = (satellite, date < datetime.datetime(1983, 6, 28))
+        groups.setdefault(key, (date, []))[1].append(i)
+
+    # Find temperature and emission measure with _goes_chianti_tem, once
+    # for each group.
+    temps = [None] * len(goeslcs)
+    ems = [None] * len(goeslcs)
+    for (satellite, _), (date, indices) in groups.items():
+        lengths = [len(goeslcs[i].data) for i in indices]
+        temp, em = _goes_chianti_tem(
+            u.Quantity(np.concatenate([goeslcs[i].data.xrsb for i in indices]),
+                       unit=u.W/(u.m)**2),
+            u.Quantity(np.concatenate([goeslcs[i].data.xrsa for i in indices]),
+                       unit=u.W/(u.m)**2),
+            satellite=satellite, date=date, abundances=abundances,
+            download=download, download_dir=download_dir)
+        # The data files only need to be downloaded once.
+        download = False
+        splits = np.cumsum(lengths)[:-1]
+        for i, temp_i, em_i in zip(indices, np.split(temp, splits),
+                                   np.split(em, splits)):
+            temps[i] = temp_i
+            ems[i] = em_i
+
+    # Find radiative loss rate of all lightcurves with _calc_rad_loss().
+    lengths = [len(goeslc.data) for goeslc in goeslcs]
+    rad_loss = _calc_rad_loss(
+        u.Quantity(np.concatenate([temp.to_value(u.MK) for temp in temps]), unit=u.MK),
+        u.Quantity(np.concatenate([em.to_value(u.cm**-3) for em in ems]), unit=u.cm**-3),
+        force_download=download, download_dir=download_dir)
+    rad_losses = np.split(rad_loss["rad_loss_rate"].to("W").value,
+                          np.cumsum(lengths)[:-1])
+
+    lcs_new = []
+    for goeslc, temp, em, rad_loss in zip(goeslcs, temps, ems, rad_losses):
+        # Find X-ray luminosities with _goes_lx.
+        lx_out = _goes_lx(u.Quantity(goeslc.data.xrsb, unit="W/m**2"),
+                          u.Quantity(goeslc.data.xrsa, unit="W/m**2"),
+                          date=str(goeslc.data.index[0]))
+        # Enter results into new version of GOES LightCurve Object
+        # Use copy.deepcopy for replicating meta and data so that input
+        # lightcurve is not altered.
+        lc_new = lightcurve.LightCurve(meta=copy.deepcopy(goeslc.meta),
+                                       data=copy.deepcopy(goeslc.data))
+        lc_new.data["temperature"] = temp.value
+        lc_new.data["em"] = em.value
+        lc_new.data["rad_loss_rate"] = rad_loss
+        lc_new.data["luminosity_xrsa"] = lx_out["shortlum"].to("W").value
+        lc_new.data["luminosity_xrsb"] = lx_out["longlum"].to("W").value
+        lcs_new.append(lc_new)
+
+    return lcs_new
+
+
 def _goes_lx(longflux, shortflux, obstime=None, date=None):
     """
     Calculates solar X-ray luminosity in GOES wavelength ranges.
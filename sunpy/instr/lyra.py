@@ -16,10 +16,19 @@ from sunpy.util.net import check_download_file
 from sunpy.util.config import get_and_create_download_dir
 from sunpy.util.decorators import deprecated
 
+from sunpy.extern import six
 from sunpy.extern.six.moves import urllib
 
 LYTAF_REMOTE_PATH = "http://proba2.oma.be/lyra/data/lytaf/"
 
+# Fields of the numpy record arrays holding LYTAF events.
+LYTAF_DTYPE = np.dtype([("insertion_time", object),
+                        ("begin_time", object),
+                        ("reference_time", object),
+                        ("end_time", object),
+                        ("event_type", object),
+                        ("event_definition", object)])
+
 
 __all__ = ['remove_lytaf_events_from_lightcurve',
            'remove_lytaf_events_from_timeseries',
@@ -266,8 +275,8 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
             print(all_lytaf_event_types)
             raise ValueError("{0} is not a valid artifact type. See above.".format(artifact))
     # Define outputs
-    clean_time = np.array([parse_time(t) for t in time])
-    clean_channels = copy.deepcopy(channels)
+    clean_time = _to_datetime64(time)
+    clean_channels = channels
     artifacts_not_found = []
     # Get LYTAF file for given time range
     lytaf = get_lytaf_events(time[0], time[-1], lytaf_path=lytaf_path,
@@ -292,19 +301,17 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
     if not len(artifact_indices):
         warn("None of user supplied artifacts were found.")
         artifacts_not_found = artifacts
+        clean_channels = copy.deepcopy(channels)
     else:
         # Remove periods corresponding to artifacts from flux and time
         # arrays.
-        bad_indices = np.empty(0, dtype="int64")
-        all_indices = np.arange(len(time))
-        for index in artifact_indices:
-            bad_period = np.logical_and(time >= lytaf["begin_time"][index],
-                                        time <= lytaf["end_time"][index])
-            bad_indices = np.append(bad_indices, all_indices[bad_period])
-        clean_time = np.delete(clean_time, bad_indices)
+        good = ~_in_intervals(clean_time,
+                              lytaf["begin_time"][artifact_indices],
+                              lytaf["end_time"][artifact_indices])
+        clean_time = clean_time[good]
         if channels:
-            for i, f in enumerate(clean_channels):
-                clean_channels[i] = np.delete(f, bad_indices)
+            clean_channels = [np.asarray(f)[good] for f in channels]
+    clean_time = clean_time.astype(datetime.datetime)
     # If return_artifacts kwarg is True, return a list containing
     # information on what artifacts found, removed, etc.  See docstring.
     if return_artifacts:
@@ -345,15 +352,7 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
             # Write header.
             csvwriter.writerow(filecolumns)
             # Write data.
-            if not channels:
-                for i in range(len(time)):
-                    csvwriter.writerow(string_time[i])
-            else:
-                for i in range(len(time)):
-                    row = [string_time[i]]
-                    for f in channels:
-                        row.append(f[i])
-                    csvwriter.writerow(row)
+            csvwriter.writerows(zip(string_time, *(channels or [])))
     # Return values.
     if return_artifacts:
         if not channels:
@@ -452,80 +451,27 @@ def get_lytaf_events(start_time, end_time, lytaf_path=None,
     start_time_uts = (start_time - datetime.datetime(1970, 1, 1)).total_seconds()
     end_time_uts = (end_time - datetime.datetime(1970, 1, 1)).total_seconds()
 
-    # Define numpy record array which will hold the information from
-    # the annotation file.
-    lytaf = np.empty((0,), dtype=[("insertion_time", object),
-                                  ("begin_time", object),
-                                  ("reference_time", object),
-                                  ("end_time", object),
-                                  ("event_type", object),
-                                  ("event_definition", object)])
     # Access annotation files
+    lytafs = []
     for suffix in combine_files:
         # Check database files are present
         dbname = "annotation_{0}.db".format(suffix)
         check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path)
-        # Open SQLITE3 annotation files
-        connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
-        # Check if lytaf file spans the start and end times defined by
-        # user.  If not, download newest version.
-        # First get start time of first event and end time of last
-        # event in lytaf.
-        cursor.execute("select begin_time from event order by begin_time asc "
-                       "limit 1;")
-        db_first_begin_time = cursor.fetchone()[0]
-        db_first_begin_time = datetime.datetime.fromtimestamp(db_first_begin_time)
-        cursor.execute("select end_time from event order by end_time desc "
-                       "limit 1;")
-        db_last_end_time = cursor.fetchone()[0]
-        db_last_end_time = datetime.datetime.fromtimestamp(db_last_end_time)
+        database = _get_lytaf_database(os.path.join(lytaf_path, dbname))
         # If lytaf does not include entire input time range...
-        if not force_use_local_lytaf:
-            if end_time > db_last_end_time or start_time < db_first_begin_time:
-                # ...close lytaf file...
-                cursor.close()
-                connection.close()
-                # ...Download latest lytaf file...
-                check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path,
-                                    replace=True)
-                # ...and open new version of lytaf database.
-                connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-                cursor = connection.cursor()
-        # Select and extract the data from event table within file within
-        # given time range
-        cursor.execute("select insertion_time, begin_time, reference_time, "
-                       "end_time, eventType_id from event where end_time >= "
-                       "{0} and begin_time <= "
-                       "{1}".format(start_time_uts, end_time_uts))
-        event_rows = cursor.fetchall()
-        # Select and extract the event types from eventType table
-        cursor.row_factory = sqlite3.Row
-        cursor.execute("select * from eventType")
-        eventType_rows = cursor.fetchall()
-        eventType_id = []
-        eventType_type = []
-        eventType_definition = []
-        for eventType_row in eventType_rows:
-            eventType_id.append(eventType_row["id"])
-            eventType_type.append(eventType_row["type"])
-            eventType_definition.append(eventType_row["definition"])
-        # Enter desired information into the lytaf numpy record array
-        for event_row in event_rows:
-            id_index = eventType_id.index(event_row[4])
-            lytaf = np.append(lytaf,
-                              np.array((datetime.datetime.utcfromtimestamp(event_row[0]),
-                                        datetime.datetime.utcfromtimestamp(event_row[1]),
-                                        datetime.datetime.utcfromtimestamp(event_row[2]),
-                                        datetime.datetime.utcfromtimestamp(event_row[3]),
-                                        eventType_type[id_index],
-                                        eventType_definition[id_index]), dtype=lytaf.dtype))
-        # Close file
-        cursor.close()
-        connection.close()
+        if not force_use_local_lytaf and not database.covers(start_time,
+                                                             end_time):
+            # ...download latest lytaf file, which is read in again
+            # as it has changed on disk.
+            check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path,
+                                replace=True)
+            database = _get_lytaf_database(os.path.join(lytaf_path, dbname))
+        # Select the events from the file within given time range
+        lytafs.append(database.events(start_time_uts, end_time_uts))
+    lytaf = np.concatenate([np.empty((0,), dtype=LYTAF_DTYPE)] + lytafs)
     # Sort lytaf in ascending order of begin time
-    np.recarray.sort(lytaf, order="begin_time")
+    lytaf = lytaf[np.argsort(lytaf["begin_time"].astype("M8[us]"),
+                             kind="mergesort")]
 
     # If csvfile kwarg is set, write out lytaf to csv file
     if csvfile:
@@ -535,15 +481,10 @@ def get_lytaf_events(start_time, end_time, lytaf_path=None,
             # Write header.
             csvwriter.writerow(lytaf.dtype.names)
             # Write data.
-            for row in lytaf:
-                new_row = []
-                new_row.append(row[0].strftime("%Y-%m-%dT%H:%M:%S"))
-                new_row.append(row[1].strftime("%Y-%m-%dT%H:%M:%S"))
-                new_row.append(row[2].strftime("%Y-%m-%dT%H:%M:%S"))
-                new_row.append(row[3].strftime("%Y-%m-%dT%H:%M:%S"))
-                new_row.append(row[4])
-                new_row.append(row[5])
-                csvwriter.writerow(new_row)
+            times = [np.datetime_as_string(lytaf[name].astype("M8[s]"))
+                     for name in LYTAF_DTYPE.names[:4]]
+            csvwriter.writerows(zip(*(times + [lytaf["event_type"],
+                                              lytaf["event_definition"]])))
 
     return lytaf
 
@@ -578,22 +519,15 @@ def get_lytaf_event_types(lytaf_path=None, print_event_types=True):
         dbname = "annotation_{0}.db".format(suffix)
         # Check database file exists, else download it.
         check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path)
-        # Open SQLITE3 LYTAF files
-        connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
-        cursor.execute("select type from eventType;")
-        event_types = cursor.fetchall()
-        all_event_types.append(event_types)
+        event_types = _get_lytaf_database(
+            os.path.join(lytaf_path, dbname)).event_types
+        all_event_types.extend(event_types)
         if print_event_types:
             print("----------------\n{0} database\n----------------"
                   .format(suffix))
             for event_type in event_types:
-                print(str(event_type[0]))
+                print(str(event_type))
             print(" ")
-    # Unpack event types in all_event_types into single list
-    all_event_types = [event_type[0] for event_types in all_event_types
-                       for event_type in event_types]
     return all_event_types
 
 
@@ -626,27 +560,14 @@ def split_series_using_lytaf(timearray, data, lytaf):
         Each dictionary contains a sub-series corresponding to an interval of
         'good data'.
     """
-    n = len(timearray)
-    mask = np.ones(n)
-    el = len(lytaf)
-
     # make the input time array a list of datetime objects
-    datetime_array = []
-    for tim in timearray:
-        datetime_array.append(parse_time(tim))
-
-    # scan through each entry retrieved from the LYTAF database
-    for j in range(0, el):
-        # want to mark all times with events as bad in the mask, i.e. = 0
-        start_dt = lytaf['begin_time'][j]
-        end_dt = lytaf['end_time'][j]
-
-        # find the start and end indices for each event
-        start_ind = np.searchsorted(datetime_array, start_dt)
-        end_ind = np.searchsorted(datetime_array, end_dt)
+    times = _to_datetime64(timearray)
+    datetime_array = list(times.astype(datetime.datetime))
 
-        # append the mask to mark event as 'bad'
-        mask[start_ind:end_ind] = 0
+    # want to mark all times with events as bad in the mask, i.e. = 0
+    mask = np.ones(len(times))
+    mask[_in_intervals(times, lytaf['begin_time'], lytaf['end_time'],
+                       closed=False)] = 0
 
     diffmask = np.diff(mask)
     tmp_discontinuity = np.where(diffmask != 0.)
@@ -738,7 +659,7 @@ def _prep_columns(time, channels=None, filecolumns=None):
 
     """
     # Convert time which contains datetime objects to time strings.
-    string_time = np.array([t.strftime("%Y-%m-%dT%H:%M:%S.%f") for t in time])
+    string_time = np.datetime_as_string(_to_datetime64(time), unit="us")
     # If filenames is given...
     if filecolumns:
         # ...check all the elements are strings...
@@ -767,3 +688,154 @@ def _prep_columns(time, channels=None, filecolumns=None):
             filecolumns = ["time"]
 
     return string_time, filecolumns
+
+
+def _to_datetime64(times):
+    """
+    Converts an array of times understood by `sunpy.time.parse_time` to
+    `numpy.datetime64`, only parsing the elements one by one if they are
+    neither datetimes nor strings of a single format.
+    """
+    times = np.asarray(times)
+    if times.dtype.kind == "M":
+        return times.astype("M8[us]")
+    try:
+        if times.dtype.kind in "US" or (
+                times.dtype.kind == "O" and times.size and
+                isinstance(times.flat[0], six.string_types)):
+            times = np.asarray(parse_time(times))
+        return times.astype("M8[us]")
+    except (TypeError, ValueError):
+        return np.array([parse_time(t) for t in times], dtype="M8[us]")
+
+
+def _in_intervals(times, begin_times, end_times, closed=True):
+    """
+    Finds which of the times fall within any of the time intervals.
+
+    The interval bounds are looked up in the sorted times with
+    `numpy.searchsorted`, and the intervals covering each time are counted
+    with a cumulative sum, rather than comparing each interval with all of the
+    times.
+
+    Parameters
+    ----------
+    times : `numpy.ndarray` of `numpy.datetime64`
+        The times to check.
+
+    begin_times, end_times : `numpy.ndarray` of `datetime.datetime`
+        The start and end of each interval.
+
+    closed : `bool`
+        If True, the intervals include their end time.
+
+    Returns
+    -------
+    inside : `numpy.ndarray` of `bool`
+        True for each time within at least one interval.
+    """
+    order = None
+    if np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="mergesort")
+        times = times[order]
+    first = np.searchsorted(times, _to_datetime64(begin_times), "left")
+    last = np.searchsorted(times, _to_datetime64(end_times),
+                           "right" if closed else "left")
+    valid = first < last
+    counts = np.zeros(len(times) + 1, dtype="int64")
+    np.add.at(counts, first[valid], 1)
+    np.add.at(counts, last[valid], -1)
+    inside = np.cumsum(counts[:-1]) > 0
+    if order is not None:
+        unsorted = np.empty_like(inside)
+        unsorted[order] = inside
+        inside = unsorted
+    return inside
+
+
+def _utc_datetimes(timestamps):
+    """Converts an array of UNIX timestamps to `datetime.datetime` objects."""
+    microseconds = np.round(np.asarray(timestamps) * 1e6).astype("int64")
+    return microseconds.astype("M8[us]").astype(datetime.datetime)
+
+
+class _LytafDatabase(object):
+    """
+    The events of one LYTAF annotation file, read in once and held sorted by
+    begin time, so that the events within a time range are found by a binary
+    search rather than a query of the SQLite file.
+
+    Parameters
+    ----------
+    path : `str`
+        The path of the annotation file.
+    """
+    def __init__(self, path):
+        connection = sqlite3.connect(path)
+        try:
+            cursor = connection.cursor()
+            cursor.execute("select insertion_time, begin_time, reference_time, "
+                           "end_time, eventType_id from event "
+                           "order by begin_time;")
+            events = np.array(cursor.fetchall(), dtype="float64").reshape(-1, 5)
+            cursor.execute("select id, type, definition from eventType;")
+            event_types = cursor.fetchall()
+        finally:
+            connection.close()
+        self.event_types = [event_type[1] for event_type in event_types]
+        (self.insertion_time, self.begin_time, self.reference_time,
+         self.end_time) = events[:, :4].T
+        # Look up the type and definition of each event from its type id.
+        type_ids = np.array([event_type[0] for event_type in event_types])
+        names = np.empty(len(event_types), dtype=object)
+        names[:] = self.event_types
+        definitions = np.empty(len(event_types), dtype=object)
+        definitions[:] = [event_type[2] for event_type in event_types]
+        sorter = np.argsort(type_ids)
+        index = sorter[np.searchsorted(type_ids, events[:, 4], sorter=sorter)]
+        self.event_type = names[index]
+        self.event_definition = definitions[index]
+
+    def covers(self, start_time, end_time):
+        """
+        Whether the events in the file span the time range from start_time to
+        end_time.
+        """
+        if not len(self.begin_time):
+            return False
+        first_begin_time = datetime.datetime.fromtimestamp(self.begin_time[0])
+        last_end_time = datetime.datetime.fromtimestamp(self.end_time.max())
+        return start_time >= first_begin_time and end_time <= last_end_time
+
+    def events(self, start_time_uts, end_time_uts):
+        """
+        The events overlapping the time range given as UNIX timestamps, as a
+        record array with fields `LYTAF_DTYPE`.
+        """
+        stop = np.searchsorted(self.begin_time, end_time_uts, "right")
+        index = np.flatnonzero(self.end_time[:stop] >= start_time_uts)
+        lytaf = np.empty((len(index),), dtype=LYTAF_DTYPE)
+        for name in LYTAF_DTYPE.names:
+            column = getattr(self, name)[index]
+            if name.endswith("_time"):
+                column = _utc_datetimes(column)
+            lytaf[name] = column
+        return lytaf
+
+
+# Annotation files already read in, by path, along with the modification time
+# and size of the file they were read from.
+_lytaf_databases = {}
+
+
+def _get_lytaf_database(path):
+    """
+    Returns the `_LytafDatabase` of the annotation file at path, only reading
+    the file again if it changed since it was last read.
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime, stat.st_size)
+    cached = _lytaf_databases.get(path)
+    if cached is None or cached[0] != version:
+        cached = _lytaf_databases[path] = (version, _LytafDatabase(path))
+    return cached[1]
@@ -13,6 +13,7 @@ import re
 import socket
 import warnings
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from dateutil.relativedelta import relativedelta
@@ -25,6 +26,7 @@ from sunpy.coordinates import get_sunearth_distance
 import sunpy.map
 import sunpy.io
 
+from sunpy.extern import six
 from sunpy.extern.six.moves import urllib
 from sunpy.extern.six.moves.urllib.request import urlopen, urlretrieve
 from sunpy.extern.six.moves.urllib.error import URLError
@@ -395,7 +397,7 @@ def hsi_linecolors():
 
 
 def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
-                 image_dim=(64, 64)):
+                 image_dim=(64, 64), chunk_size=1024):
     """
     Given a stacked calibrated event list fits file create a back
     projection image for an individual detectors. This function is used by
@@ -403,14 +405,18 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
 
     Parameters
     ----------
-    calibrated_event_list : string
-        filename of a RHESSI calibrated event list
+    calibrated_event_list : string or list
+        filename of a RHESSI calibrated event list, or the list of
+        (data, header) pairs already read from it by `sunpy.io.read_file`
     detector : int
         the detector number
     pixel_size : 2-tuple
         the size of the pixels in arcseconds. Default is (1,1).
     image_dim : 2-tuple
         the size of the output image in number of pixels
+    chunk_size : int
+        the number of events to process at once. Memory use grows with
+        chunk_size times the sum of the image dimensions.
 
     Returns
     -------
@@ -425,37 +431,61 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
     # info_parameters = fits[2]
     # detector_efficiency = info_parameters.data.field('cbe_det_eff$$REL')
 
-    afits = sunpy.io.read_file(calibrated_event_list)
+    afits = _read_calibrated_event_list(calibrated_event_list)
 
     fits_detector_index = detector + 2
     detector_index = detector - 1
     grid_angle = np.pi/2. - grid_orientation[detector_index]
     harm_ang_pitch = grid_pitch[detector_index]/1
 
-    phase_map_center = afits[fits_detector_index].data.field('phase_map_ctr')
-    this_roll_angle = afits[fits_detector_index].data.field('roll_angle')
-    modamp = afits[fits_detector_index].data.field('modamp')
-    grid_transmission = afits[fits_detector_index].data.field('gridtran')
-    count = afits[fits_detector_index].data.field('count')
+    events = afits[fits_detector_index].data
+    phase_map_center = np.asarray(events.field('phase_map_ctr'), dtype=float)
+    this_roll_angle = np.asarray(events.field('roll_angle'), dtype=float)
+    modamp = np.asarray(events.field('modamp'), dtype=float)
+    grid_transmission = np.asarray(events.field('gridtran'), dtype=float)
+    count = np.asarray(events.field('count'), dtype=float)
 
     tempa = (np.arange(image_dim[0] * image_dim[1]) % image_dim[0]) - (image_dim[0]-1)/2.
     tempb = tempa.reshape(image_dim[0], image_dim[1]).transpose().reshape(image_dim[0]*image_dim[1])
 
-    pixel = np.array(list(zip(tempa, tempb)))*pixel_size[0]
-    phase_pixel = (2 * np.pi/harm_ang_pitch) *\
-                  (np.outer(pixel[:, 0], np.cos(this_roll_angle - grid_angle)) -
-                   np.outer(pixel[:, 1], np.sin(this_roll_angle - grid_angle))) + phase_map_center
-    phase_modulation = np.cos(phase_pixel)
-    gridmod = modamp * grid_transmission
-    probability_of_transmission = gridmod * phase_modulation + grid_transmission
-    bproj_image = np.inner(probability_of_transmission, count).reshape(image_dim)
-
-    return bproj_image
+    # The phase of each pixel for each event is the sum of a term depending
+    # only on the x and one depending only on the y coordinate of the pixel:
+    #     phase = (2 pi / pitch) * (x cos(angle) - y sin(angle)) + center
+    # so cos(phase) = cos(x term) cos(y term) + sin(x term) sin(y term), and
+    # summing over the events is a product of (coordinates x events) matrices
+    # for the distinct x and y coordinates. This never forms the
+    # (pixels x events) phase matrix.
+    xs, x_index = np.unique(tempa * pixel_size[0], return_inverse=True)
+    ys, y_index = np.unique(tempb * pixel_size[0], return_inverse=True)
+    angle = this_roll_angle - grid_angle
+    gridmod = modamp * grid_transmission * count
+
+    modulation = np.zeros((len(xs), len(ys)))
+    for start in range(0, len(count), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        x_phase = ((2 * np.pi/harm_ang_pitch) * np.outer(xs, np.cos(angle[chunk])) +
+                   phase_map_center[chunk])
+        y_phase = (2 * np.pi/harm_ang_pitch) * np.outer(ys, np.sin(angle[chunk]))
+        modulation += np.dot(np.cos(x_phase) * gridmod[chunk], np.cos(y_phase).T)
+        modulation += np.dot(np.sin(x_phase) * gridmod[chunk], np.sin(y_phase).T)
+
+    bproj_image = modulation[x_index, y_index] + np.dot(grid_transmission, count)
+
+    return bproj_image.reshape(image_dim)
+
+
+def _read_calibrated_event_list(calibrated_event_list):
+    """
+    Read a RHESSI calibrated event list, unless it has been read already.
+    """
+    if isinstance(calibrated_event_list, six.string_types):
+        return sunpy.io.read_file(calibrated_event_list)
+    return calibrated_event_list
 
 
 @u.quantity_input(pixel_size=u.arcsec, image_dim=u.pix)
 def backprojection(calibrated_event_list, pixel_size=(1., 1.) * u.arcsec,
-                   image_dim=(64, 64) * u.pix):
+                   image_dim=(64, 64) * u.pix, max_workers=None):
     """
     Given a stacked calibrated event list fits file create a back
     projection image.
@@ -464,12 +494,15 @@ def backprojection(calibrated_event_list, pixel_size=(1., 1.) * u.arcsec,
 
     Parameters
     ----------
-    calibrated_event_list : string
-        filename of a RHESSI calibrated event list
+    calibrated_event_list : string or list
+        filename of a RHESSI calibrated event list, or the list of
+        (data, header) pairs already read from it by `sunpy.io.read_file`
     pixel_size : `~astropy.units.Quantity` instance
         the size of the pixels in arcseconds. Default is (1,1).
     image_dim : `~astropy.units.Quantity` instance
         the size of the output image in number of pixels
+    max_workers : int or None
+        If given, back project the detectors in a pool of this many threads.
 
     Returns
     -------
@@ -488,7 +521,8 @@ def backprojection(calibrated_event_list, pixel_size=(1., 1.) * u.arcsec,
     pixel_size = pixel_size.to(u.arcsec)
     image_dim = np.array(image_dim.to(u.pix).value, dtype=int)
 
-    afits = sunpy.io.read_file(calibrated_event_list)
+    # The event list is only read once, and shared by all detectors.
+    afits = _read_calibrated_event_list(calibrated_event_list)
     info_parameters = afits[2]
     xyoffset = info_parameters.data.field('USED_XYOFFSET')[0]
     time_range = TimeRange(info_parameters.data.field('ABSOLUTE_TIME_RANGE')[0])
@@ -498,10 +532,19 @@ def backprojection(calibrated_event_list, pixel_size=(1., 1.) * u.arcsec,
     # find out what detectors were used
     det_index_mask = afits[1].data.field('det_index_mask')[0]
     detector_list = (np.arange(9)+1) * np.array(det_index_mask)
-    for detector in detector_list:
-        if detector > 0:
-            image = image + _backproject(calibrated_event_list, detector=detector,
-                                         pixel_size=pixel_size.value, image_dim=image_dim)
+    detector_list = [detector for detector in detector_list if detector > 0]
+
+    def backproject(detector):
+        return _backproject(afits, detector=detector,
+                            pixel_size=pixel_size.value, image_dim=image_dim)
+
+    if max_workers is None:
+        images = map(backproject, detector_list)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            images = list(executor.map(backproject, detector_list))
+    for detector_image in images:
+        image = image + detector_image
 
     dict_header = {
         "DATE-OBS": time_range.center.strftime("%Y-%m-%d %H:%M:%S"),
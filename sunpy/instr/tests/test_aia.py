@@ -42,6 +42,23 @@ def test_aiaprep(original, prep_map):
     assert prep_map.meta['lvl_num'] == 1.5
 
 
+def test_aiaprep_many(original, prep_map):
+    # Test that a list or a MapCube of maps is prepped in the same way as each
+    # of the maps
+    rescaled = sunpy.map.Map(original.data * 2, original.meta.copy())
+    for max_workers in (None, 2):
+        prep_maps = aiaprep([original, rescaled, original], max_workers=max_workers)
+        assert len(prep_maps) == 3
+        for prepped in prep_maps[::2]:
+            np.testing.assert_allclose(prepped.data, prep_map.data)
+            assert prepped.meta == prep_map.meta
+        np.testing.assert_allclose(prep_maps[1].data, aiaprep(rescaled).data)
+
+    prep_cube = aiaprep(sunpy.map.MapCube([original, rescaled], sortby=None))
+    assert isinstance(prep_cube, sunpy.map.MapCube)
+    np.testing.assert_allclose(prep_cube[0].data, prep_map.data)
+
+
 def test_filesave(prep_map):
     # Test that adjusted header values are still correct after saving the map
     # and reloading it.
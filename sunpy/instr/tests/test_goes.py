@@ -353,6 +353,42 @@ def test_calculate_xray_luminosity():
     assert_frame_equal(goeslc_test.data, goeslc_expected.data,
                        check_less_precise=True)
 
+@pytest.mark.remote_data
+def test_calculate_goes_properties():
+    goeslcs = [lightcurve.GOESLightCurve.create("2014-01-01 00:00:00",
+                                                "2014-01-01 00:00:10"),
+               lightcurve.GOESLightCurve.create("2014-01-02 00:00:00",
+                                                "2014-01-02 00:00:10")]
+    with pytest.raises(TypeError):
+        goes.calculate_goes_properties([[]])
+    for goeslc, goeslc_test in zip(goeslcs,
+                                   goes.calculate_goes_properties(goeslcs)):
+        goeslc_expected = goes.calculate_radiative_loss_rate(goeslc)
+        goeslc_lx = goes.calculate_xray_luminosity(goeslc)
+        goeslc_expected.data["luminosity_xrsa"] = goeslc_lx.data.luminosity_xrsa
+        goeslc_expected.data["luminosity_xrsb"] = goeslc_lx.data.luminosity_xrsb
+        assert_frame_equal(goeslc_test.data, goeslc_expected.data)
+
+
+def test_get_chianti_spline(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as csvfile:
+        csvfile.write("# comment\nlog10temp_MK;ratioGOES15\n")
+        csvfile.writelines("{0};{1}\n".format(i, i**2) for i in range(5))
+    calls = []
+
+    def read_table():
+        calls.append(path)
+        return goes._read_goes_chianti_csv(path, "ratioGOES15")
+    xmin, xmax, spline = goes._get_chianti_spline(path, "ratioGOES15",
+                                                  read_table)
+    assert (xmin, xmax) == (0, 4)
+    assert_almost_equal(goes.interpolate.splev(2.5, spline), 6.25)
+    assert goes._get_chianti_spline(path, "ratioGOES15",
+                                    read_table)[2] is spline
+    assert len(calls) == 1
+
+
 def test_goes_lx_errors():
     # Define input values of flux and time.
     longflux = 7e-6 * Quantity(np.ones(6), unit="W/m**2")
@@ -351,6 +351,29 @@ def test_get_lytaf_events():
                                            force_use_local_lytaf=True)
 
 
+def test_in_intervals():
+    """Test _in_intervals() against comparing each interval with all times."""
+    times = lyra._to_datetime64(TIME[::-1])
+    begin_time = np.array([TIME[5], TIME[50], TIME[55], TIME[90]])
+    end_time = np.array([TIME[10], TIME[60], TIME[57], TIME[80]])
+    expected = np.zeros(len(TIME), dtype=bool)
+    for begin, end in zip(begin_time, end_time):
+        expected |= (TIME[::-1] >= begin) & (TIME[::-1] <= end)
+    np.testing.assert_array_equal(
+        lyra._in_intervals(times, begin_time, end_time), expected)
+    half_open = lyra._in_intervals(times, begin_time, end_time, closed=False)
+    assert half_open.sum() == expected.sum() - 2
+
+
+def test_lytaf_database_cached():
+    """Test that annotation files are only read in again when changed."""
+    path = os.path.join(TEST_DATA_PATH, "annotation_lyra.db")
+    database = lyra._get_lytaf_database(path)
+    assert lyra._get_lytaf_database(path) is database
+    lyra._lytaf_databases[path] = ((None, None), database)
+    assert lyra._get_lytaf_database(path) is not database
+
+
 def test_get_lytaf_event_types():
     """Test that LYTAF event types are printed."""
     lyra.get_lytaf_event_types(lytaf_path=TEST_DATA_PATH)
@@ -8,6 +8,7 @@ import warnings
 from datetime import datetime
 import textwrap
 
+import sunpy.io
 import sunpy.map
 import sunpy.data.test
 import sunpy.instr.rhessi as rhessi
@@ -26,6 +27,48 @@ def test_backprojection():
     assert amap.date == datetime(2002, 2, 20, 11, 6, 21)
 
 
+def test_backprojection_preloaded():
+    filename = os.path.join(testpath, 'hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits')
+    amap = rhessi.backprojection(filename)
+    preloaded = rhessi.backprojection(sunpy.io.read_file(filename), max_workers=4)
+    np.testing.assert_allclose(preloaded.data, amap.data)
+
+
+def test_backproject_chunked():
+    afits = sunpy.io.read_file(
+        os.path.join(testpath, 'hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits'))
+    image = rhessi._backproject(afits, detector=8, image_dim=(30, 20))
+    assert image.shape == (30, 20)
+    np.testing.assert_allclose(
+        rhessi._backproject(afits, detector=8, image_dim=(30, 20), chunk_size=7), image)
+
+
+def test_backproject_direct():
+    # Compare with the direct sum over events of the cosine of the phase of
+    # every pixel, on a small grid
+    afits = sunpy.io.read_file(
+        os.path.join(testpath, 'hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits'))
+    detector, pixel_size, image_dim = 5, (2., 2.), (12, 8)
+    events = afits[detector + 2].data
+    grid_angle = np.pi/2. - rhessi.grid_orientation[detector - 1]
+    pitch = rhessi.grid_pitch[detector - 1]
+    angle = events.field('roll_angle') - grid_angle
+
+    tempa = (np.arange(image_dim[0] * image_dim[1]) % image_dim[0]) - (image_dim[0]-1)/2.
+    tempb = tempa.reshape(image_dim[0], image_dim[1]).transpose().reshape(image_dim[0]*image_dim[1])
+    pixel = np.array(list(zip(tempa, tempb)))*pixel_size[0]
+    phase_pixel = ((2 * np.pi/pitch) *
+                   (np.outer(pixel[:, 0], np.cos(angle)) - np.outer(pixel[:, 1], np.sin(angle))) +
+                   events.field('phase_map_ctr'))
+    gridmod = events.field('modamp') * events.field('gridtran')
+    probability_of_transmission = gridmod * np.cos(phase_pixel) + events.field('gridtran')
+    expected = np.inner(probability_of_transmission, events.field('count')).reshape(image_dim)
+
+    image = rhessi._backproject(afits, detector=detector, pixel_size=pixel_size,
+                                image_dim=image_dim, chunk_size=100)
+    assert np.allclose(image, expected)
+
+
 def test_get_obssumm_dbase_file():
     with pytest.raises(ValueError):
         rhessi.get_obssumm_dbase_file(['2002/01/01', '2002/04/01'])
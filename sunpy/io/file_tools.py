@@ -66,6 +66,11 @@ def read_file(filepath, filetype=None, **kwargs):
         Should memory mapping be used, i.e. keep data on disk rather than in RAM.
         This is currently only supported by the FITS reader.
 
+    lazy : bool
+        Only read the headers, and defer reading the data until it is used.
+        This is currently only supported by the FITS reader, other readers
+        ignore it.
+
     Returns
     -------
     pairs : `list`
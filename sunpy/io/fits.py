@@ -36,12 +36,13 @@ import traceback
 import itertools
 import collections
 
+import numpy as np
 from astropy.io import fits
 
 from sunpy.io.header import FileHeader
 from sunpy.extern.six.moves import zip
 
-__all__ = ['read', 'get_header', 'write', 'extract_waveunit']
+__all__ = ['read', 'get_header', 'write', 'extract_waveunit', 'DeferredHDUData']
 
 __author__ = "Keith Hughitt, Stuart Mumford, Simon Liedtke"
 __email__ = "keith.hughitt@nasa.gov"
@@ -49,7 +50,7 @@ __email__ = "keith.hughitt@nasa.gov"
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
 
-def read(filepath, hdus=None, memmap=None, **kwargs):
+def read(filepath, hdus=None, memmap=None, lazy=False, **kwargs):
     """
     Read a fits file
 
@@ -59,6 +60,11 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
         The fits file to be read
     hdu: `int` or iterable
         The HDU indexes to read from the file
+    lazy : `bool`, optional
+        If `True` only the headers are read, and the data of each image HDU
+        is returned as a `~sunpy.io.fits.DeferredHDUData` placeholder which
+        reads the array from disk the first time it is requested. The data of
+        table HDUs is read as usual.
 
     Returns
     -------
@@ -73,6 +79,13 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     'comment' key in the returned FileHeader.
     """
     with fits.open(filepath, ignore_blank=True, memmap=memmap) as hdulist:
+        if hdus is None:
+            hdu_indices = list(range(len(hdulist)))
+        elif isinstance(hdus, int):
+            hdu_indices = [hdus]
+        else:
+            hdu_indices = list(hdus)
+
         if hdus is not None:
             if isinstance(hdus, int):
                 hdulist = hdulist[hdus]
@@ -85,6 +98,12 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
         pairs = []
 
         for i, (hdu, header) in enumerate(zip(hdulist, headers)):
+            # Only image data is deferred, the data of table HDUs is small and
+            # is read as it is without lazy
+            if lazy and hdu.is_image:
+                data = DeferredHDUData(filepath, hdu_indices[i], header, memmap=memmap)
+                pairs.append(HDPair(data, header))
+                continue
             try:
                 pairs.append(HDPair(hdu.data, header))
             except (KeyError, ValueError) as e:
@@ -98,6 +117,80 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     return pairs
 
 
+class DeferredHDUData(object):
+    """
+    A placeholder for the data array of one HDU in a FITS file.
+
+    The shape and dtype of the array are worked out from the header, so that
+    the array itself is only read from disk when `load` is called.
+
+    Parameters
+    ----------
+    filepath : `str`
+        The FITS file containing the data.
+    hdu_index : `int`
+        The index of the HDU in the file.
+    header : `dict`
+        The header of the HDU.
+    memmap : `bool`, optional
+        Passed to `astropy.io.fits.open` when the data is read.
+    """
+    def __init__(self, filepath, hdu_index, header, memmap=None):
+        self.filepath = filepath
+        self.hdu_index = hdu_index
+        self.memmap = memmap
+        naxis = header.get('NAXIS', 0)
+        self.shape = tuple(header['NAXIS{}'.format(i)] for i in range(naxis, 0, -1))
+        self.dtype = _dtype_from_header(header)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def load(self):
+        """
+        Read the data array of the HDU from disk.
+        """
+        with fits.open(self.filepath, ignore_blank=True, memmap=self.memmap) as hdulist:
+            hdulist.verify('silentfix+warn')
+            data = hdulist[self.hdu_index].data
+        return data
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.load(), dtype=dtype)
+
+    def __getitem__(self, item):
+        return self.load()[item]
+
+    def __repr__(self):
+        return "<{0} HDU {1} of {2}, shape={3}, dtype={4}>".format(
+            type(self).__name__, self.hdu_index, self.filepath, self.shape, self.dtype)
+
+
+def _dtype_from_header(header):
+    """
+    The dtype `astropy.io.fits` will give the data of an image HDU, worked out
+    from the BITPIX, BSCALE and BZERO keywords.
+    """
+    bitpix = header.get('BITPIX', 8)
+    bscale = header.get('BSCALE', 1)
+    bzero = header.get('BZERO', 0)
+    if bitpix < 0:
+        return np.dtype('>f{}'.format(-bitpix // 8))
+    if bscale == 1 and bzero == 0:
+        return np.dtype('u1' if bitpix == 8 else '>i{}'.format(bitpix // 8))
+    # astropy reads these as (un)signed integers rather than scaling them
+    if bscale == 1 and bitpix == 8 and bzero == -128:
+        return np.dtype('i1')
+    if bscale == 1 and bitpix > 8 and bzero == 2**(bitpix - 1):
+        return np.dtype('>u{}'.format(bitpix // 8))
+    return np.dtype(np.float32 if bitpix <= 16 else np.float64)
+
+
 def get_header(afile):
     """
     Read a fits file and return just the headers for all HDU's. In each header,
@@ -1,3 +1,5 @@
+import numpy as np
+
 import sunpy.io.fits
 from sunpy.io.fits import get_header, extract_waveunit
 
@@ -35,6 +37,17 @@ def read_hdus_gen():
     assert len(pairs) == 2
 
 
+def test_read_lazy():
+    pairs = sunpy.io.fits.read(AIA_171_IMAGE)
+    lazy_pairs = sunpy.io.fits.read(AIA_171_IMAGE, lazy=True)
+    assert len(lazy_pairs) == len(pairs)
+    deferred = lazy_pairs[0].data
+    assert isinstance(deferred, sunpy.io.fits.DeferredHDUData)
+    assert deferred.shape == pairs[0].data.shape
+    assert deferred.dtype == pairs[0].data.dtype
+    assert np.all(deferred.load() == pairs[0].data)
+
+
 def test_extract_waveunit_missing_waveunit_key_and_missing_wavelnth_comment():
     waveunit = extract_waveunit(get_header(RHESSI_IMAGE)[0])
     assert waveunit is None
@@ -3,6 +3,8 @@ from __future__ import absolute_import, division, print_function
 import os
 import glob
 from collections import OrderedDict
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import astropy.io.fits
@@ -10,7 +12,7 @@ import astropy.io.fits
 import sunpy
 from sunpy.map.mapbase import GenericMap
 from sunpy.map.compositemap import CompositeMap
-from sunpy.map.mapcube import MapCube
+from sunpy.map.mapcube import MapCube, LazyMapCube
 
 from sunpy.io.file_tools import read_file
 from sunpy.io.header import FileHeader
@@ -117,6 +119,18 @@ class MapFactory(BasicRegistrationFactory):
                 new_pairs.append((data, meta))
         return new_pairs
 
+    def _read_files(self, files, parallel=False, max_workers=None, **kwargs):
+        """
+        Read a list of files, optionally using a pool of threads, and return
+        a list of the (data, meta) pairs of each file in the same order as
+        ``files``.
+        """
+        if not parallel:
+            return [self._read_file(afile, **kwargs) for afile in files]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(partial(self._read_file, **kwargs), files))
+
     def _validate_meta(self, meta):
         """
         Validate a meta argument.
@@ -150,8 +164,13 @@ class MapFactory(BasicRegistrationFactory):
                          '*.fits')
 
         """
+        parallel = kwargs.pop('parallel', False)
+        max_workers = kwargs.pop('max_workers', None)
 
-        data_header_pairs = list()
+        # Each entry is either a list of data-header pairs or the path of a
+        # file to be read, so that the files can all be read at once below
+        # while keeping the order of the inputs.
+        pairs_or_files = list()
         already_maps = list()
 
         # Account for nested lists of items
@@ -170,36 +189,33 @@ class MapFactory(BasicRegistrationFactory):
                 self._validate_meta(arg[1])):
 
                 arg[1] = OrderedDict(arg[1])
-                data_header_pairs.append(arg)
+                pairs_or_files.append([arg])
 
             # Data-header pair not in a tuple
             elif (isinstance(arg, np.ndarray) and
                   self._validate_meta(args[i+1])):
 
                 pair = (args[i], OrderedDict(args[i+1]))
-                data_header_pairs.append(pair)
+                pairs_or_files.append([pair])
                 i += 1   # an extra increment to account for the data-header pairing
 
             # File name
             elif (isinstance(arg, six.string_types) and
                   os.path.isfile(os.path.expanduser(arg))):
                 path = os.path.expanduser(arg)
-                pairs = self._read_file(path, **kwargs)
-                data_header_pairs += pairs
+                pairs_or_files.append(path)
 
             # Directory
             elif (isinstance(arg, six.string_types) and
                   os.path.isdir(os.path.expanduser(arg))):
                 path = os.path.expanduser(arg)
                 files = [os.path.join(path, elem) for elem in os.listdir(path)]
-                for afile in files:
-                    data_header_pairs += self._read_file(afile, **kwargs)
+                pairs_or_files += files
 
             # Glob
             elif (isinstance(arg, six.string_types) and '*' in arg):
                 files = glob.glob(os.path.expanduser(arg))
-                for afile in files:
-                    data_header_pairs += self._read_file(afile, **kwargs)
+                pairs_or_files += files
 
             # Already a Map
             elif isinstance(arg, GenericMap):
@@ -210,17 +226,27 @@ class MapFactory(BasicRegistrationFactory):
                   _is_url(arg)):
                 url = arg
                 path = download_file(url, get_and_create_download_dir())
-                pairs = self._read_file(path, **kwargs)
-                data_header_pairs += pairs
+                pairs_or_files.append(path)
 
             # A database Entry
             elif isinstance(arg, DatabaseEntry):
-                data_header_pairs += self._read_file(arg.path, **kwargs)
+                pairs_or_files.append(arg.path)
 
             else:
                 raise ValueError("File not found or invalid input")
 
             i += 1
+
+        files = [item for item in pairs_or_files if isinstance(item, six.string_types)]
+        read_pairs = iter(self._read_files(files, parallel=parallel,
+                                           max_workers=max_workers, **kwargs))
+        data_header_pairs = list()
+        for item in pairs_or_files:
+            if isinstance(item, six.string_types):
+                data_header_pairs += next(read_pairs)
+            else:
+                data_header_pairs += item
+
         # TODO:
         # In the end, if there are already maps it should be put in the same
         # order as the input, currently they are not.
@@ -244,9 +270,28 @@ class MapFactory(BasicRegistrationFactory):
         cube : boolean, optional
             Indicates if collection of maps should be returned as a MapCube
 
+        contiguous : boolean, optional
+            If returning a MapCube, store the data of all the maps in a single
+            contiguous array. See `~sunpy.map.MapCube`.
+
         silence_errors : boolean, optional
             If set, ignore data-header pairs which cause an exception.
 
+        lazy : boolean, optional
+            If set, only the headers of files are read when the maps are
+            created, and the data of each map is read from disk the first time
+            it is accessed. This is currently only supported for FITS files.
+            If ``cube`` is also set (and ``contiguous`` is not) a
+            `~sunpy.map.LazyMapCube` is returned.
+
+        parallel : boolean, optional
+            If set, files are read using a pool of threads. The order of the
+            returned maps is the same as when reading the files one by one.
+
+        max_workers : int, optional
+            The maximum number of threads used when ``parallel`` is set.
+            Defaults to the `concurrent.futures.ThreadPoolExecutor` default.
+
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io.read_file` such
@@ -256,9 +301,14 @@ class MapFactory(BasicRegistrationFactory):
         # Hack to get around Python 2.x not backporting PEP 3102.
         composite = kwargs.pop('composite', False)
         cube = kwargs.pop('cube', False)
+        contiguous = kwargs.pop('contiguous', False)
         silence_errors = kwargs.pop('silence_errors', False)
+        lazy = kwargs.pop('lazy', False)
+        parallel = kwargs.pop('parallel', False)
+        max_workers = kwargs.pop('max_workers', None)
 
-        data_header_pairs, already_maps = self._parse_args(*args, **kwargs)
+        data_header_pairs, already_maps = self._parse_args(*args, lazy=lazy, parallel=parallel,
+                                                           max_workers=max_workers, **kwargs)
 
         new_maps = list()
 
@@ -282,7 +332,9 @@ class MapFactory(BasicRegistrationFactory):
 
         # If the list is meant to be a cube, instantiate a map cube
         if cube:
-            return MapCube(new_maps, **kwargs)
+            if lazy and not contiguous:
+                return LazyMapCube(new_maps, **kwargs)
+            return MapCube(new_maps, contiguous=contiguous, **kwargs)
 
         # If the list is meant to be a composite map, instantiate one
         if composite:
@@ -4,6 +4,7 @@ Map is a generic Map class from which all other Map classes inherit from.
 import copy
 import warnings
 import inspect
+import functools
 from collections import namedtuple
 import textwrap
 
@@ -17,6 +18,7 @@ from astropy.visualization.wcsaxes import WCSAxes
 from astropy.coordinates import SkyCoord, UnitSphericalRepresentation
 
 import sunpy.io as io
+from sunpy.io.fits import DeferredHDUData
 import sunpy.coordinates
 import sunpy.cm
 from sunpy.util.decorators import deprecated
@@ -27,7 +29,7 @@ from sunpy.sun import constants
 from sunpy.sun import sun
 from sunpy.time import parse_time, is_time
 from sunpy.image.transform import affine_transform
-from sunpy.image.rescale import reshape_image_to_4d_superpixel
+from sunpy.image.rescale import superpixel as sunpy_image_superpixel
 from sunpy.image.rescale import resample as sunpy_image_resample
 from sunpy.coordinates import get_sun_B0, get_sun_L0, get_sunearth_distance
 
@@ -40,6 +42,37 @@ SpatialPair = namedtuple('SpatialPair', 'axis1 axis2')
 __all__ = ['GenericMap']
 
 
+def _cached_by_meta(func):
+    """
+    Cache the value returned by a map property until the map meta data is
+    changed or replaced.
+
+    Only meta data which counts its changes, such as a
+    `~sunpy.util.metadata.MetaDict`, is cached against; for any other meta
+    data the value is computed on every access. The cached object itself is
+    returned, so it must not be modified in place.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        meta = self.meta
+        version = getattr(meta, 'version', None)
+        if version is None:
+            return func(self)
+        cache = self.__dict__.get('_meta_cache')
+        if cache is None or cache[0] is not meta or cache[1] != version:
+            # Replace rather than clear, a shallow copy of the map may share it
+            cache = (meta, version, {})
+            self._meta_cache = cache
+        values = cache[2]
+        if name not in values:
+            values[name] = func(self)
+        return values[name]
+
+    return wrapper
+
+
 class GenericMap(NDData):
     """
     A Generic spatially-aware 2D data array
@@ -253,9 +286,13 @@ class GenericMap(NDData):
         return r.lon.to(self.spatial_units[0]), r.lat.to(self.spatial_units[1])
 
     @property
+    @_cached_by_meta
     def wcs(self):
         """
         The `~astropy.wcs.WCS` property of the map.
+
+        The same object is returned until the meta data of the map changes, so
+        make a copy of it before modifying it.
         """
         w2 = astropy.wcs.WCS(naxis=2)
         w2.wcs.crpix = u.Quantity(self.reference_pixel)
@@ -283,6 +320,7 @@ class GenericMap(NDData):
         return w2
 
     @property
+    @_cached_by_meta
     def coordinate_frame(self):
         """
         An `astropy.coordinates.BaseFrame` instance created from the coordinate
@@ -313,33 +351,45 @@ class GenericMap(NDData):
         return WCSAxes, {'wcs': self.wcs}
 
     # Some numpy extraction
+    @property
+    def data(self):
+        """
+        The data array of the map.
+
+        If the map was created with ``lazy=True`` the array is read from disk
+        the first time this is accessed.
+        """
+        if isinstance(self._data, DeferredHDUData):
+            self._data = self._data.load()
+        return self._data
+
     @property
     def dimensions(self):
         """
         The dimensions of the array (x axis first, y axis second).
         """
-        return PixelPair(*u.Quantity(np.flipud(self.data.shape), 'pixel'))
+        return PixelPair(*u.Quantity(np.flipud(self._data.shape), 'pixel'))
 
     @property
     def dtype(self):
         """
         The `numpy.dtype` of the array of the map.
         """
-        return self.data.dtype
+        return self._data.dtype
 
     @property
     def size(self):
         """
         The number of pixels in the array of the map.
         """
-        return u.Quantity(self.data.size, 'pixel')
+        return u.Quantity(self._data.size, 'pixel')
 
     @property
     def ndim(self):
         """
         The value of `numpy.ndarray.ndim` of the data array of the map.
         """
-        return self.data.ndim
+        return self._data.ndim
 
     def std(self, *args, **kwargs):
         """
@@ -397,6 +447,7 @@ class GenericMap(NDData):
         self._nickname = n
 
     @property
+    @_cached_by_meta
     def date(self):
         """Image observation time."""
         time = self.meta.get('date-obs', None)
@@ -417,6 +468,7 @@ class GenericMap(NDData):
         return self.meta.get('detector', "")
 
     @property
+    @_cached_by_meta
     def dsun(self):
         """The observer distance from the Sun."""
         dsun = self.meta.get('dsun_obs', None)
@@ -554,6 +606,7 @@ class GenericMap(NDData):
         return u.Quantity(self.meta.get('rsun_ref', constants.radius), 'meter')
 
     @property
+    @_cached_by_meta
     def rsun_obs(self):
         """Radius of the Sun."""
         rsun_arcseconds = self.meta.get('rsun_obs',
@@ -577,6 +630,7 @@ class GenericMap(NDData):
                            self.meta.get('ctype2', 'HPLT-   '))
 
     @property
+    @_cached_by_meta
     def carrington_longitude(self):
         """Carrington longitude (crln_obs)."""
         carrington_longitude = self.meta.get('crln_obs', None)
@@ -596,6 +650,7 @@ class GenericMap(NDData):
         return u.Quantity(carrington_longitude, 'deg')
 
     @property
+    @_cached_by_meta
     def heliographic_latitude(self):
         """Heliographic latitude."""
         heliographic_latitude = self.meta.get('hglt_obs',
@@ -617,6 +672,7 @@ class GenericMap(NDData):
         return u.Quantity(heliographic_latitude, 'deg')
 
     @property
+    @_cached_by_meta
     def heliographic_longitude(self):
         """Heliographic longitude."""
         heliographic_longitude = self.meta.get('hgln_obs', None)
@@ -637,6 +693,7 @@ class GenericMap(NDData):
         return u.Quantity(heliographic_longitude, 'deg')
 
     @property
+    @_cached_by_meta
     def observer_coordinate(self):
         """
         The Heliographic Stonyhurst Coordinate of the observer.
@@ -660,6 +717,7 @@ class GenericMap(NDData):
         return self.meta.get('crval2', 0.) * self.spatial_units[1]
 
     @property
+    @_cached_by_meta
     def reference_coordinate(self):
         """Reference point WCS axes in data units (i.e. crval1, crval2). This value
         includes a shift if one is set."""
@@ -739,9 +797,9 @@ class GenericMap(NDData):
     def _fix_naxis(self):
         # If naxis is not specified, get it from the array shape
         if 'naxis1' not in self.meta:
-            self.meta['naxis1'] = self.data.shape[1]
+            self.meta['naxis1'] = self._data.shape[1]
         if 'naxis2' not in self.meta:
-            self.meta['naxis2'] = self.data.shape[0]
+            self.meta['naxis2'] = self._data.shape[0]
         if 'naxis' not in self.meta:
             self.meta['naxis'] = self.ndim
 
@@ -924,12 +982,14 @@ class GenericMap(NDData):
             Pixel dimensions that new Map should have.
             Note: the first argument corresponds to the 'x' axis and the second
             argument corresponds to the 'y' axis.
-        method : {'neighbor' | 'nearest' | 'linear' | 'spline'}
+        method : {'neighbor' | 'nearest' | 'linear' | 'spline' | 'area'}
             Method to use for resampling interpolation.
                 * neighbor - Closest value from original data
-                * nearest and linear - Uses n x 1-D interpolations using
-                  scipy.interpolate.interp1d
-                * spline - Uses ndimage.map_coordinates
+                * nearest and linear - Nearest and linear interpolation
+                * spline - Cubic spline interpolation, as done by
+                  ndimage.map_coordinates
+                * area - The mean of the original data over the area of each
+                  new pixel, which conserves the total flux
 
         Returns
         -------
@@ -947,8 +1007,8 @@ class GenericMap(NDData):
         # Note: "center" defaults to True in this function because data
         #   coordinates in a Map are at pixel centers
 
-        # Make a copy of the original data and perform resample
-        new_data = sunpy_image_resample(self.data.copy().T, dimensions,
+        # Perform resample, which does not modify the original data
+        new_data = sunpy_image_resample(self.data.T, dimensions,
                                         method, center=True)
         new_data = new_data.T
 
@@ -977,7 +1037,7 @@ class GenericMap(NDData):
         return new_map
 
     def rotate(self, angle=None, rmatrix=None, order=4, scale=1.0,
-               recenter=False, missing=0.0, use_scipy=False):
+               recenter=False, missing=0.0, use_scipy=False, dtype=np.float64):
         """
         Returns a new rotated and rescaled map.
 
@@ -1019,6 +1079,11 @@ class GenericMap(NDData):
             :func:`scipy.ndimage.interpolation.affine_transform`, otherwise it
             uses the :func:`skimage.transform.warp`.
             Default: False, unless scikit-image can't be imported
+        dtype : `numpy.dtype` or None
+            The floating point type of the rotated data. If None, float data
+            keep their type and integer data use the smallest float type that
+            holds them, e.g. float32 for int16.
+            Default: float64
 
         Returns
         -------
@@ -1040,6 +1105,33 @@ class GenericMap(NDData):
         transformations, situations when the underlying data is modified prior
         to rotation, and differences from IDL's rot().
         """
+        rmatrix, shape, pixel_rotation_center = self._rotate_setup(angle, rmatrix, order)
+
+        if recenter:
+            image_center = np.flipud(pixel_rotation_center)
+        else:
+            image_center = None
+
+        # Apply the rotation to the image data. The output covers the area
+        # needed to contain the rotated image, so the data is not padded.
+        new_data = affine_transform(self.data.T,
+                                    np.asarray(rmatrix),
+                                    order=order, scale=scale,
+                                    image_center=image_center,
+                                    recenter=recenter, missing=missing,
+                                    use_scipy=use_scipy, output_shape=shape[::-1],
+                                    dtype=dtype).T
+
+        return self._rotate_new_map(new_data, rmatrix, pixel_rotation_center,
+                                    scale, recenter)
+
+    def _rotate_setup(self, angle=None, rmatrix=None, order=4):
+        """
+        Check the arguments of `rotate`, and work out the rotation matrix, the
+        shape of the data needed to contain the rotated image, and the pixel
+        position (origin 0) of the reference coordinate, the center of the
+        rotation, in the data.
+        """
         if angle is not None and rmatrix is not None:
             raise ValueError("You cannot specify both an angle and a matrix")
         elif angle is None and rmatrix is None:
@@ -1071,63 +1163,49 @@ class GenericMap(NDData):
         if order not in range(6):
             raise ValueError("Order must be between 0 and 5")
 
-        # The FITS-WCS transform is by definition defined around the
-        # reference coordinate in the header.
-        lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
-        rotation_center = u.Quantity([lon, lat])
-
-        # Copy meta data
-        new_meta = self.meta.copy()
         if angle is not None:
             # Calculate the parameters for the affine_transform
             c = np.cos(np.deg2rad(angle))
             s = np.sin(np.deg2rad(angle))
             rmatrix = np.matrix([[c, -s], [s, c]])
 
-        # Calculate the shape in pixels to contain all of the image data
-        extent = np.max(np.abs(np.vstack((self.data.shape * rmatrix,
-                                          self.data.shape * rmatrix.T))), axis=0)
-
-        # Calculate the needed padding or unpadding
-        diff = np.asarray(np.ceil((extent - self.data.shape) / 2), dtype=int).ravel()
-        # Pad the image array
-        pad_x = int(np.max((diff[1], 0)))
-        pad_y = int(np.max((diff[0], 0)))
+        # Calculate the shape in pixels to contain all of the image data. The
+        # shape of the underlying data is used so that a deferred array is not
+        # read until it is needed.
+        shape = self._data.shape
+        extent = np.max(np.abs(np.vstack((shape * rmatrix,
+                                          shape * rmatrix.T))), axis=0)
 
-        new_data = np.pad(self.data,
-                          ((pad_y, pad_y), (pad_x, pad_x)),
-                          mode='constant',
-                          constant_values=(missing, missing))
-        new_meta['crpix1'] += pad_x
-        new_meta['crpix2'] += pad_y
+        # Calculate the needed growth or shrinkage of each side
+        diff = np.asarray(np.ceil((extent - shape) / 2), dtype=int).ravel()
 
-        # All of the following pixel calculations use a pixel origin of 0
+        # The reference coordinate is at the reference pixel by definition, so
+        # there is no need for a world to pixel conversion.
+        pixel_rotation_center = u.Quantity(self.reference_pixel).value - 1
 
-        pixel_array_center = (np.flipud(new_data.shape) - 1) / 2.0
+        return rmatrix, tuple(np.array(shape) + 2 * diff), pixel_rotation_center
 
-        # Create a temporary map so we can use it for the data to pixel calculation.
-        temp_map = self._new_instance(new_data, new_meta, self.plot_settings)
-
-        # Convert the axis of rotation from data coordinates to pixel coordinates
-        pixel_rotation_center = u.Quantity(temp_map.world_to_pixel(self.reference_coordinate,
-                                                                  origin=0)).value
-        del temp_map
-
-        if recenter:
-            pixel_center = pixel_rotation_center
-        else:
-            pixel_center = pixel_array_center
+    def _rotate_new_map(self, new_data, rmatrix, pixel_rotation_center,
+                        scale=1.0, recenter=False):
+        """
+        Make the map of the rotated ``new_data``, updating the meta data, with
+        the parameters from `_rotate_setup`.
+        """
+        # The FITS-WCS transform is by definition defined around the
+        # reference coordinate in the header.
+        lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
+        rotation_center = u.Quantity([lon, lat])
 
-        # Apply the rotation to the image data
-        new_data = affine_transform(new_data.T,
-                                    np.asarray(rmatrix),
-                                    order=order, scale=scale,
-                                    image_center=np.flipud(pixel_center),
-                                    recenter=recenter, missing=missing,
-                                    use_scipy=use_scipy).T
+        # Copy meta data
+        new_meta = self.meta.copy()
 
+        # All of the following pixel calculations use a pixel origin of 0. The
+        # rotated data is centered on the original data.
+        pixel_center = (np.flipud(new_data.shape) - 1) / 2.0
+        pixel_rotation_center = (pixel_rotation_center +
+                                 (np.flipud(new_data.shape) - np.flipud(self._data.shape)) / 2)
         if recenter:
-            new_reference_pixel = pixel_array_center
+            new_reference_pixel = pixel_center
         else:
             # Calculate new pixel coordinates for the rotation center
             new_reference_pixel = pixel_center + np.dot(rmatrix,
@@ -1140,16 +1218,6 @@ class GenericMap(NDData):
         new_meta['crpix1'] = new_reference_pixel[0] + 1  # FITS pixel origin is 1
         new_meta['crpix2'] = new_reference_pixel[1] + 1  # FITS pixel origin is 1
 
-        # Unpad the array if necessary
-        unpad_x = -np.min((diff[1], 0))
-        if unpad_x > 0:
-            new_data = new_data[:, unpad_x:-unpad_x]
-            new_meta['crpix1'] -= unpad_x
-        unpad_y = -np.min((diff[0], 0))
-        if unpad_y > 0:
-            new_data = new_data[unpad_y:-unpad_y, :]
-            new_meta['crpix2'] -= unpad_y
-
         # Calculate the new rotation matrix to store in the header by
         # "subtracting" the rotation matrix used in the rotate from the old one
         # That being calculate the dot product of the old header data with the
@@ -1351,10 +1419,14 @@ class GenericMap(NDData):
         offset : tuple
             Offset from (0,0) in original map pixels used to calculate where
             the data used to make the resulting superpixel map starts.
-        func : function applied to the original data
-            The function 'func' must take a numpy array as its first argument,
-            and support the axis keyword with the meaning of a numpy axis
-            keyword (see the description of `~numpy.sum` for an example.)
+        func : str or function applied to the original data
+            One of the reductions of `sunpy.image.rescale.superpixel`, 'sum',
+            'mean', 'max', 'min', 'median' and their NaN-ignoring versions
+            'nansum', 'nanmean', 'nanmax', 'nanmin' and 'nanmedian', which are
+            done in one pass over each superpixel.
+            Otherwise the function 'func' must take a numpy array as its first
+            argument, and support the axis keyword with the meaning of a numpy
+            axis keyword (see the description of `~numpy.sum` for an example.)
             The default value of 'func' is `~numpy.sum`; using this causes
             superpixel to sum over (dimension[0], dimension[1]) pixels of the
             original map.
@@ -1378,18 +1450,22 @@ class GenericMap(NDData):
         if (offset.value[0] < 0) or (offset.value[1] < 0):
             raise ValueError("Offset is strictly non-negative.")
 
-        # Make a copy of the original data, perform reshaping, and apply the
-        # function.
+        # Apply the function to a view of the original data
         if self.mask is not None:
-            reshaped = reshape_image_to_4d_superpixel(np.ma.array(self.data.copy(), mask=self.mask),
-                                                      [dimensions.value[1], dimensions.value[0]],
-                                                      [offset.value[1], offset.value[0]])
+            data = np.ma.array(self.data, mask=self.mask, copy=False)
         else:
-            reshaped = reshape_image_to_4d_superpixel(self.data.copy(),
-                                                      [dimensions.value[1], dimensions.value[0]],
-                                                      [offset.value[1], offset.value[0]])
-        new_array = func(func(reshaped, axis=3), axis=1)
+            data = self.data
+        new_array = sunpy_image_superpixel(data,
+                                           [dimensions.value[1], dimensions.value[0]],
+                                           [offset.value[1], offset.value[0]], func)
+
+        return self._superpixel_new_map(new_array, dimensions, offset)
 
+    def _superpixel_new_map(self, new_array, dimensions, offset):
+        """
+        Make the map of the superpixels ``new_array`` of this map, updating the
+        meta data.
+        """
         # Update image scale and number of pixels
 
         # create copy of new meta data
@@ -1413,7 +1489,7 @@ class GenericMap(NDData):
         new_meta['crval2'] = lat.to(self.spatial_units[1]).value + 0.5*(offset[1]*self.scale[1]).to(self.spatial_units[1]).value
 
         # Create new map instance
-        if self.mask is not None:
+        if np.ma.isMaskedArray(new_array):
             new_data = np.ma.getdata(new_array)
             new_mask = np.ma.getmask(new_array)
         else:
@@ -1,7 +1,10 @@
 """A Python MapCube Object"""
 from __future__ import absolute_import, division, print_function
 
-from copy import deepcopy
+from copy import copy, deepcopy
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
 import matplotlib.animation
@@ -10,13 +13,27 @@ import numpy.ma as ma
 import astropy.units as u
 
 from sunpy.map import GenericMap
+from sunpy.io.fits import DeferredHDUData
+from sunpy.image.transform import _affine_parameters, _warp_coordinates, _warp
+from sunpy.image.rescale import superpixel
 from sunpy.visualization.animator import MapCubeAnimator
 from sunpy.visualization import wcsaxes_compat
 from sunpy.visualization import axis_labels_from_ctype
 from sunpy.util import expand_list
 from sunpy.extern.six.moves import range
 
-__all__ = ['MapCube']
+__all__ = ['MapCube', 'LazyMapCube']
+
+
+def _read_map_data(m):
+    """
+    Return the data of a map, reading it from disk if the map is lazy, without
+    keeping it on the map.
+    """
+    data = m._data
+    if isinstance(data, DeferredHDUData):
+        data = data.load()
+    return data
 
 
 class MapCube(object):
@@ -33,6 +50,14 @@ class MapCube(object):
         Method by which the MapCube should be sorted along the z-axis.
     derotate : {None}
         Apply a derotation to the data (Not Implemented)
+    contiguous : {bool}
+        If True, the data of all the maps is stored in a single preallocated
+        (nt, ny, nx) array, and each map in the MapCube holds a view into it.
+        All the maps must have the same shape. The maps in the MapCube are
+        copies of the input maps, which are left unchanged.
+    filename : {str, None}
+        If given with ``contiguous=True``, the array is a `numpy.memmap`
+        created at this path rather than being held in memory.
 
     To coalign a mapcube so that solar features remain on the same pixels,
     please see the "Coalignment of mapcubes" note below.
@@ -48,6 +73,11 @@ class MapCube(object):
     >>> mapcube = sunpy.map.Map('images/*.fits', cube=True)   # doctest: +SKIP
 
     Mapcubes can be co-aligned using the routines in sunpy.image.coalignment.
+
+    A MapCube can keep the data of all of its maps in one contiguous array,
+    in which case `~sunpy.map.MapCube.as_array` does not copy the data:
+
+    >>> mapcube = sunpy.map.Map('images/*.fits', cube=True, lazy=True, contiguous=True)   # doctest: +SKIP
     """
     def __init__(self, *args, **kwargs):
         """Creates a new Map instance"""
@@ -55,8 +85,13 @@ class MapCube(object):
         # Hack to get around Python 2.x not backporting PEP 3102.
         sortby = kwargs.pop('sortby', 'date')
         derotate = kwargs.pop('derotate', False)
+        contiguous = kwargs.pop('contiguous', False)
+        filename = kwargs.pop('filename', None)
 
         self.maps = expand_list(args)
+        # The (nt, ny, nx) data and mask arrays when the data is contiguous
+        self._data = None
+        self._mask = None
 
         for m in self.maps:
             if not isinstance(m, GenericMap):
@@ -73,6 +108,41 @@ class MapCube(object):
         if derotate:
             self._derotate()
 
+        if contiguous:
+            self._make_contiguous(filename=filename)
+
+    def _make_contiguous(self, filename=None):
+        """
+        Copy the data of all the maps into one (nt, ny, nx) array, and replace
+        the maps with copies that hold views into this array.
+        """
+        if not self.all_maps_same_shape():
+            raise ValueError('Maps in mapcube do not all have the same shape.')
+
+        shape = (len(self.maps),) + self.maps[0]._data.shape
+        dtype = np.result_type(*[m.dtype for m in self.maps])
+        if filename is None:
+            self._data = np.empty(shape, dtype=dtype)
+        else:
+            self._data = np.memmap(filename, dtype=dtype, mode='w+', shape=shape)
+        if self.at_least_one_map_has_mask():
+            self._mask = np.zeros(shape, dtype=bool)
+
+        new_maps = []
+        for i, m in enumerate(self.maps):
+            # Use the underlying data so that maps with deferred data are
+            # read straight into the array, without keeping a second copy.
+            self._data[i] = m._data
+            new_map = copy(m)
+            new_map.meta = deepcopy(m.meta)
+            new_map._data = self._data[i]
+            if self._mask is not None:
+                if m.mask is not None:
+                    self._mask[i] = m.mask
+                new_map._mask = self._mask[i]
+            new_maps.append(new_map)
+        self.maps = new_maps
+
     def __getitem__(self, key):
         """Overriding indexing operation.  If the key results in a single map,
         then a map object is returned.  This allows functions like enumerate to
@@ -80,6 +150,14 @@ class MapCube(object):
 
         if isinstance(self.maps[key], GenericMap):
             return self.maps[key]
+        elif self._data is not None and isinstance(key, slice):
+            # Keep the order of the maps, so that they match the views of the
+            # contiguous data
+            cube = MapCube(self.maps[key], sortby=None)
+            cube._data = self._data[key]
+            if self._mask is not None:
+                cube._mask = self._mask[key]
+            return cube
         else:
             return MapCube(self.maps[key])
 
@@ -96,6 +174,175 @@ class MapCube(object):
         """Derotates the layers in the MapCube"""
         pass
 
+    def rotate(self, angle=None, rmatrix=None, order=4, scale=1.0,
+               recenter=False, missing=0.0, use_scipy=False, dtype=np.float64,
+               max_workers=None):
+        """
+        Returns a new MapCube of the maps rotated and rescaled with
+        :meth:`~sunpy.map.GenericMap.rotate`.
+
+        The maps are grouped by the shape of their data, their rotation
+        matrix, scale and center of rotation, and the coordinates of the
+        transform are worked out once for each group rather than once for each
+        map. If all the rotated maps have the same shape, their data is written
+        into one contiguous (nt, ny, nx) array.
+
+        Parameters
+        ----------
+        angle : `~astropy.units.Quantity`
+            The angle (degrees) to rotate counterclockwise.
+        rmatrix : 2x2
+            Linear transformation rotation matrix.
+        order : int 0-5
+            Interpolation order to be used, see
+            :meth:`~sunpy.map.GenericMap.rotate`.
+            Default: 4
+        scale : float or list of float
+            A scale factor for the images, or one for each map.
+            Default is no scaling.
+        recenter : bool
+            If True, position the axis of rotation at the center of the new
+            maps.
+            Default: False
+        missing : float, list of float or function
+            The numerical value to fill any missing points after rotation, or
+            one for each map, or a function which gives the value from the data
+            of each map, such as `numpy.min`.
+            Default: 0.0
+        use_scipy : bool
+            If True, forces the rotation to use
+            :func:`scipy.ndimage.interpolation.affine_transform`, otherwise it
+            uses the :func:`skimage.transform.warp`.
+            Default: False, unless scikit-image can't be imported
+        dtype : `numpy.dtype` or None
+            The floating point type of the rotated data, see
+            :meth:`~sunpy.map.GenericMap.rotate`.
+            Default: float64
+        max_workers : int or None
+            If given, the maps are rotated in a pool of this many threads.
+            Default: None, rotate the maps one after the other.
+
+        Returns
+        -------
+        out : `~sunpy.map.MapCube`
+            A new MapCube of the rotated and rescaled maps, in the same order.
+        """
+        n = len(self.maps)
+        scales = np.broadcast_to(np.asarray(scale, dtype=float), (n,))
+        if not callable(missing):
+            missings = np.broadcast_to(np.asarray(missing, dtype=float), (n,))
+        setups = [m._rotate_setup(angle, rmatrix, order) for m in self.maps]
+
+        groups = OrderedDict()
+        for i, m in enumerate(self.maps):
+            frame_rmatrix, shape, pixel_rotation_center = setups[i]
+            if recenter:
+                image_center = tuple(np.flipud(pixel_rotation_center))
+            else:
+                image_center = None
+            key = (m._data.shape, shape, np.asarray(frame_rmatrix).tobytes(), scales[i],
+                   image_center)
+            groups.setdefault(key, []).append(i)
+
+        # The data of the rotated maps, if they all have the same shape
+        data = None
+        if len(set(setup[1] for setup in setups)) == 1:
+            if dtype is None:
+                dtype = np.result_type(*[np.result_type(m.dtype, np.float32)
+                                         for m in self.maps])
+            data = np.empty((n,) + setups[0][1], dtype=dtype)
+
+        def rotate_frame(i, shift, transform_rmatrix, coordinates):
+            frame_rmatrix, shape, pixel_rotation_center = setups[i]
+            # Read the data of lazy maps here, so that only the frames being
+            # rotated are held in memory
+            m = self.maps[i]
+            frame_data = _read_map_data(m)
+            frame_missing = missing(frame_data) if callable(missing) else missings[i]
+            # The transform is done on the transposed data
+            new_data = _warp(frame_data.T, transform_rmatrix, shift, order=order,
+                             missing=frame_missing, use_scipy=use_scipy,
+                             coordinates=coordinates, output_shape=shape[::-1],
+                             dtype=dtype, out=None if data is None else data[i].T).T
+            return m._rotate_new_map(new_data, frame_rmatrix, pixel_rotation_center,
+                                     scales[i], recenter)
+
+        executor = None if max_workers is None else ThreadPoolExecutor(max_workers=max_workers)
+        new_maps = [None] * n
+        try:
+            for (in_shape, shape, _, frame_scale, image_center), indices in groups.items():
+                transform_rmatrix, shift = _affine_parameters(
+                    in_shape[::-1], np.asarray(setups[indices[0]][0]), frame_scale,
+                    image_center=image_center, recenter=recenter,
+                    output_shape=shape[::-1])
+                coordinates = _warp_coordinates(in_shape[::-1], shape[::-1],
+                                                transform_rmatrix, shift,
+                                                order=order, use_scipy=use_scipy)
+                rotate_group_frame = partial(rotate_frame, shift=shift,
+                                             transform_rmatrix=transform_rmatrix,
+                                             coordinates=coordinates)
+                if executor is None:
+                    rotated = [rotate_group_frame(i) for i in indices]
+                else:
+                    rotated = executor.map(rotate_group_frame, indices)
+                for i, new_map in zip(indices, rotated):
+                    new_maps[i] = new_map
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        cube = MapCube(new_maps, sortby=None)
+        cube._data = data
+        return cube
+
+    @u.quantity_input(dimensions=u.pixel, offset=u.pixel)
+    def superpixel(self, dimensions, offset=(0, 0)*u.pixel, func=np.sum):
+        """
+        Returns a new MapCube of the maps made of superpixels of each map, as
+        by :meth:`~sunpy.map.GenericMap.superpixel`.
+
+        If the data of the maps is held in one contiguous array, the
+        superpixels of all the maps are found at once from a view of it, and
+        the data of the new maps is also held in one contiguous array.
+
+        Parameters
+        ----------
+        dimensions : tuple
+            One superpixel in the new maps is equal to (dimension[0],
+            dimension[1]) pixels of the original maps.
+            Note: the first argument corresponds to the 'x' axis and the second
+            argument corresponds to the 'y' axis.
+        offset : tuple
+            Offset from (0,0) in original map pixels used to calculate where
+            the data used to make the resulting superpixel maps starts.
+        func : str or function applied to the original data
+            See :meth:`~sunpy.map.GenericMap.superpixel`.
+
+        Returns
+        -------
+        out : `~sunpy.map.MapCube`
+            A new MapCube of maps which have superpixels of the required size.
+        """
+        if (offset.value[0] < 0) or (offset.value[1] < 0):
+            raise ValueError("Offset is strictly non-negative.")
+
+        if self._data is None:
+            return MapCube([m.superpixel(dimensions, offset=offset, func=func) for m in self],
+                           sortby=None)
+
+        data = self._data
+        if self._mask is not None:
+            data = np.ma.array(data, mask=self._mask, copy=False)
+        new_array = superpixel(data, [dimensions.value[1], dimensions.value[0]],
+                               [offset.value[1], offset.value[0]], func)
+
+        cube = MapCube([m._superpixel_new_map(new_array[i], dimensions, offset)
+                        for i, m in enumerate(self.maps)], sortby=None)
+        cube._data = np.ma.getdata(new_array)
+        if np.ma.isMaskedArray(new_array):
+            cube._mask = np.ma.getmaskarray(new_array)
+        return cube
+
     def plot(self, axes=None, resample=None, annotate=True,
              interval=200, plot_function=None, **kwargs):
         """
@@ -180,11 +427,11 @@ class MapCube(object):
         if resample:
             if self.all_maps_same_shape():
                 resample = u.Quantity(self.maps[0].dimensions) * np.array(resample)
-                ani_data = [amap.resample(resample) for amap in self.maps]
+                ani_data = [self[i].resample(resample) for i in range(len(self))]
             else:
                 raise ValueError('Maps in mapcube do not all have the same shape.')
         else:
-            ani_data = self.maps
+            ani_data = self
 
         im = ani_data[0].plot(axes=axes, **kwargs)
 
@@ -294,8 +541,8 @@ class MapCube(object):
             if self.all_maps_same_shape():
                 plot_cube = MapCube()
                 resample = u.Quantity(self.maps[0].dimensions) * np.array(resample)
-                for amap in self.maps:
-                    plot_cube.maps.append(amap.resample(resample))
+                for i in range(len(self)):
+                    plot_cube.maps.append(self[i].resample(resample))
             else:
                 raise ValueError('Maps in mapcube do not all have the same shape.')
         else:
@@ -308,7 +555,7 @@ class MapCube(object):
         Tests if all the maps have the same number pixels in the x and y
         directions.
         """
-        return np.all([m.data.shape == self.maps[0].data.shape for m in self.maps])
+        return np.all([m.dimensions == self.maps[0].dimensions for m in self.maps])
 
     def at_least_one_map_has_mask(self):
         """
@@ -327,9 +574,18 @@ class MapCube(object):
         with masks copied from maps as appropriately; maps that do not have a
         mask are supplied with a mask that is full of False entries.
         If all the map shapes are not the same, a ValueError is thrown.
+
+        If the MapCube was created with ``contiguous=True`` the returned array
+        is a view of the data of the maps rather than a copy.
         """
+        if self._data is not None:
+            data = np.moveaxis(self._data, 0, -1)
+            if self._mask is not None:
+                return ma.masked_array(data, mask=np.moveaxis(self._mask, 0, -1))
+            return data
+
         if self.all_maps_same_shape():
-            data = np.swapaxes(np.swapaxes(np.asarray([m.data for m in self.maps]), 0, 1).copy(), 1, 2).copy()
+            data = np.stack([m.data for m in self.maps], axis=-1)
             if self.at_least_one_map_has_mask():
                 mask_cube = np.zeros_like(data, dtype=bool)
                 for im, m in enumerate(self.maps):
@@ -346,3 +602,95 @@ class MapCube(object):
         Return all the meta objects as a list.
         """
         return [m.meta for m in self.maps]
+
+
+class LazyMapCube(MapCube):
+    """
+    LazyMapCube
+
+    A MapCube for sequences of maps which are too large to hold in memory.
+
+    The maps are expected to be created with ``lazy=True``, so that only their
+    headers are held in memory. The data of a map is read when it is indexed
+    from the cube, and the most recently used frames are kept in a
+    least-recently-used cache of ``cache_size`` frames.
+
+    Parameters
+    ----------
+    args : {List}
+        A list of Map instances
+    sortby : {"date", None}
+        Method by which the MapCube should be sorted along the z-axis.
+    cache_size : {int}
+        The maximum number of frames whose data is kept in memory.
+
+    Notes
+    -----
+    The maps in the ``maps`` attribute keep their data on disk, but accessing
+    their ``data`` directly reads it and keeps it in memory for the lifetime
+    of the cube. Index the cube instead to get a map whose data is cached.
+
+    Examples
+    --------
+    >>> import sunpy.map
+    >>> mapcube = sunpy.map.Map('images/*.fits', cube=True, lazy=True)   # doctest: +SKIP
+    >>> mapcube = sunpy.map.Map('images/*.fits', cube=True, lazy=True, memmap=True)   # doctest: +SKIP
+    """
+    def __init__(self, *args, **kwargs):
+        self.cache_size = kwargs.pop('cache_size', 16)
+        super(LazyMapCube, self).__init__(*args, **kwargs)
+        # The decoded data of the most recently used frames
+        self._frames = OrderedDict()
+
+    def _frame_data(self, index):
+        """
+        Return the data of a frame, reading it from disk if it is not in the
+        cache.
+        """
+        if index in self._frames:
+            self._frames.move_to_end(index)
+            return self._frames[index]
+
+        data = _read_map_data(self.maps[index])
+        self._frames[index] = data
+        while len(self._frames) > self.cache_size:
+            self._frames.popitem(last=False)
+        return data
+
+    def __getitem__(self, key):
+        """Overriding indexing operation.  If the key results in a single map,
+        then a map object with its data read from disk is returned.
+        Otherwise, a LazyMapCube is returned."""
+
+        if isinstance(self.maps[key], GenericMap):
+            index = range(len(self.maps))[key]
+            new_map = copy(self.maps[index])
+            new_map._data = self._frame_data(index)
+            return new_map
+        else:
+            return LazyMapCube(self.maps[key], sortby=None, cache_size=self.cache_size)
+
+    def as_array(self, filename=None):
+        """
+        If all the map shapes are the same, their image data is read frame by
+        frame into a (ny, nx, nt) ndarray. Masks are not supported.
+        If all the map shapes are not the same, a ValueError is thrown.
+
+        Parameters
+        ----------
+        filename : {str, None}
+            If given, the array is a `numpy.memmap` created at this path
+            rather than being held in memory.
+        """
+        if not self.all_maps_same_shape():
+            raise ValueError('Not all maps have the same shape.')
+
+        shape = self.maps[0]._data.shape + (len(self.maps),)
+        dtype = np.result_type(*[m.dtype for m in self.maps])
+        if filename is None:
+            data = np.empty(shape, dtype=dtype)
+        else:
+            data = np.memmap(filename, dtype=dtype, mode='w+', shape=shape)
+        for i in range(len(self.maps)):
+            data[..., i] = self[i].data
+        return data
@@ -14,6 +14,7 @@ from astropy.io import fits
 
 import sunpy
 import sunpy.map
+import sunpy.io.fits
 import sunpy.data.test
 
 try:
@@ -85,6 +86,34 @@ class TestMap(object):
         pair_map = sunpy.map.Map(data, header)
         assert isinstance(pair_map, sunpy.map.GenericMap)
 
+    def test_lazy(self):
+        lazy_map = sunpy.map.Map(AIA_171_IMAGE, lazy=True)
+        assert isinstance(lazy_map, sunpy.map.sources.AIAMap)
+        assert isinstance(lazy_map._data, sunpy.io.fits.DeferredHDUData)
+        assert lazy_map.dimensions == sunpy.map.Map(AIA_171_IMAGE).dimensions
+        # Accessing the data reads it from disk
+        assert np.all(lazy_map.data == sunpy.map.Map(AIA_171_IMAGE).data)
+        assert isinstance(lazy_map._data, np.ndarray)
+
+    def test_lazy_multiple_hdus(self):
+        # Table HDUs are not read as maps
+        lazy_map = sunpy.map.Map(RHESSI_IMAGE, lazy=True)
+        rhessi_map = sunpy.map.Map(RHESSI_IMAGE)
+        assert isinstance(lazy_map, sunpy.map.sources.RHESSIMap)
+        assert lazy_map.dimensions == rhessi_map.dimensions
+        assert np.all(lazy_map.data == rhessi_map.data)
+
+    def test_parallel(self):
+        maps = sunpy.map.Map(a_list_of_many)
+        parallel_maps = sunpy.map.Map(a_list_of_many, parallel=True, max_workers=2)
+        assert len(maps) == len(parallel_maps)
+        for amap, parallel_map in zip(maps, parallel_maps):
+            assert amap.date == parallel_map.date
+            assert np.all(amap.data == parallel_map.data)
+        # The order of files and data-header pairs is kept
+        pair_map, aia = sunpy.map.Map((maps[0].data, maps[0].meta), AIA_171_IMAGE, parallel=True)
+        assert isinstance(aia, sunpy.map.sources.AIAMap)
+
     # requires sqlalchemy to run properly
     @pytest.mark.skipif('not HAS_SQLALCHEMY')
     def test_databaseentry(self):
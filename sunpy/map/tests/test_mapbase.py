@@ -105,6 +105,30 @@ def test_wcs(aia171_test_map):
     assert set(wcs.wcs.cunit) == set([u.Unit(a) for a in aia171_test_map.spatial_units])
 
 
+def test_wcs_cached(aia171_test_map):
+    wcs = aia171_test_map.wcs
+    frame = aia171_test_map.coordinate_frame
+    assert aia171_test_map.wcs is wcs
+    assert aia171_test_map.coordinate_frame is frame
+    assert aia171_test_map.observer_coordinate is aia171_test_map.observer_coordinate
+
+
+def test_cache_invalidated_by_meta(generic_map):
+    wcs = generic_map.wcs
+    reference = generic_map.reference_coordinate
+    generic_map.meta['crval1'] = 20
+    assert generic_map.wcs is not wcs
+    assert generic_map.wcs.wcs.crval[0] == 20
+    assert generic_map.reference_coordinate.Tx == 20 * u.arcsec
+    assert reference.Tx == 0 * u.arcsec
+
+    dsun = generic_map.dsun
+    generic_map.meta = generic_map.meta.copy()
+    generic_map.meta['dsun_obs'] = 2 * dsun.to(u.m).value
+    assert generic_map.dsun == 2 * dsun
+    assert generic_map.observer_coordinate.radius == 2 * dsun
+
+
 def test_dtype(generic_map):
     assert generic_map.dtype == np.float64
 
@@ -458,6 +482,29 @@ def test_superpixel(aia171_test_map, aia171_test_map_with_mask):
         np.int((aia171_test_map.dimensions[1] / dimensions[1]).value) * u.pix - 1 * u.pix)
 
 
+@pytest.mark.parametrize('func, reduction', [('sum', np.sum), ('mean', np.mean),
+                                             ('max', np.max), ('median', np.median),
+                                             ('nanmean', np.nanmean)])
+def test_superpixel_one_pass(aia171_test_map, func, reduction):
+    data = aia171_test_map.data.astype(float)
+    data[0, 0] = np.nan
+    nan_map = sunpy.map.Map(data, aia171_test_map.meta)
+    superpixel_map = nan_map.superpixel((4, 2) * u.pix, offset=(1, 0) * u.pix, func=func)
+    assert superpixel_map.data.shape == (data.shape[0] // 2, (data.shape[1] - 1) // 4)
+    np.testing.assert_allclose(superpixel_map.data[0, 0], reduction(data[0:2, 1:5]))
+    np.testing.assert_allclose(superpixel_map.data[3, 5], reduction(data[6:8, 21:25]))
+    # The data of the original map is not copied or changed
+    assert np.isnan(nan_map.data[0, 0])
+
+
+def test_superpixel_masked_one_pass(aia171_test_map_with_mask):
+    superpixel_map = aia171_test_map_with_mask.superpixel((2, 2) * u.pix, func='sum')
+    expected = aia171_test_map_with_mask.superpixel((2, 2) * u.pix,
+                                                    func=lambda a, axis: np.sum(a, axis=axis))
+    np.testing.assert_allclose(superpixel_map.data, expected.data)
+    assert np.all(superpixel_map.mask == expected.mask)
+
+
 def calc_new_matrix(angle):
     c = np.cos(np.deg2rad(angle))
     s = np.sin(np.deg2rad(angle))
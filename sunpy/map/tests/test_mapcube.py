@@ -8,6 +8,7 @@ import numpy as np
 import astropy.units as u
 import sunpy
 import sunpy.map
+import sunpy.io.fits
 from sunpy.util.metadata import MetaDict
 import pytest
 import os
@@ -140,6 +141,132 @@ def test_as_array(mapcube_all_the_same,
     assert np.all(np.logical_not(mask[0:2, 0:3, 2]))
 
 
+def test_contiguous(aia_map, masked_aia_map):
+    """Make sure a contiguous mapcube holds views into a single array, and that
+    as_array does not copy it."""
+    cube = sunpy.map.MapCube([masked_aia_map, aia_map], contiguous=True)
+    assert cube._data.shape == (2, 128, 128)
+    assert np.shares_memory(cube[0].data, cube._data)
+    assert np.shares_memory(cube[1].mask, cube._mask)
+    assert np.all(cube[1].data == aia_map.data)
+    # The input maps are not changed
+    assert not np.shares_memory(aia_map.data, cube._data)
+    cube[1].meta['foo'] = 'bar'
+    assert 'foo' not in aia_map.meta
+
+    returned_array = cube.as_array()
+    assert isinstance(returned_array, np.ma.masked_array)
+    assert returned_array.shape == (128, 128, 2)
+    assert np.shares_memory(np.ma.getdata(returned_array), cube._data)
+    assert np.all(returned_array.mask[0:2, 0:3, 0])
+    assert not np.any(returned_array.mask[:, :, 1])
+    assert np.all(returned_array == sunpy.map.MapCube([masked_aia_map, aia_map]).as_array())
+
+    sub_cube = cube[0:1]
+    assert np.shares_memory(sub_cube.as_array(), cube._data)
+
+
+def test_contiguous_memmap(aia_map, tmpdir):
+    filename = str(tmpdir.join("cube.dat"))
+    cube = sunpy.map.MapCube([aia_map, aia_map], contiguous=True, filename=filename)
+    assert isinstance(cube._data, np.memmap)
+    assert np.all(cube.as_array()[..., 1] == aia_map.data)
+
+
+def test_contiguous_different_shapes(mapcube_different):
+    with pytest.raises(ValueError):
+        sunpy.map.MapCube(mapcube_different.maps, contiguous=True)
+
+
+@pytest.fixture
+def lazy_mapcube():
+    """ A `sunpy.map.LazyMapCube` of the test AIA image."""
+    testpath = sunpy.data.test.rootdir
+    aia_file = os.path.join(testpath, "aia_171_level1.fits")
+    return sunpy.map.Map([aia_file, aia_file, aia_file], cube=True, lazy=True)
+
+
+def test_lazy_mapcube(lazy_mapcube, aia_map):
+    assert isinstance(lazy_mapcube, sunpy.map.LazyMapCube)
+    lazy_mapcube.cache_size = 2
+    assert not lazy_mapcube._frames
+    assert np.all(lazy_mapcube[0].data == aia_map.data)
+    assert np.all(lazy_mapcube[-1].data == aia_map.data)
+    assert list(lazy_mapcube._frames.keys()) == [0, 2]
+    lazy_mapcube[1]
+    assert list(lazy_mapcube._frames.keys()) == [2, 1]
+    # The maps held by the cube keep their data on disk
+    assert isinstance(lazy_mapcube.maps[0]._data, sunpy.io.fits.DeferredHDUData)
+    assert isinstance(lazy_mapcube[0:2], sunpy.map.LazyMapCube)
+    assert len(lazy_mapcube.all_meta()) == 3
+
+
+def test_lazy_mapcube_as_array(lazy_mapcube, aia_map, tmpdir):
+    returned_array = lazy_mapcube.as_array()
+    assert returned_array.shape == (128, 128, 3)
+    assert np.all(returned_array[..., 2] == aia_map.data)
+    returned_array = lazy_mapcube.as_array(filename=str(tmpdir.join("cube.dat")))
+    assert isinstance(returned_array, np.memmap)
+    assert np.all(returned_array[..., 1] == aia_map.data)
+
+
+def test_rotate(mapcube_different, aia_map):
+    """Test that rotating a mapcube gives the same maps as rotating each map,
+    with the maps of the same shape sharing the transform."""
+    mapcube = sunpy.map.Map([aia_map, mapcube_different[1], aia_map], cube=True)
+    for max_workers in (None, 2):
+        rotated = mapcube.rotate(scale=[1.0, 2.0, 1.0], missing=-1.0,
+                                 max_workers=max_workers)
+        assert len(rotated) == 3
+        for m, scale, rotated_map in zip(mapcube, [1.0, 2.0, 1.0], rotated):
+            expected = m.rotate(scale=scale, missing=-1.0)
+            np.testing.assert_allclose(rotated_map.data, expected.data)
+            assert rotated_map.meta == expected.meta
+
+
+def test_rotate_lazy(lazy_mapcube, aia_map):
+    """Test that rotating a lazy mapcube does not keep the data of its maps,
+    and that the missing value can be found from the data of each map."""
+    rotated = lazy_mapcube.rotate(scale=2.0, missing=np.min)
+    assert all(isinstance(m._data, sunpy.io.fits.DeferredHDUData) for m in lazy_mapcube.maps)
+    assert not lazy_mapcube._frames
+    np.testing.assert_allclose(rotated[0].data,
+                               aia_map.rotate(scale=2.0, missing=aia_map.min()).data)
+
+
+def test_rotate_contiguous(mapcube_all_the_same):
+    """Test that maps rotated to the same shape share one array."""
+    rotated = mapcube_all_the_same.rotate(scale=2.0, dtype=np.float32)
+    assert rotated._data.shape == (2,) + rotated[0].data.shape
+    assert rotated._data.dtype == np.float32
+    assert np.shares_memory(rotated[1].data, rotated._data)
+    np.testing.assert_allclose(rotated[1].data,
+                               mapcube_all_the_same[1].rotate(scale=2.0).data, rtol=1e-5)
+
+
+@pytest.mark.parametrize('contiguous', [False, True])
+def test_superpixel(aia_map, masked_aia_map, contiguous):
+    """Test that the superpixels of a mapcube are those of each map, found
+    at once for contiguous data."""
+    cube = sunpy.map.MapCube([masked_aia_map, aia_map], sortby=None, contiguous=contiguous)
+    superpixel_cube = cube.superpixel((4, 2) * u.pix, offset=(1, 1) * u.pix, func='nanmax')
+    for m, superpixel_map in zip(cube, superpixel_cube):
+        expected = m.superpixel((4, 2) * u.pix, offset=(1, 1) * u.pix, func=np.max)
+        np.testing.assert_allclose(superpixel_map.data, expected.data)
+        assert superpixel_map.meta == expected.meta
+    assert superpixel_cube[0].mask is not None
+    if contiguous:
+        assert superpixel_cube._data.shape == (2,) + superpixel_cube[0].data.shape
+        assert np.shares_memory(superpixel_cube[1].data, superpixel_cube._data)
+
+
+def test_superpixel_units(mapcube_all_the_same):
+    with pytest.raises(TypeError):
+        mapcube_all_the_same.superpixel((4, 2))
+    with pytest.raises(u.UnitsError):
+        mapcube_all_the_same.superpixel((4, 2) * u.m)
+
+
 def test_all_meta(mapcube_all_the_same):
     """Tests that the correct number of map meta objects are returned, and
     that they are all map meta objects."""
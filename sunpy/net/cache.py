@@ -0,0 +1,249 @@
+"""
+An on-disk cache of the results of searches made with the clients in
+`sunpy.net`.
+
+The results of `~sunpy.net.vso.VSOClient.search`,
+`~sunpy.net.jsoc.JSOCClient.search`, `~sunpy.net.hek.HEKClient.search` and
+`~sunpy.net.dataretriever.client.GenericClient.search`, and so of
+`Fido.search <sunpy.net.fido_factory.UnifiedDownloaderFactory.search>`,
+can be stored in an SQLite database, keyed by the client, the server it
+searches and a canonical form of the query. Repeating a search within the
+lifetime of the cache returns the stored result without going to the network.
+
+The cache is disabled by default. It is configured in the ``[downloads]``
+section of the sunpyrc file, or at run time through the attributes of
+`query_cache`::
+
+    >>> from sunpy.net.cache import query_cache
+    >>> query_cache.ttl = 3600  # doctest: +SKIP
+    >>> query_cache.offline = True  # doctest: +SKIP
+
+Setting ``ttl`` to zero disables the cache. In offline mode searches are
+only answered from the cache, whatever the age of the stored results, and
+raise `NotCachedError` if there are none.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import time
+import pickle
+import logging
+import sqlite3
+import hashlib
+import functools
+
+import sunpy
+from sunpy.net.attr import Attr, AttrAnd, AttrOr, and_
+
+__all__ = ['QueryCache', 'NotCachedError', 'query_cache', 'cached_search']
+
+log = logging.getLogger(__name__)
+
+
+class NotCachedError(Exception):
+    """
+    Raised in offline mode for a search whose result is not in the cache.
+    """
+    pass
+
+
+def _canonical(query):
+    """
+    A representation of an attr tree that does not depend on the order in
+    which the attrs were combined.
+    """
+    if isinstance(query, (AttrAnd, AttrOr)):
+        return (type(query).__name__, tuple(sorted(_canonical(elem) for elem in query.attrs)))
+    if isinstance(query, Attr):
+        cls = type(query)
+        return (cls.__module__ + '.' + cls.__name__,
+                tuple(sorted((k, repr(v)) for k, v in vars(query).items())))
+    return repr(query)
+
+
+def _endpoint(client):
+    """
+    The server that a client sends its searches to.
+    """
+    api = getattr(client, 'api', None)
+    if api is not None:
+        # The suds client of the VSO, set up for one of the mirrors
+        wsdl = getattr(api, 'wsdl', None)
+        options = getattr(api, 'options', None)
+        return (getattr(wsdl, 'url', None),
+                getattr(options, 'location', None),
+                getattr(options, 'port', None))
+    return getattr(client, 'url', None)
+
+
+class QueryCache(object):
+    """
+    A size bounded cache of search results stored in an SQLite database.
+
+    Parameters
+    ----------
+    filename : `str`
+        The database file, created if it does not exist.
+    ttl : `float`
+        The time in seconds for which a result is served from the cache. Zero,
+        the default, disables the cache.
+    max_entries : `int`
+        The number of results kept. The least recently used results are
+        evicted first.
+    offline : `bool`
+        Whether to answer searches from the cache only.
+    """
+    def __init__(self, filename, ttl=0, max_entries=1000, offline=False):
+        self.filename = filename
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.offline = offline
+        self._initialized = False
+
+    @property
+    def enabled(self):
+        return self.offline or self.ttl > 0
+
+    def _connect(self):
+        if not self._initialized:
+            dir_ = os.path.dirname(os.path.abspath(self.filename))
+            if not os.path.isdir(dir_):
+                os.makedirs(dir_)
+        connection = sqlite3.connect(self.filename, timeout=30)
+        if not self._initialized:
+            with connection:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS queries '
+                    '(key TEXT PRIMARY KEY, created REAL, accessed REAL, result BLOB)')
+                connection.execute(
+                    'CREATE INDEX IF NOT EXISTS ix_queries_accessed ON queries (accessed)')
+            self._initialized = True
+        return connection
+
+    @staticmethod
+    def key(client, query, kwargs=None):
+        """
+        The key under which the result of a search is stored.
+
+        Parameters
+        ----------
+        client : `object`
+            The client making the search.
+        query : `sunpy.net.attr.Attr`
+            The query.
+        kwargs : `dict`
+            Any further keyword arguments of the search.
+        """
+        cls = type(client)
+        parts = (cls.__module__ + '.' + cls.__name__,
+                 repr(_endpoint(client)),
+                 _canonical(query),
+                 tuple(sorted((k, repr(v)) for k, v in (kwargs or {}).items())))
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Look up a result.
+
+        Returns
+        -------
+        found : `bool`
+            Whether a result that has not expired is stored under ``key``.
+        result : `object`
+            The result, or `None`.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                row = connection.execute('SELECT created, result FROM queries WHERE key = ?',
+                                         (key,)).fetchone()
+                if row is None:
+                    return False, None
+                now = time.time()
+                if not self.offline and now - row[0] > self.ttl:
+                    connection.execute('DELETE FROM queries WHERE key = ?', (key,))
+                    return False, None
+                connection.execute('UPDATE queries SET accessed = ? WHERE key = ?', (now, key))
+        finally:
+            connection.close()
+        try:
+            return True, pickle.loads(row[1])
+        except Exception:
+            # Stored by an incompatible version of the client
+            return False, None
+
+    def set(self, key, result):
+        """
+        Store a result. Results that can not be pickled are not stored.
+        """
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            log.warning("The search result of type %s can not be pickled, so it is "
+                        "not stored in the query cache: %r", type(result).__name__, e)
+            return
+        now = time.time()
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO queries VALUES (?, ?, ?, ?)',
+                                   (key, now, now, sqlite3.Binary(blob)))
+                connection.execute(
+                    'DELETE FROM queries WHERE key IN (SELECT key FROM queries '
+                    'ORDER BY accessed DESC LIMIT -1 OFFSET ?)', (self.max_entries,))
+        finally:
+            connection.close()
+
+    def clear(self):
+        """
+        Remove all the stored results.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute('DELETE FROM queries')
+        finally:
+            connection.close()
+
+    def __len__(self):
+        connection = self._connect()
+        try:
+            return connection.execute('SELECT COUNT(*) FROM queries').fetchone()[0]
+        finally:
+            connection.close()
+
+
+def _query_cache_from_config(config):
+    return QueryCache(config.get('downloads', 'query_cache'),
+                      ttl=config.getfloat('downloads', 'query_cache_ttl'),
+                      max_entries=config.getint('downloads', 'query_cache_size'),
+                      offline=config.getboolean('downloads', 'offline'))
+
+
+query_cache = _query_cache_from_config(sunpy.config)
+
+
+def cached_search(search):
+    """
+    Decorate the ``search`` method of a client to go through `query_cache`.
+
+    Results that record errors in an ``errors`` attribute are not stored.
+    """
+    @functools.wraps(search)
+    def wrapper(self, *query, **kwargs):
+        if not query_cache.enabled:
+            return search(self, *query, **kwargs)
+
+        key = query_cache.key(self, and_(*query), kwargs)
+        found, result = query_cache.get(key)
+        if found:
+            return result
+        if query_cache.offline:
+            raise NotCachedError("The result of this search is not in the query cache "
+                                 "and sunpy.net is in offline mode.")
+
+        result = search(self, *query, **kwargs)
+        if not getattr(result, 'errors', None):
+            query_cache.set(key, result)
+        return result
+    return wrapper
@@ -32,6 +32,7 @@ from sunpy import config
 from sunpy.util import deprecated
 
 from sunpy.net.download import Downloader, Results
+from sunpy.net.cache import cached_search
 from sunpy.net.vso.attrs import Time, Wavelength, _Range
 
 TIME_FORMAT = config.get("general", "time_format")
@@ -307,6 +308,7 @@ class GenericClient(object):
 
         return paths
 
+    @cached_search
     def search(self, *args, **kwargs):
         """
         Query this client for a list of results.
@@ -9,15 +9,20 @@ from __future__ import absolute_import
 
 import os
 import re
+import asyncio
+import warnings
 import threading
+import http.client
+import urllib.error
+import urllib.parse
+import urllib.request
 
 from functools import partial
-from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import getproxies, proxy_bypass
 from collections import defaultdict, deque
 
 from sunpy.extern import six
-from sunpy.extern.six.moves import urllib
-from sunpy.extern.six import iteritems
 
 import sunpy
 from sunpy.util.progressbar import TTYProgressBar as ProgressBar
@@ -32,64 +37,56 @@ def default_name(path, sock, url):
 
 
 class Downloader(object):
-    def __init__(self, max_conn=5, max_total=20):
+    """
+    Download files over HTTP(S) and FTP in parallel.
+
+    Downloads are scheduled on an `asyncio` event loop running in a
+    background thread. The blocking socket reads run in a thread pool, while
+    the event loop limits the number of concurrent downloads, both per server
+    and in total, and retries failed downloads with an exponential backoff.
+
+    HTTP connections are kept alive and reused for further downloads from the
+    same server, and a download that fails part way through is resumed with a
+    ``Range`` request rather than being restarted.
+
+    Parameters
+    ----------
+    max_conn : `int`
+        The maximum number of concurrent downloads from one server.
+    max_total : `int`
+        The maximum number of concurrent downloads in total.
+    buf : `int`
+        The size in bytes of the chunks the files are streamed to disk in.
+    max_retries : `int`
+        The number of times a download is retried after a connection error,
+        a timeout or a server error before the errback is called.
+    backoff : `float`
+        The delay in seconds before the first retry, doubled for every
+        further retry.
+    timeout : `float`
+        The socket timeout in seconds.
+    """
+    redirect_limit = 5
+
+    def __init__(self, max_conn=5, max_total=20, buf=2**20, max_retries=3,
+                 backoff=1., timeout=60):
         self.max_conn = max_conn
         self.max_total = max_total
-        self.conns = 0
-
-        self.connections = defaultdict(int)  # int() -> 0
-        self.q = defaultdict(deque)
-
-        self.buf = 9096
+        self.buf = buf
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
 
         self.done_lock = threading.Semaphore(0)
         self.mutex = threading.Lock()
 
-    def _start_download(self, url, path, callback, errback):
-        try:
-            server = self._get_server(url)
-
-            with self.mutex:
-                self.connections[server] += 1
-                self.conns += 1
-
-            with closing(urllib.request.urlopen(url)) as sock:
-                fullname = path(sock, url)
-                dir_ = os.path.abspath(os.path.dirname(fullname))
-                if not os.path.exists(dir_):
-                    os.makedirs(dir_)
-
-                with open(fullname, 'wb') as fd:
-                    while True:
-                        rec = sock.read(self.buf)
-                        if not rec:
-                            with self.mutex:
-                                self._close(callback, [{'path': fullname}], server)
-                            break
-                        else:
-                            fd.write(rec)
-        except Exception as e:
-            # TODO: Fix the silent failing
-            if errback is not None:
-                with self.mutex:
-                    self._close(errback, [e], server)
-
-    def _attempt_download(self, url, path, callback, errback):
-        """ Attempt download. If max. connection limit reached, queue for download later.
-        """
-
-        num_connections = self.connections[self._get_server(url)]
-
-        # If max downloads has not been exceeded, begin downloading
-        if num_connections < self.max_conn and self.conns < self.max_total:
-            th = threading.Thread(
-                target=partial(self._start_download, url,
-                               path, callback, errback)
-            )
-            th.daemon = True
-            th.start()
-            return True
-        return False
+        # Idle keep-alive connections by (scheme, netloc)
+        self._connections = defaultdict(deque)
+        self._executor = ThreadPoolExecutor(max_workers=max_total)
+        self._loop = None
+        self._pending = 0
+        self._server_semaphores = {}
+        self._total_semaphore = None
 
     def _get_server(self, url):
         """Returns the server name for a given URL.
@@ -141,11 +138,6 @@ class Downloader(object):
         -------
         out : None
         """
-        # Load balancing?
-        # TODO: explain
-
-        server = self._get_server(url)
-
         # Create function to compute the filepath to download to if not set
 
         if path is None:
@@ -161,30 +153,221 @@ class Downloader(object):
         if errback is None:
             errback = self._default_error_callback
 
-        # Attempt to download file from URL
-        if not self._attempt_download(url, path, callback, errback):
-            # If there are too many concurrent downloads, queue for later
-            self.q[server].append((url, path, callback, errback))
+        with self.mutex:
+            self._pending += 1
+            if self._loop is None:
+                self._start_loop()
+            loop = self._loop
+        asyncio.run_coroutine_threadsafe(
+            self._download(url, path, callback, errback), loop)
 
-    def _close(self, callback, args, server):
-        """ Called after download is done. Activated queued downloads, call callback.
+    def _start_loop(self):
+        """
+        Start a new event loop in a background thread. It is stopped again
+        once all the downloads scheduled on it are finished.
+        """
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        self._server_semaphores = {}
+        self._total_semaphore = None
+
+        def run():
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+        th = threading.Thread(target=run)
+        th.daemon = True
+        th.start()
+
+    def _semaphores(self, url):
         """
-        callback(*args)
-
-        self.connections[server] -= 1
-        self.conns -= 1
-
-        if self.q[server]:
-            self._attempt_download(*self.q[server].pop())
-        else:
-            for k, v in iteritems(self.q):  # pylint: disable=W0612
-                while v:
-                    if self._attempt_download(*v[0]):
-                        v.popleft()
-                        if self.conns == self.max_total:
+        The semaphores limiting the downloads from the server of ``url`` and
+        the total number of downloads. Only called from the event loop.
+        """
+        server = self._get_server(url)
+        if server not in self._server_semaphores:
+            self._server_semaphores[server] = asyncio.Semaphore(self.max_conn)
+        if self._total_semaphore is None:
+            self._total_semaphore = asyncio.Semaphore(self.max_total)
+        return self._server_semaphores[server], self._total_semaphore
+
+    async def _download(self, url, path, callback, errback):
+        loop = asyncio.get_event_loop()
+        # The name of the file is only known once the server has replied, and
+        # is kept here so that a retry can resume the partial download.
+        state = {}
+        try:
+            server_semaphore, total_semaphore = self._semaphores(url)
+            async with server_semaphore, total_semaphore:
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        fullname = await loop.run_in_executor(
+                            self._executor, self._fetch, url, path, state)
+                    except Exception as e:
+                        if attempt == self.max_retries or not self._is_transient(e):
+                            self._call(errback, e, url)
                             return
+                        await asyncio.sleep(self.backoff * 2**attempt)
                     else:
-                        break
+                        self._call(callback, {'path': fullname}, url)
+                        return
+        finally:
+            with self.mutex:
+                self._pending -= 1
+                if not self._pending:
+                    self._loop = None
+                    self._close_connections()
+                    loop.stop()
+
+    @staticmethod
+    def _call(callback, arg, url):
+        try:
+            callback(arg)
+        except Exception as e:
+            warnings.warn("Error in the callback for the download of {0}: {1!r}".format(url, e),
+                          RuntimeWarning)
+
+    @staticmethod
+    def _is_transient(e):
+        """
+        Whether a download that failed with ``e`` is worth retrying.
+        """
+        if isinstance(e, urllib.error.HTTPError):
+            return e.code >= 500 or e.code == 429
+        return isinstance(e, (OSError, http.client.HTTPException))
+
+    def _fetch(self, url, path, state):
+        """
+        Download ``url``, resuming a previous attempt recorded in ``state``,
+        and return the name of the file written. Runs in the thread pool.
+        """
+        split = urllib.parse.urlsplit(url)
+        if split.scheme not in ('http', 'https') or self._use_proxy(split):
+            return self._fetch_urllib(url, path, state)
+
+        for _ in range(self.redirect_limit + 1):
+            split = urllib.parse.urlsplit(url)
+            key = (split.scheme, split.netloc)
+            conn, reused = self._get_connection(*key)
+            headers = {}
+            partial_name = state.get('partial')
+            if partial_name is not None and os.path.exists(partial_name):
+                headers['Range'] = 'bytes={}-'.format(os.path.getsize(partial_name))
+            target = split.path or '/'
+            if split.query:
+                target += '?' + split.query
+            try:
+                try:
+                    conn.request('GET', target, headers=headers)
+                    response = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionError):
+                    # The server has closed an idle connection, so try again
+                    # on a new one
+                    if not reused:
+                        raise
+                    conn.close()
+                    conn, reused = self._get_connection(*key, reuse=False)
+                    conn.request('GET', target, headers=headers)
+                    response = conn.getresponse()
+                if response.status in (301, 302, 303, 307, 308):
+                    response.read()
+                    url = urllib.parse.urljoin(url, response.headers['Location'])
+                elif response.status == 416 and 'Range' in headers:
+                    # The partial file already holds the whole of the file
+                    response.read()
+                    return self._finish(state)
+                elif response.status >= 400:
+                    raise urllib.error.HTTPError(url, response.status, response.reason,
+                                                 response.headers, None)
+                else:
+                    fullname = self._write(response, path, url, state,
+                                           append=response.status == 206)
+                    if response.will_close:
+                        conn.close()
+                    else:
+                        self._release_connection(key, conn)
+                    return fullname
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._release_connection(key, conn)
+            except Exception:
+                conn.close()
+                raise
+        raise urllib.error.HTTPError(url, 310, "Too many redirects", {}, None)
+
+    def _fetch_urllib(self, url, path, state):
+        """
+        Download ``url`` through `urllib`, which handles FTP and proxies but
+        neither resumes downloads nor keeps connections alive.
+        """
+        with urllib.request.urlopen(url, timeout=self.timeout) as sock:
+            return self._write(sock, path, url, state, append=False)
+
+    def _write(self, sock, path, url, state, append):
+        """
+        Stream the body of the response ``sock`` to disk.
+        """
+        if 'fullname' not in state:
+            state['fullname'] = path(sock, url)
+            state['partial'] = state['fullname'] + '.part'
+            dir_ = os.path.abspath(os.path.dirname(state['fullname']))
+            if not os.path.exists(dir_):
+                os.makedirs(dir_)
+
+        received = 0
+        with open(state['partial'], 'ab' if append else 'wb') as fd:
+            while True:
+                rec = sock.read(self.buf)
+                if not rec:
+                    break
+                fd.write(rec)
+                received += len(rec)
+
+        # http.client does not complain when the connection is closed
+        # before the whole of the body has been received
+        length = sock.headers.get('Content-Length')
+        if length is not None and received < int(length):
+            raise http.client.IncompleteRead(b'', int(length) - received)
+        return self._finish(state)
+
+    @staticmethod
+    def _finish(state):
+        os.replace(state['partial'], state['fullname'])
+        return state['fullname']
+
+    def _use_proxy(self, split):
+        return split.scheme in getproxies() and not proxy_bypass(split.hostname or '')
+
+    def _get_connection(self, scheme, netloc, reuse=True):
+        """
+        Return a connection to ``netloc``, and whether it is an idle one
+        being reused.
+        """
+        if reuse:
+            with self.mutex:
+                idle = self._connections[(scheme, netloc)]
+                if idle:
+                    return idle.pop(), True
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout), False
+        return http.client.HTTPConnection(netloc, timeout=self.timeout), False
+
+    def _release_connection(self, key, conn):
+        with self.mutex:
+            idle = self._connections[key]
+            if len(idle) < self.max_conn:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _close_connections(self):
+        for idle in self._connections.values():
+            while idle:
+                idle.pop().close()
 
 
 class Results(object):
@@ -16,6 +16,7 @@ import codecs
 from itertools import chain
 from datetime import datetime
 from sunpy.net import attr
+from sunpy.net.cache import cached_search
 from sunpy.net.hek import attrs
 from sunpy.net.vso import attrs as v_attrs
 from sunpy.util import unique
@@ -77,6 +78,7 @@ class HEKClient(object):
                 return list(map(Response, results))
             page += 1
 
+    @cached_search
     def search(self, *query):
         """ Retrieves information about HEK records matching the criteria
         given in the query expression. If multiple arguments are passed,
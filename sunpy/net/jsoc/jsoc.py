@@ -18,6 +18,7 @@ import drms
 from sunpy import config
 from sunpy.net.download import Downloader, Results
 from sunpy.net.attr import and_
+from sunpy.net.cache import cached_search
 from sunpy.net.jsoc.attrs import walker
 from sunpy.extern.six.moves import urllib
 from sunpy.extern import six
@@ -226,6 +227,7 @@ class JSOCClient(object):
 
     """
 
+    @cached_search
     def search(self, *query, **kwargs):
         """
         Build a JSOC query and submit it to JSOC for processing.
@@ -0,0 +1,106 @@
+from __future__ import absolute_import
+
+import logging
+
+import pytest
+
+from sunpy.net import cache
+from sunpy.net.cache import QueryCache, NotCachedError, cached_search
+from sunpy.net.vso import attrs as va
+
+
+class CountingClient(object):
+    url = 'http://example.com'
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached_search
+    def search(self, *query, **kwargs):
+        self.calls += 1
+        return [self.calls]
+
+
+@pytest.fixture
+def query_cache(tmpdir, monkeypatch):
+    qc = QueryCache(str(tmpdir.join('cache.sqlite')), ttl=3600, max_entries=2)
+    monkeypatch.setattr(cache, 'query_cache', qc)
+    return qc
+
+
+def test_key_is_canonical():
+    client = CountingClient()
+    time = va.Time('2012/3/4', '2012/3/6')
+    key = QueryCache.key(client, time & va.Instrument('aia'))
+    assert key == QueryCache.key(client, va.Instrument('aia') & time)
+    assert key != QueryCache.key(client, va.Instrument('eit') & time)
+    assert key != QueryCache.key(client, time & va.Instrument('aia'), {'page': 2})
+
+
+def test_key_includes_endpoint():
+    query = va.Instrument('aia')
+    client, other = CountingClient(), CountingClient()
+    other.url = 'http://example.org'
+    assert QueryCache.key(client, query) != QueryCache.key(other, query)
+
+
+def test_disabled_by_default():
+    assert not QueryCache('cache.sqlite').enabled
+
+
+def test_cached_search(query_cache):
+    client = CountingClient()
+    query = (va.Time('2012/3/4', '2012/3/6'), va.Instrument('aia'))
+    assert client.search(*query) == [1]
+    assert client.search(*query[::-1]) == [1]
+    assert client.calls == 1
+    assert client.search(va.Instrument('eit')) == [2]
+    assert len(query_cache) == 2
+
+
+def test_ttl(query_cache):
+    client = CountingClient()
+    client.search(va.Instrument('aia'))
+    query_cache.ttl = 0
+    assert not query_cache.enabled
+    client.search(va.Instrument('aia'))
+    assert client.calls == 2
+    query_cache.ttl = 1e-9
+    client.search(va.Instrument('aia'))
+    assert client.calls == 3
+
+
+def test_eviction(query_cache):
+    client = CountingClient()
+    for instrument in ['aia', 'eit', 'lasco']:
+        client.search(va.Instrument(instrument))
+    assert len(query_cache) == 2
+    client.search(va.Instrument('aia'))
+    assert client.calls == 4
+
+
+def test_unpicklable_result(query_cache, caplog):
+    class UnpicklableClient(CountingClient):
+        @cached_search
+        def search(self, *query, **kwargs):
+            self.calls += 1
+            return [lambda: self.calls]
+
+    client = UnpicklableClient()
+    with caplog.at_level(logging.WARNING, logger='sunpy.net.cache'):
+        client.search(va.Instrument('aia'))
+    assert 'can not be pickled' in caplog.text
+    assert len(query_cache) == 0
+    client.search(va.Instrument('aia'))
+    assert client.calls == 2
+
+
+def test_offline(query_cache):
+    client = CountingClient()
+    client.search(va.Instrument('aia'))
+    query_cache.offline = True
+    query_cache.ttl = 0
+    assert client.search(va.Instrument('aia')) == [1]
+    with pytest.raises(NotCachedError):
+        client.search(va.Instrument('eit'))
+    assert client.calls == 1
@@ -12,6 +12,7 @@ import tempfile
 import threading
 
 from functools import partial
+from http.server import HTTPServer, BaseHTTPRequestHandler
 
 import sunpy
 
@@ -168,3 +169,54 @@ def test_download_dir():
     assert not timeout.fired
     assert not errback.fired
     assert os.path.exists(os.path.join(tmpdir, 'jquery.min.js'))
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """
+    Serves ``content``, dropping the connection half way through the first
+    response and honouring ``Range`` requests afterwards.
+    """
+    protocol_version = 'HTTP/1.1'
+    content = os.urandom(100000)
+    requests = []
+
+    def do_GET(self):
+        FlakyHandler.requests.append(self.headers.get('Range'))
+        start = 0
+        if self.headers.get('Range'):
+            start = int(self.headers['Range'][len('bytes='):-1])
+        body = self.content[start:]
+        self.send_response(206 if start else 200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if len(FlakyHandler.requests) == 1:
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_download_resume(tmpdir):
+    FlakyHandler.requests = []
+    server = HTTPServer(('127.0.0.1', 0), FlakyHandler)
+    th = threading.Thread(target=server.serve_forever)
+    th.daemon = True
+    th.start()
+    try:
+        items = []
+        dw = Downloader(1, 1, backoff=0)
+        on_finish = lambda item: (items.append(item), dw.stop())
+        url = 'http://127.0.0.1:{}/flaky.bin'.format(server.server_address[1])
+        dw.download(url, str(tmpdir), on_finish, on_finish)
+        dw.wait()
+    finally:
+        server.shutdown()
+
+    assert items == [{'path': os.path.join(str(tmpdir), 'flaky.bin')}]
+    with open(items[0]['path'], 'rb') as fd:
+        assert fd.read() == FlakyHandler.content
+    # The retry asked for the remaining half of the file only
+    assert FlakyHandler.requests == [None, 'bytes=50000-']
@@ -3,8 +3,10 @@ import datetime
 from copy import deepcopy
 import warnings
 from itertools import product
+from collections import OrderedDict
 
 import numpy as np
+from scipy.interpolate import RegularGridInterpolator
 from skimage import transform
 from astropy import units as u
 from astropy.coordinates import SkyCoord, Longitude
@@ -16,6 +18,11 @@ from sunpy.image.util import to_norm, un_norm
 
 __all__ = ['diff_rot', 'solar_rotate_coordinate', 'diffrot_map']
 
+# Inverse mappings calculated on a control grid by `_warp_sun_coordinates`,
+# keyed by the geometry of the map and the rotation applied to it.
+_warp_cache = OrderedDict()
+_WARP_CACHE_SIZE = 4
+
 
 @u.quantity_input(duration=u.s, latitude=u.degree)
 def diff_rot(duration, latitude, rot_type='howard', frame_time='sidereal'):
@@ -170,42 +177,15 @@ def solar_rotate_coordinate(coordinate,
     return heliographic_rotated.transform_to(coordinate.frame.name)
 
 
-@u.quantity_input(dt=u.s)
-def _warp_sun_coordinates(xy, smap, dt, **diffrot_kwargs):
+def _rotate_pixels(smap, x, y, rotated_time, **diffrot_kwargs):
     """
-    Function that returns a new list of coordinates for each input coord.
-    This is an inverse function needed by the scikit-image `transform.warp`
-    function.
-
-    Parameters
-    ----------
-    xy : `numpy.ndarray`
-        Array from `transform.warp`
-    smap : `~sunpy.map`
-        Original map that we want to transform
-    dt : `~astropy.units.Quantity`
-        Desired interval to rotate the input map by solar differential rotation.
-
-    Returns
-    -------
-    xy2 : `~numpy.ndarray`
-        Array with the inverse transformation
+    Calculate the pixel positions in ``smap`` that the pixels (x, y) of a map
+    at ``rotated_time`` rotate from.  Pixels that are off the disk or rotate
+    from the far side of the Sun are NaN.
     """
-    # NOTE: The time is being subtracted - this is because this function
-    # calculates the inverse of the transformation.
-    rotated_time = smap.date - datetime.timedelta(seconds=dt.to(u.s).value)
-
-    # Calculate the hpc coords
-    x = np.arange(0, smap.dimensions.x.value)
-    y = np.arange(0, smap.dimensions.y.value)
-    xx, yy = np.meshgrid(x, y)
-    # the xy input array would have the following shape
-    # xy = np.dstack([xx.T.flat, yy.T.flat])[0]
-
-    # We start by converting the pixel to world
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')
-        hpc_coords = smap.pixel_to_world(xx * u.pix, yy * u.pix)
+        hpc_coords = smap.pixel_to_world(x * u.pix, y * u.pix)
 
         # then diff-rotate the hpc coordinates to the desired time
         rotated_coord = solar_rotate_coordinate(hpc_coords, rotated_time, **diffrot_kwargs)
@@ -227,15 +207,122 @@ def _warp_sun_coordinates(xy, smap, dt, **diffrot_kwargs):
         # Go back to pixel co-ordinates
         x2, y2 = smap.world_to_pixel(rotated_coord)
 
+    return x2.value, y2.value
+
+
+def _near_disk(smap, x, y):
+    """
+    Find which of the pixels (x, y) of a map are on the solar disk, or within
+    one pixel of the limb.
+    """
+    lon, lat = smap.wcs.wcs_pix2world(x, y, 0)
+    distance = np.arccos(np.cos(np.deg2rad(lon)) * np.cos(np.deg2rad(lat)))
+    limb = np.arcsin((smap.rsun_meters / smap.dsun).decompose().value)
+    margin = np.max(np.abs(u.Quantity(smap.scale).to(u.rad / u.pix).value))
+    return distance <= limb + margin
+
+
+def _rotate_pixels_on_grid(smap, grid_step, rotated_time, **diffrot_kwargs):
+    """
+    Calculate the same mapping as `_rotate_pixels` for every pixel of the map,
+    by evaluating it on a control grid of every ``grid_step`` pixels and
+    interpolating between the grid points.  Pixels in grid cells that touch
+    the limb or the far side of the Sun are evaluated exactly.
+    """
+    nx = int(smap.dimensions.x.value)
+    ny = int(smap.dimensions.y.value)
+    x_grid = np.unique(np.append(np.arange(0, nx, grid_step), nx - 1))
+    y_grid = np.unique(np.append(np.arange(0, ny, grid_step), ny - 1))
+    xx_grid, yy_grid = np.meshgrid(x_grid, y_grid)
+    x2_grid, y2_grid = _rotate_pixels(smap, xx_grid, yy_grid, rotated_time, **diffrot_kwargs)
+
+    xx, yy = np.meshgrid(np.arange(nx), np.arange(ny))
+    points = np.stack([yy, xx], axis=-1)
+    x2 = RegularGridInterpolator((y_grid, x_grid), x2_grid)(points)
+    y2 = RegularGridInterpolator((y_grid, x_grid), y2_grid)(points)
+
+    # Pixels in cells with a NaN corner are NaN after the interpolation.  Of
+    # these only the ones near the disk can have a finite exact value.
+    exact = np.logical_or(np.isnan(x2), np.isnan(y2))
+    exact[exact] = _near_disk(smap, xx[exact], yy[exact])
+    if np.any(exact):
+        x2[exact], y2[exact] = _rotate_pixels(smap, xx[exact], yy[exact], rotated_time,
+                                              **diffrot_kwargs)
+    return x2, y2
+
+
+def _warp_cache_key(smap, dt, grid_step, diffrot_kwargs):
+    """
+    A key identifying the inverse mapping calculated by
+    `_warp_sun_coordinates`.
+    """
+    observer = smap.observer_coordinate
+    return (smap.wcs.to_header_string(),
+            tuple(u.Quantity(smap.dimensions).value),
+            observer.lon.to(u.deg).value, observer.lat.to(u.deg).value,
+            observer.radius.to(u.m).value, smap.rsun_meters.to(u.m).value,
+            dt.to(u.s).value, grid_step, tuple(sorted(diffrot_kwargs.items())))
+
+
+@u.quantity_input(dt=u.s)
+def _warp_sun_coordinates(xy, smap, dt, grid_step=None, **diffrot_kwargs):
+    """
+    Function that returns a new list of coordinates for each input coord.
+    This is an inverse function needed by the scikit-image `transform.warp`
+    function.
+
+    Parameters
+    ----------
+    xy : `numpy.ndarray`
+        Array from `transform.warp`
+    smap : `~sunpy.map`
+        Original map that we want to transform
+    dt : `~astropy.units.Quantity`
+        Desired interval to rotate the input map by solar differential rotation.
+    grid_step : `int`
+        If given, the transformation is evaluated on a control grid of every
+        ``grid_step`` pixels and interpolated, and the result is cached.
+
+    Returns
+    -------
+    xy2 : `~numpy.ndarray`
+        Array with the inverse transformation
+    """
+    if grid_step is not None:
+        key = _warp_cache_key(smap, dt, grid_step, diffrot_kwargs)
+        if key in _warp_cache:
+            _warp_cache.move_to_end(key)
+            return _warp_cache[key]
+
+    # NOTE: The time is being subtracted - this is because this function
+    # calculates the inverse of the transformation.
+    rotated_time = smap.date - datetime.timedelta(seconds=dt.to(u.s).value)
+
+    if grid_step is None:
+        # Calculate the hpc coords
+        x = np.arange(0, smap.dimensions.x.value)
+        y = np.arange(0, smap.dimensions.y.value)
+        xx, yy = np.meshgrid(x, y)
+        # the xy input array would have the following shape
+        # xy = np.dstack([xx.T.flat, yy.T.flat])[0]
+        x2, y2 = _rotate_pixels(smap, xx, yy, rotated_time, **diffrot_kwargs)
+    else:
+        x2, y2 = _rotate_pixels_on_grid(smap, grid_step, rotated_time, **diffrot_kwargs)
+
     # Re-stack the data to make it correct output form
-    xy2 = np.dstack([x2.T.value.flat, y2.T.value.flat])[0]
+    xy2 = np.dstack([x2.T.flat, y2.T.flat])[0]
     # Returned a masked array with the non-finite entries masked.
     xy2 = np.ma.array(xy2, mask=np.isnan(xy2))
+
+    if grid_step is not None:
+        _warp_cache[key] = xy2
+        while len(_warp_cache) > _WARP_CACHE_SIZE:
+            _warp_cache.popitem(last=False)
     return xy2
 
 
 @u.quantity_input(dt='time')
-def diffrot_map(smap, time=None, dt=None, pad=False, **diffrot_kwargs):
+def diffrot_map(smap, time=None, dt=None, pad=False, grid_step=None, **diffrot_kwargs):
     """
     Function to apply solar differential rotation to a sunpy map.
 
@@ -249,6 +336,12 @@ def diffrot_map(smap, time=None, dt=None, pad=False, **diffrot_kwargs):
         Desired interval between the input map and returned map.
     pad : `bool`
         Whether to create a padded map for submaps to don't loose data
+    grid_step : `int`
+        If given, the rotation is calculated on a grid of every ``grid_step``
+        pixels and interpolated for the pixels in between, which is much
+        faster for large maps.  Pixels near the limb are still calculated
+        exactly.  The result is cached, so that rotating further maps with the
+        same pointing, observer, date and interval reuses it.
 
     Returns
     -------
@@ -301,7 +394,7 @@ def diffrot_map(smap, time=None, dt=None, pad=False, **diffrot_kwargs):
             smap_meta['crpix2'] += deltay
             smap = sunpy.map.Map(smap_data, smap_meta)
 
-    warp_args = {'smap': smap, 'dt': dt}
+    warp_args = {'smap': smap, 'dt': dt, 'grid_step': grid_step}
     warp_args.update(diffrot_kwargs)
     # Apply solar differential rotation as a scikit-image warp
     out = transform.warp(to_norm(smap_data), inverse_map=_warp_sun_coordinates,
@@ -12,6 +12,7 @@ from astropy.tests.helper import assert_quantity_allclose
 
 from sunpy.coordinates import frames
 from sunpy.coordinates.ephemeris import get_earth
+from sunpy.physics import differential_rotation
 from sunpy.physics.differential_rotation import diff_rot, solar_rotate_coordinate, diffrot_map
 from sunpy.time import parse_time
 import sunpy.data.test
@@ -149,6 +150,28 @@ def test_diffrot_map(aia171_test_map):
     assert (aia171_test_map.date - timedelta(days=5)) - aia_srot.date < timedelta(seconds=1)
 
 
+def test_diffrot_map_grid_step(aia171_test_map):
+    differential_rotation._warp_cache.clear()
+    aia_srot = diffrot_map(aia171_test_map, dt=-5 * u.day)
+    aia_srot_grid = diffrot_map(aia171_test_map, dt=-5 * u.day, grid_step=8)
+    assert aia_srot_grid.dimensions == aia_srot.dimensions
+    assert aia_srot_grid.date == aia_srot.date
+    # The interpolated mapping only differs from the exact one well below a
+    # pixel, so the rotated images agree closely away from the limb
+    on_disk = np.isfinite(aia_srot.data) & np.isfinite(aia_srot_grid.data)
+    assert on_disk.sum() > 0.9 * np.isfinite(aia_srot.data).sum()
+    diff = np.abs(aia_srot_grid.data[on_disk] - aia_srot.data[on_disk])
+    assert np.median(diff) < 0.01 * np.abs(aia_srot.data[on_disk]).max()
+
+    # The inverse mapping is cached and reused for the same rotation
+    assert len(differential_rotation._warp_cache) == 1
+    aia_srot_cached = diffrot_map(aia171_test_map, dt=-5 * u.day, grid_step=8)
+    assert len(differential_rotation._warp_cache) == 1
+    np.testing.assert_array_equal(aia_srot_cached.data, aia_srot_grid.data)
+    diffrot_map(aia171_test_map, dt=-4 * u.day, grid_step=8)
+    assert len(differential_rotation._warp_cache) == 2
+
+
 def test_diffrot_submap(aia171_test_submap):
     # Test a submap without padding
     aia_srot = diffrot_map(aia171_test_submap, '2011-02-14T12:00:00')
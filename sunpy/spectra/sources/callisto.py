@@ -16,6 +16,7 @@ from scipy.optimize import leastsq
 from scipy.ndimage import gaussian_filter1d
 
 from sunpy.time import parse_time
+from sunpy.io.fits import DeferredHDUData
 from sunpy.util import minimal_pairs, deprecated
 from sunpy.util.cond_dispatch import ConditionalDispatch, run_cls
 from sunpy.util.net import download_file
@@ -120,6 +121,23 @@ def _parse_header_time(date, time):
     return parse_time(date)
 
 
+class _DeferredTranspose(object):
+    """Placeholder for the transpose of deferred data, read on demand."""
+    def __init__(self, deferred):
+        self.deferred = deferred
+        self.shape = deferred.shape[::-1]
+        self.dtype = deferred.dtype
+
+    def load(self):
+        return self.deferred.load().transpose()
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.load(), dtype=dtype)
+
+    def __getitem__(self, item):
+        return self.load()[item]
+
+
 class CallistoSpectrogram(LinearTimeSpectrogram):
     """ Class used for dynamic spectra coming from the Callisto network.
 
@@ -194,20 +212,28 @@ class CallistoSpectrogram(LinearTimeSpectrogram):
         return header
 
     @classmethod
-    def read(cls, filename, **kwargs):
+    def read(cls, filename, lazy=False, **kwargs):
         """Reads in FITS file and return a new CallistoSpectrogram.
-        Any unknown (i.e. any except filename) keyword arguments get
+        Any unknown (i.e. any except filename and lazy) keyword arguments get
         passed to fits.open.
 
         Parameters
         ----------
         filename : str
             path of the file to read
+        lazy : bool
+            If True, only read the headers and the axes of the file. The data
+            is then only a placeholder that is read from disk when needed,
+            which is what `~sunpy.spectra.spectrogram.LinearTimeSpectrogram.join_many`
+            does when copying it into the joined spectrogram.
         """
         fl = fits.open(filename, **kwargs)
-        data = fl[0].data
         axes = fl[1]
         header = fl[0].header
+        if lazy:
+            data = DeferredHDUData(filename, 0, header, kwargs.get('memmap'))
+        else:
+            data = fl[0].data
 
         start = _parse_header_time(
             header['DATE-OBS'], header.get('TIME-OBS', header.get('TIME$_OBS'))
@@ -227,7 +253,10 @@ class CallistoSpectrogram(LinearTimeSpectrogram):
             f_delt = header["CDELT1"]
             f_init = header["CRVAL1"] - t_delt * header["CRPIX1"]
             f_label = header["CTYPE1"]
-            data = data.transpose()
+            if lazy:
+                data = _DeferredTranspose(data)
+            else:
+                data = data.transpose()
         else:
             t_delt = header["CDELT1"]
             t_init = header["CRVAL1"] - t_delt * header["CRPIX1"]
@@ -267,6 +296,13 @@ class CallistoSpectrogram(LinearTimeSpectrogram):
         content = header["CONTENT"]
         instruments = set([header["INSTRUME"]])
 
+        if lazy:
+            # The data is read from the file again when needed, so copy the
+            # axes out of it and close it.
+            time_axis = np.array(time_axis)
+            freq_axis = np.array(freq_axis)
+            fl.close()
+
         return cls(
             data, time_axis, freq_axis, start, end, t_init, t_delt,
             t_label, f_label, content, instruments,
@@ -313,7 +349,7 @@ class CallistoSpectrogram(LinearTimeSpectrogram):
         return self[left-1:right+2, :]
 
     @classmethod
-    def read_many(cls, filenames, sort_by=None):
+    def read_many(cls, filenames, sort_by=None, lazy=False):
         """Returns a list of CallistoSpectrogram objects read from filenames.
 
         Parameters
@@ -323,8 +359,10 @@ class CallistoSpectrogram(LinearTimeSpectrogram):
         sort_by : str
             optional attribute of the resulting objects to sort from, e.g.
             start to sort by starting time.
+        lazy : bool
+            If True, only read the headers and axes of the files, see `read`.
         """
-        objs = list(map(cls.read, filenames))
+        objs = [cls.read(filename, lazy=lazy) for filename in filenames]
         if sort_by is not None:
             objs.sort(key=lambda x: getattr(x, sort_by))
         return objs
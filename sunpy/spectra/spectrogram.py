@@ -9,6 +9,7 @@ import datetime
 from random import randint
 from copy import copy
 from math import floor
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from numpy import ma
@@ -21,7 +22,7 @@ from matplotlib.ticker import FuncFormatter, MaxNLocator, IndexLocator
 from matplotlib.colorbar import Colorbar
 
 from sunpy.time import parse_time, get_day
-from sunpy.util import to_signed, common_base, merge
+from sunpy.util import common_base, merge
 from sunpy.util.cond_dispatch import ConditionalDispatch
 from sunpy.util.create import Parent
 from sunpy.spectra.spectrum import Spectrum
@@ -77,6 +78,37 @@ def _list_formatter(lst, fun=None):
     return _fun
 
 
+def _map_chunks(function, n, chunk_size, max_workers):
+    """Call function(start, stop) on consecutive chunks of chunk_size out of
+    n items, optionally using a pool of threads, and return the results in
+    order."""
+    chunks = [(start, min(start + chunk_size, n))
+              for start in range(0, n, chunk_size)]
+    if max_workers is None:
+        return [function(start, stop) for start, stop in chunks]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda chunk: function(*chunk), chunks))
+
+
+def _resampled_size(spec, new_delt):
+    """Number of columns spec has once resampled to new_delt seconds
+    between pixels, worked out without touching its data."""
+    if spec.t_delt == new_delt:
+        return spec.shape[1]
+    factor = spec.t_delt / float(new_delt)
+    # The last data-point does not change!
+    return floor((spec.shape[1] - 1) * factor + 1)
+
+
+def _load(spec):
+    """Return spec with its data read in, if its data is a placeholder
+    that is only read from disk on demand."""
+    if hasattr(spec.data, 'load'):
+        return spec._with_data(spec.data.load())
+    return spec
+
+
 def _union(sets):
     """Returns a union of sets."""
     union = set()
@@ -641,42 +673,98 @@ class Spectrogram(Parent):
 
         return self[left:right + 1, :]
 
-    def auto_find_background(self, amount=0.05):
+    def _channel_averages(self, chunk_size, max_workers):
+        """Average value in every frequency channel, accumulated over
+        chunks of chunk_size points of time."""
+        def _sums(start, stop):
+            chunk = self.data[:, start:stop]
+            return np.sum(chunk, 1, dtype=np.float64), np.ma.count(chunk, 1)
+
+        sums, counts = zip(
+            *_map_chunks(_sums, self.shape[1], chunk_size, max_workers)
+        )
+        return np.sum(sums, 0) / np.sum(counts, 0)
+
+    def _time_sdevs(self, averages, cols, chunk_size, max_workers):
+        """Standard deviation over the frequency channels at every point of
+        time in cols (all of them if None), after subtracting the average of
+        every channel."""
+        averages = averages.reshape(self.shape[0], 1)
+
+        def _sdevs(start, stop):
+            if cols is None:
+                chunk = self.data[:, start:stop]
+            else:
+                chunk = self.data[:, cols[start:stop]]
+            # Need to convert because otherwise this class's __getitem__
+            # is used which assumes two-dimensionality.
+            return np.asarray(np.std(chunk - averages, 0))
+
+        return np.concatenate(
+            _map_chunks(_sdevs, self.shape[1] if cols is None else len(cols),
+                        chunk_size, max_workers)
+        )
+
+    def auto_find_background(self, amount=0.05, chunk_size=4096,
+                             max_workers=None):
         """Automatically find the background. This
         is done by first subtracting the average value in each channel and then
         finding those times which have the lowest standard deviation.
 
+        The data is only ever read chunk_size points of time at a time, so
+        this also works on memory mapped spectrograms that do not fit into
+        memory.
+
         Parameters
         ----------
         amount : float
             The percent amount (out of 1) of lowest standard deviation to
             consider.
+        chunk_size : int
+            Number of points of time to process at once.
+        max_workers : int or None
+            If given, process the chunks in a pool of this many threads.
         """
-        # pylint: disable=E1101,E1103
-        data = self.data.astype(to_signed(self.dtype))
-        # Subtract average value from every frequency channel.
-        tmp = (data - np.average(self.data, 1).reshape(self.shape[0], 1))
-        # Get standard deviation at every point of time.
-        # Need to convert because otherwise this class's __getitem__
-        # is used which assumes two-dimensionality.
-        sdevs = np.asarray(np.std(tmp, 0))
+        averages = self._channel_averages(chunk_size, max_workers)
+        sdevs = self._time_sdevs(averages, None, chunk_size, max_workers)
 
         # Get indices of values with lowest standard deviation.
-        cand = sorted(range(self.shape[1]), key=lambda y: sdevs[y])
+        cand = np.argsort(sdevs, kind='mergesort')
         # Only consider the best 5 %.
-        return cand[:max(1, int(amount * len(cand)))]
+        return cand[:max(1, int(amount * len(cand)))].tolist()
 
-    def auto_const_bg(self):
-        """Automatically determine background."""
-        realcand = self.auto_find_background()
+    def auto_const_bg(self, chunk_size=4096, max_workers=None):
+        """Automatically determine background.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Number of points of time to process at once.
+        max_workers : int or None
+            If given, process the chunks in a pool of this many threads.
+        """
+        realcand = self.auto_find_background(
+            chunk_size=chunk_size, max_workers=max_workers
+        )
         bg = np.average(self.data[:, realcand], 1)
         return bg.reshape(self.shape[0], 1)
 
-    def subtract_bg(self):
-        """Perform constant background subtraction."""
-        return self._with_data(self.data - self.auto_const_bg())
+    def subtract_bg(self, chunk_size=4096, max_workers=None):
+        """Perform constant background subtraction.
 
-    def randomized_auto_const_bg(self, amount):
+        Parameters
+        ----------
+        chunk_size : int
+            Number of points of time to process at once.
+        max_workers : int or None
+            If given, process the chunks in a pool of this many threads.
+        """
+        return self._with_data(
+            self.data - self.auto_const_bg(chunk_size, max_workers)
+        )
+
+    def randomized_auto_const_bg(self, amount, chunk_size=4096,
+                                 max_workers=None):
         """Automatically determine background. Only consider a randomly
         chosen subset of the image.
 
@@ -685,30 +773,30 @@ class Spectrogram(Parent):
         amount : int
             Size of random sample that is considered for calculation of
             the background.
+        chunk_size : int
+            Number of points of time to process at once.
+        max_workers : int or None
+            If given, process the chunks in a pool of this many threads.
         """
-        cols = [randint(0, self.shape[1] - 1) for _ in range(amount)]
-
-        # pylint: disable=E1101,E1103
-        data = self.data.astype(to_signed(self.dtype))
-        # Subtract average value from every frequency channel.
-        tmp = (data - np.average(self.data, 1).reshape(self.shape[0], 1))
-        # Get standard deviation at every point of time.
-        # Need to convert because otherwise this class's __getitem__
-        # is used which assumes two-dimensionality.
-        tmp = tmp[:, cols]
-        sdevs = np.asarray(np.std(tmp, 0))
+        cols = np.array([randint(0, self.shape[1] - 1) for _ in range(amount)])
+
+        averages = self._channel_averages(chunk_size, max_workers)
+        # Only the standard deviations of the sampled points of time are
+        # needed.
+        sdevs = self._time_sdevs(averages, cols, chunk_size, max_workers)
 
         # Get indices of values with lowest standard deviation.
-        cand = sorted(range(amount), key=lambda y: sdevs[y])
+        cand = np.argsort(sdevs, kind='mergesort')
         # Only consider the best 5 %.
         realcand = cand[:max(1, int(0.05 * len(cand)))]
 
         # Average the best 5 %
-        bg = np.average(self[:, [cols[r] for r in realcand]], 1)
+        bg = np.average(self[:, cols[realcand].tolist()], 1)
 
         return bg.reshape(self.shape[0], 1)
 
-    def randomized_subtract_bg(self, amount):
+    def randomized_subtract_bg(self, amount, chunk_size=4096,
+                               max_workers=None):
         """Perform randomized constant background subtraction.
         Does not produce the same result every time it is run.
 
@@ -717,8 +805,14 @@ class Spectrogram(Parent):
         amount : int
             Size of random sample that is considered for calculation of
             the background.
+        chunk_size : int
+            Number of points of time to process at once.
+        max_workers : int or None
+            If given, process the chunks in a pool of this many threads.
         """
-        return self._with_data(self.data - self.randomized_auto_const_bg(amount))
+        return self._with_data(self.data - self.randomized_auto_const_bg(
+            amount, chunk_size, max_workers
+        ))
 
     def clip_values(self, vmin=None, vmax=None, out=None):
         """
@@ -954,10 +1048,7 @@ class LinearTimeSpectrogram(Spectrogram):
         """
         if self.t_delt == new_delt:
             return self
-        factor = self.t_delt / float(new_delt)
-
-        # The last data-point does not change!
-        new_size = floor((self.shape[1] - 1) * factor + 1) # pylint: disable=E1101
+        new_size = _resampled_size(self, new_delt)
         data = ndimage.zoom(self.data, (1, new_size / self.shape[1])) # pylint: disable=E1101
 
         params = self._get_params()
@@ -997,9 +1088,16 @@ class LinearTimeSpectrogram(Spectrogram):
             Function that is called to create the resulting array. Can be set
             to LinearTimeSpectrogram.memap(filename) to create a memory mapped
             result array.
+
+        Notes
+        -----
+        Only the axes and the shape of the spectrograms are needed to lay out
+        the result, so their data can be placeholders that are read from disk
+        on demand, e.g. ``CallistoSpectrogram.read(filename, lazy=True)``. The
+        data is then read, resampled and copied into the result one
+        spectrogram at a time, so that together with a memory mapped result
+        array the data of all the spectrograms is never held in memory.
         """
-        # XXX: Only load header and load contents of files
-        # on demand.
         mask = None
 
         if mk_arr is None:
@@ -1015,15 +1113,17 @@ class LinearTimeSpectrogram(Spectrogram):
         min_delt = min(sp.t_delt for sp in specs)
         dtype_ = max(sp.dtype for sp in specs)
 
-        specs = [sp.resample_time(min_delt) for sp in specs]
-        size = sum(sp.shape[1] for sp in specs)
+        # The layout of the result only depends on the headers, so the
+        # data of each spectrogram is not needed until it is copied over.
+        widths = [_resampled_size(sp, min_delt) for sp in specs]
+        size = sum(widths)
 
         data = specs[0]
         start_day = data.start
 
         xs = []
-        last = data
-        for elem in specs[1:]:
+        last, last_width = data, widths[0]
+        for elem, width in zip(specs[1:], widths[1:]):
             e_init = (
                 SECONDS_PER_DAY * (
                     get_day(elem.start) - get_day(start_day)
@@ -1031,7 +1131,7 @@ class LinearTimeSpectrogram(Spectrogram):
             )
             x = int((e_init - last.t_init) / min_delt)
             xs.append(x)
-            diff = last.shape[1] - x
+            diff = last_width - x
 
             if maxgap is not None and -diff > maxgap / min_delt:
                 raise ValueError("Too large gap.")
@@ -1043,11 +1143,11 @@ class LinearTimeSpectrogram(Spectrogram):
             else:
                 size -= diff
 
-            last = elem
+            last, last_width = elem, width
 
         # The non existing element after the last one starts after
         # the last one. Needed to keep implementation below sane.
-        xs.append(specs[-1].shape[1])
+        xs.append(widths[-1])
 
         # We do that here so the user can pass a memory mapped
         # array if they'd like to.
@@ -1058,22 +1158,18 @@ class LinearTimeSpectrogram(Spectrogram):
         # considered for correct time axes.
         sd = 0
         for x, elem in zip(xs, specs):
-            diff = x - elem.shape[1]
+            # Only one spectrogram at a time is read in and resampled.
+            elem = _load(elem).resample_time(min_delt)
+            width = elem.shape[1]
+            diff = x - width
             e_time_axis = elem.time_axis
 
             elem = elem.data
 
-            if x > elem.shape[1]:
+            if x > width:
                 if nonlinear:
-                    x = elem.shape[1]
+                    x = width
                 else:
-                    # If we want to stay linear, fill up the missing
-                    # pixels with placeholder zeros.
-                    filler = np.zeros((data.shape[0], diff))
-                    if fill is cls.JOIN_REPEAT:
-                        filler[:, :] = elem[:, -1, np.newaxis]
-                    else:
-                        filler[:] = fill
                     minimum = e_time_axis[-1]
                     e_time_axis = np.concatenate([
                         e_time_axis,
@@ -1083,14 +1179,21 @@ class LinearTimeSpectrogram(Spectrogram):
                             diff
                         )
                     ])
-                    elem = np.concatenate([elem, filler], 1)
-            arr[:, sx:sx + x] = elem[:, :x]
+            used = min(x, width)
+            arr[:, sx:sx + used] = elem[:, :used]
+            if x > used:
+                # If we want to stay linear, fill up the missing
+                # pixels with placeholder values.
+                if fill is cls.JOIN_REPEAT:
+                    arr[:, sx + used:sx + x] = elem[:, -1, np.newaxis]
+                else:
+                    arr[:, sx + used:sx + x] = fill
 
             if diff > 0:
                 if mask is None:
                     mask = np.zeros((data.shape[0], size), dtype=np.uint8)
                 mask[:, sx + x - diff:sx + x] = 1
-            time_axis[sx:sx + x] = e_time_axis[:x] + data.t_delt * (sx + sd)
+            time_axis[sx:sx + x] = e_time_axis[:x] + min_delt * (sx + sd)
             if nonlinear:
                 sd += max(0, diff)
             sx += x
@@ -1099,7 +1202,7 @@ class LinearTimeSpectrogram(Spectrogram):
             'freq_axis': data.freq_axis,
             'start': data.start,
             'end': specs[-1].end,
-            't_delt': data.t_delt,
+            't_delt': min_delt,
             't_init': data.t_init,
             't_label': data.t_label,
             'f_label': data.f_label,
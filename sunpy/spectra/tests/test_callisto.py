@@ -50,6 +50,31 @@ def test_read(CALLISTO_IMAGE):
     assert ca.dtype == np.uint8
 
 
+def test_read_lazy(CALLISTO_IMAGE):
+    ca = CallistoSpectrogram.read(CALLISTO_IMAGE)
+    lazy = CallistoSpectrogram.read(CALLISTO_IMAGE, lazy=True)
+    assert lazy.start == ca.start
+    assert lazy.shape == ca.shape
+    assert lazy.dtype == ca.dtype
+    assert np.array_equal(lazy.time_axis, ca.time_axis)
+    assert np.array_equal(lazy.freq_axis, ca.freq_axis)
+    assert np.array_equal(np.asarray(lazy.data), ca.data)
+
+
+def test_join_many_lazy(CALLISTO_IMAGE, tmpdir):
+    filenames = sorted(glob.glob(
+        os.path.join(os.path.dirname(CALLISTO_IMAGE), 'BIR_*')))
+    ca = CallistoSpectrogram.join_many(
+        CallistoSpectrogram.read_many(filenames))
+    lazy = CallistoSpectrogram.join_many(
+        CallistoSpectrogram.read_many(filenames, lazy=True),
+        mk_arr=CallistoSpectrogram.memmap(str(tmpdir.join('joined.dat'))))
+    assert isinstance(lazy.data, np.memmap)
+    assert np.array_equal(lazy.data, ca.data)
+    assert np.array_equal(lazy.time_axis, ca.time_axis)
+    assert lazy.end == ca.end
+
+
 @pytest.mark.remote_data
 def test_query():
     URL = 'http://soleil.i4ds.ch/solarradio/data/2002-20yy_Callisto/2011/09/22/'
@@ -81,6 +81,22 @@ def test_auto_const_bg():
     assert np.array_equal(sbg, x.reshape(200, 1))
 
 
+def test_auto_const_bg_chunked(tmpdir):
+    x = np.linspace(0, 200, 200).astype(np.uint16)
+    image = np.memmap(str(tmpdir.join('image.dat')), mode='w+',
+                      shape=(200, 3600), dtype=np.uint16)
+    image[:] = x.reshape(200, 1)
+    image[:, 1800:] += (np.random.rand(200, 1800) * 255).astype(np.uint16)
+
+    spectrogram = mk_spec(image)
+    cand = spectrogram.auto_find_background()
+    assert cand == spectrogram.auto_find_background(chunk_size=100,
+                                                    max_workers=4)
+    assert all(c < 1800 for c in cand)
+    assert np.array_equal(spectrogram.auto_const_bg(chunk_size=333),
+                          x.reshape(200, 1))
+
+
 def test_randomized_auto_const_bg():
     # The idea is to generate background and add a random signal, perform
     # background subtraction and see if the signal comes out again.
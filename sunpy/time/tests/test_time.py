@@ -123,6 +123,65 @@ def test_parse_time_numpy_datetime_round():
     assert dt == datetime(2014, 2, 7, 16, 47, 51, 8288)
 
 
+def _first_format(time_string):
+    # The formats tried one by one, as parse_time used to
+    for time_format in time.time.TIME_FORMAT_LIST:
+        dt = time.time._parse_format(time_string, time_format)
+        if dt is not None:
+            return time_format, dt
+    return None, None
+
+
+@pytest.mark.parametrize('time_string', [
+    datetime(2007, 5, 4, 21, 8, 12, 999999).strftime(time_format)
+    for time_format in time.time.TIME_FORMAT_LIST] + [
+    '2007-05-04T21:08:12.000', '2007-05-04T24:00:00', '2007-05-04T24:00:01',
+    '2007-13-04T21:08:12', '2007/05/04T21:08:12.5', '2007-05-04T21:08:1234567'])
+def test_match_format(time_string):
+    time.time._format_cache.clear()
+    expected = _first_format(time_string)
+    # Found by the combined regex, then by the cache
+    assert time.time._match_format(time_string) == expected
+    assert time.time._match_format(time_string) == expected
+
+
+def test_match_format_cache():
+    time.time._format_cache.clear()
+    assert parse_time('2007/05/04 21:08') == datetime(2007, 5, 4, 21, 8)
+    assert time.time._format_cache == {'0000/00/00 00:00': '%Y/%m/%d %H:%M'}
+    assert parse_time('2010/11/12 13:14') == datetime(2010, 11, 12, 13, 14)
+    assert len(time.time._format_cache) == 1
+    assert parse_time('2007/05/04 24:00') == datetime(2007, 5, 5)
+
+
+def test_parse_time_numpy_str_array():
+    inputs = [datetime(2012, 1, i, 12, 30, 15, 250000) for i in range(1, 13)]
+    for time_format in ["%Y-%m-%dT%H:%M:%S.%f", "%Y/%m/%d %H:%M", "%d-%b-%Y",
+                        "%Y:%j:%H:%M:%S"]:
+        strings = np.array([dt.strftime(time_format) for dt in inputs])
+        dts = parse_time(strings)
+        assert isinstance(dts, np.ndarray)
+        assert dts.shape == strings.shape
+        assert list(dts) == [parse_time(string) for string in strings]
+
+    dts = parse_time(np.array([['2012/01/01', '2012/01/02'], ['2012/01/03', '2012/01/04']]))
+    assert dts.shape == (2, 2)
+    assert dts[1, 0] == datetime(2012, 1, 3)
+
+
+def test_parse_time_numpy_str_array_mixed():
+    # Arrays that are not all in the format of the first string are parsed
+    # element by element
+    strings = np.array(['2012/01/01 24:00:00', '2012-01-01T12:00:00', '2012/01/01'])
+    assert list(parse_time(strings)) == [datetime(2012, 1, 2), datetime(2012, 1, 1, 12),
+                                        datetime(2012, 1, 1)]
+
+
+def test_parse_time_pandas_series_str():
+    dts = parse_time(pandas.Series(['2012-01-01T00:00:00', '2012-01-02T00:00:00']))
+    assert list(dts) == [datetime(2012, 1, 1), datetime(2012, 1, 2)]
+
+
 def test_parse_time_astropy():
     astropy_time = parse_time(astropy.time.Time(['2016-01-02T23:00:01']))
 
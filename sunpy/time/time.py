@@ -1,7 +1,9 @@
 from __future__ import absolute_import, division, print_function
 import re
+import threading
 from datetime import datetime, date, time, timedelta
-from functools import singledispatch
+from functools import singledispatch, lru_cache
+from collections import OrderedDict
 
 import numpy as np
 import pandas
@@ -67,13 +69,22 @@ def _n_or_eq(a, b):
     return a is None or a == b
 
 
+@lru_cache(maxsize=256)
+def _format_regex(format):
+    """
+    The compiled regular expression matching the start of a time string in
+    ``format``.
+    """
+    for key, value in six.iteritems(REGEX):
+        format = format.replace(key, value)
+    return re.compile(format)
+
+
 def _regex_parse_time(inp, format):
     # Parser for finding out the minute value so we can adjust the string
     # from 24:00:00 to 00:00:00 the next day because strptime does not
     # understand the former.
-    for key, value in six.iteritems(REGEX):
-        format = format.replace(key, value)
-    match = re.match(format, inp)
+    match = _format_regex(format).match(inp)
     if match is None:
         return None, None
     try:
@@ -91,13 +102,140 @@ def _regex_parse_time(inp, format):
     return inp, timedelta(days=0)
 
 
+def _parse_format(time_string, time_format):
+    """
+    Parse ``time_string`` in ``time_format``, or return `None` if it is not
+    written in that format.
+    """
+    try:
+        ts, time_delta = _regex_parse_time(time_string, time_format)
+        if ts is None:
+            return None
+        return datetime.strptime(ts, time_format) + time_delta
+    except ValueError:
+        return None
+
+
+def _detect_format(time_string):
+    """
+    Return the first format in `TIME_FORMAT_LIST` that ``time_string`` is
+    written in, or `None`.
+    """
+    return _match_format(time_string)[0]
+
+
+# All the formats of `TIME_FORMAT_LIST` combined into one regular expression,
+# in which each alternative must match the whole string. The first
+# alternative to match is the only format that can be the first in the list
+# to parse the string, unless strptime rejects one of the values.
+_dispatch_formats = None
+_dispatch_regex = None
+
+# The formats found by `_match_format`, by the shape of the string (the
+# string with every digit replaced by 0), least recently used first. Times
+# may be parsed in several threads at once, so the cache and the combined
+# regular expression are only changed while holding the lock.
+_format_cache = OrderedDict()
+_FORMAT_CACHE_SIZE = 128
+_format_cache_lock = threading.Lock()
+
+
+def _format_dispatch():
+    global _dispatch_formats, _dispatch_regex
+    with _format_cache_lock:
+        if _dispatch_formats != TIME_FORMAT_LIST:
+            alternatives = []
+            for i, time_format in enumerate(TIME_FORMAT_LIST):
+                pattern = re.sub(r'\(\?P<\w+>', '(?:', _format_regex(time_format).pattern)
+                alternatives.append(r'(?P<f{0}>{1})\Z'.format(i, pattern))
+            _dispatch_regex = re.compile('|'.join(alternatives))
+            _dispatch_formats = list(TIME_FORMAT_LIST)
+            _format_cache.clear()
+        return _dispatch_regex
+
+
+def _match_format(time_string):
+    """
+    Find the first format in `TIME_FORMAT_LIST` that ``time_string`` is
+    written in.
+
+    The regular expressions of the formats only look at whether a character
+    is a digit, so strings of the same shape match the same formats. Which
+    format wins is cached by the shape of the string, and otherwise looked up
+    with the combined regular expression of `_format_dispatch`, before falling
+    back to trying every format in turn.
+
+    Returns
+    -------
+    time_format : `str`
+        The format, or `None`.
+    dt : `datetime.datetime`
+        The parsed time, or `None`.
+    """
+    dispatch = _format_dispatch()
+    shape = re.sub(r'\d', '0', time_string)
+    time_format = _format_cache.get(shape)
+    if time_format is not None:
+        dt = _parse_format(time_string, time_format)
+        if dt is not None:
+            with _format_cache_lock:
+                if shape in _format_cache:
+                    _format_cache.move_to_end(shape)
+            return time_format, dt
+
+    match = dispatch.match(time_string)
+    if match is not None:
+        time_format = TIME_FORMAT_LIST[int(match.lastgroup[1:])]
+        dt = _parse_format(time_string, time_format)
+        if dt is not None:
+            # No earlier format matches a string of this shape
+            with _format_cache_lock:
+                _format_cache[shape] = time_format
+                if len(_format_cache) > _FORMAT_CACHE_SIZE:
+                    _format_cache.popitem(last=False)
+            return time_format, dt
+
+    for time_format in TIME_FORMAT_LIST:
+        dt = _parse_format(time_string, time_format)
+        if dt is not None:
+            return time_format, dt
+    return None, None
+
+
+def _parse_str_array(time_strings, **kwargs):
+    """
+    Parse an array of time strings into an array of datetimes.
+
+    The format is detected from the first string only, and the whole array is
+    then parsed at once by `pandas.to_datetime`. If the strings are not all
+    in that format they are parsed one by one.
+    """
+    time_strings = np.asarray(time_strings)
+    flat = time_strings.ravel()
+    if flat.dtype.kind == 'S':
+        flat = flat.astype(str)
+    if flat.size == 0:
+        return np.empty(time_strings.shape, dtype=object)
+
+    time_format = _detect_format(flat[0])
+    if time_format is None:
+        time_format = kwargs.get('_time_string_parse_format')
+    if time_format is not None:
+        try:
+            parsed = pandas.to_datetime(flat, format=time_format, exact=True)
+        except (ValueError, TypeError, OverflowError):
+            parsed = None
+        if parsed is not None and not parsed.isna().any():
+            return parsed.to_pydatetime().reshape(time_strings.shape)
+
+    return np.array([parse_time(t, **kwargs) for t in flat],
+                    dtype=object).reshape(time_strings.shape)
+
+
 def find_time(string, format):
     """ Return iterator of occurrences of date formatted with format
     in string. Currently supported format codes: """
-    re_format = format
-    for key, value in six.iteritems(REGEX):
-        re_format = re_format.replace(key, value)
-    matches = re.finditer(re_format, string)
+    matches = _format_regex(format).finditer(string)
     for match in matches:
         try:
             matchstr = string[slice(*match.span())]
@@ -148,9 +286,9 @@ def convert_time_pandasTimestamp(time_string, **kwargs):
 @convert_time.register(pandas.Series)
 def convert_time_pandasSeries(time_string, **kwargs):
     if 'datetime64' in str(time_string.dtype):
-        return np.array([dt.to_pydatetime() for dt in time_string])
+        return time_string.dt.to_pydatetime()
     else:
-        convert_time.dispatch(object)(time_string, **kwargs)
+        return convert_time_npndarray(time_string.values, **kwargs)
 
 
 @convert_time.register(pandas.DatetimeIndex)
@@ -187,7 +325,11 @@ def convert_time_npdatetime64(time_string, **kwargs):
 @convert_time.register(np.ndarray)
 def convert_time_npndarray(time_string, **kwargs):
     if 'datetime64' in str(time_string.dtype):
-        return np.array([_parse_dt64(dt) for dt in time_string])
+        return time_string.astype('M8[us]').astype(datetime)
+    elif time_string.dtype.kind in 'US' or (
+            time_string.dtype.kind == 'O' and time_string.size and
+            isinstance(time_string.flat[0], six.string_types)):
+        return _parse_str_array(time_string, **kwargs)
     else:
         return convert_time.dispatch(object)(time_string, **kwargs)
 
@@ -203,18 +345,9 @@ def convert_time_str(time_string, **kwargs):
     # number of zeros. This solves issue #289
     if '.' in time_string:
             time_string = time_string.rstrip("0").rstrip(".")
-    for time_format in TIME_FORMAT_LIST:
-        try:
-            try:
-                ts, time_delta = _regex_parse_time(time_string,
-                                                   time_format)
-            except TypeError:
-                break
-            if ts is None:
-                continue
-            return datetime.strptime(ts, time_format) + time_delta
-        except ValueError:
-            pass
+    time_format, dt = _match_format(time_string)
+    if dt is not None:
+        return dt
     time_string_parse_format = kwargs.pop('_time_string_parse_format', None)
     if time_string_parse_format is not None:
         ts, time_delta = _regex_parse_time(time_string,
@@ -243,6 +376,8 @@ def parse_time(time_string, time_format='', **kwargs):
         DateTime corresponding to input date string
     Note:
     If time_string is an instance of float, then it is assumed to be in utime format.
+    Arrays of time strings are parsed at once, in the format of the first
+    string, into an array of datetimes.
     Examples
     --------
     >>> import sunpy.time
@@ -5,6 +5,7 @@ __email__ = "stuart@mumford.me.uk"
 
 from sunpy.util.metadata import MetaDict
 import itertools
+import bisect
 import copy
 
 import warnings
@@ -13,6 +14,52 @@ import inspect
 from sunpy.time import TimeRange, parse_time
 
 
+class _MetaDataIndex(object):
+    """
+    An index over a list of metadata entries, used to find the entries for a
+    given time or column without looking at every entry.
+
+    The entries are sorted by the start of their time ranges, along with the
+    running maximum of their ends, so the entries overlapping a time range are
+    found by bisection. Column names are mapped to the entries listing them.
+
+    The index is only valid for the list it was built from, while its length
+    is unchanged.
+    """
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.length = len(metadata)
+        self.order = sorted(range(len(metadata)), key=lambda i: metadata[i][0].start)
+        self.starts = [metadata[i][0].start for i in self.order]
+        self.ends = [metadata[i][0].end for i in self.order]
+        self.max_ends = list(itertools.accumulate(self.ends, max))
+        self.columns = {}
+        for i, entry in enumerate(metadata):
+            for colname in entry[1]:
+                self.columns.setdefault(colname, []).append(i)
+
+    def is_valid_for(self, metadata):
+        return metadata is self.metadata and len(metadata) == self.length
+
+    def overlapping(self, start, end):
+        """
+        The indices, in ascending order, of the entries whose time ranges
+        overlap the range from ``start`` to ``end`` (inclusive).
+        """
+        lo = bisect.bisect_left(self.max_ends, start)
+        hi = bisect.bisect_right(self.starts, end)
+        return sorted(self.order[j] for j in range(lo, hi) if self.ends[j] >= start)
+
+    def with_column(self, colname):
+        """
+        The indices, in ascending order, of the entries listing ``colname``.
+        """
+        # Columns may have been removed from an entry in place since the index
+        # was built
+        return [i for i in self.columns.get(colname, [])
+                if colname in self.metadata[i][1]]
+
+
 class TimeSeriesMetaData(object):
     """
     An object used to store metadata for TimeSeries objects that enables multiple
@@ -66,6 +113,7 @@ class TimeSeriesMetaData(object):
 
     def __init__(self, meta=None, timerange=None, colnames=None, **kwargs):
         self.metadata = []
+        self._index = None
         # Parse in arguments
         if not isinstance(meta, type(None)):
             if isinstance(meta, (dict, MetaDict)) and isinstance(timerange, TimeRange) and isinstance(colnames, list):
@@ -173,6 +221,7 @@ class TimeSeriesMetaData(object):
         # Insert into the given position
         if not duplicate:
             self.metadata.insert(pos, new_metadata)
+            self._index = None
 
     def find_indices(self, time=None, colname=None, **kwargs):
         """
@@ -202,23 +251,34 @@ class TimeSeriesMetaData(object):
         dt = time
         if not dt:
             dt = False
-        elif isinstance(dt, str):
+        else:
             dt = parse_time(dt)
 
-        # Find all results with suitable timerange.
-        results_indices = []
-        for i, meta in enumerate(self.metadata):
-            if dt in meta[0] or not(dt):
-                results_indices.append(i)
+        if not dt and not colname:
+            return list(range(len(self.metadata)))
 
-        # Filter out only those with the correct column.
-        results = []
-        for i in results_indices:
-            if (colname in self.metadata[i][1]) or (not colname):
-                results.append(i)
+        # Find all results with suitable timerange and/or the correct column.
+        index = self._get_index()
+        if not dt:
+            return index.with_column(colname)
+        results = index.overlapping(dt, dt)
+        if colname:
+            results = [i for i in results if colname in self.metadata[i][1]]
 
         return results
 
+    def _get_index(self, build=True):
+        """
+        Return the `_MetaDataIndex` of the metadata entries, building it if the
+        entries have changed since it was last built. Returns `None` if there
+        is no valid index and ``build`` is `False`.
+        """
+        index = getattr(self, '_index', None)
+        if index is None or not index.is_valid_for(self.metadata):
+            index = _MetaDataIndex(self.metadata) if build else None
+            self._index = index
+        return index
+
     def find(self, time=None, colname=None, **kwargs):
         """
         Find all metadata matching the given filters for datetime and/or column name.
@@ -320,18 +380,32 @@ class TimeSeriesMetaData(object):
 
         Parameters
         ----------
-        tsmetadata2 : `~sunpy.timeseries.TimeSeriesMetaData`
-            The second TimeSeriesMetaData object.
+        tsmetadata2 : `~sunpy.timeseries.TimeSeriesMetaData` or `list`
+            The second TimeSeriesMetaData object, or a list of them. A list is
+            merged in a single pass, which gives the same result as
+            concatenating each of them in turn.
         """
-        # Create a copy of the metadata
-        meta = TimeSeriesMetaData(copy.copy(self.metadata))
-
-        # Append each metadata entry from the second TimeSeriesMetaData object
-        # to the original TimeSeriesMetaData object.
-        for entry in tsmetadata2.metadata:
-            meta.append(entry[0], entry[1], entry[2])
-
-        return meta
+        if isinstance(tsmetadata2, TimeSeriesMetaData):
+            tsmetadata2 = [tsmetadata2]
+
+        # As append does, put each new entry before the entries already
+        # present with the same start time, including those appended earlier,
+        # so the entries of the current object come last. Duplicate entries
+        # (same TimeRange and colnames) are only added once.
+        keyed = [((entry[0].start, 0), entry) for entry in self.metadata]
+        seen = set((entry[0].start, entry[0].end, tuple(entry[1]))
+                   for entry in self.metadata)
+        for other in tsmetadata2:
+            for entry in other.metadata:
+                key = (entry[0].start, entry[0].end, tuple(entry[1]))
+                if key in seen:
+                    continue
+                seen.add(key)
+                keyed.append(((entry[0].start, -len(keyed)),
+                              (entry[0], entry[1], MetaDict(entry[2]))))
+
+        keyed.sort(key=lambda item: item[0])
+        return TimeSeriesMetaData([entry for _, entry in keyed])
 
     def update(self, dictionary, time=None, colname=None, row=None, overwrite=False, **kwargs):
         """
@@ -383,8 +457,17 @@ class TimeSeriesMetaData(object):
         timerange : `sunpy.time.TimeRange`
             Either a time range to truncate to.
         """
+        # Only the entries overlapping the new time range are kept, which an
+        # existing index finds without looking at every entry.
+        index = self._get_index(build=False)
+        if index is not None:
+            metadata = [self.metadata[i]
+                        for i in index.overlapping(timerange.start, timerange.end)]
+        else:
+            metadata = self.metadata
+
         truncated = []
-        for metatuple in self.metadata:
+        for metatuple in metadata:
             # Get metadata time range parameters
             start = metatuple[0].start
             end   = metatuple[0].end
@@ -506,6 +589,7 @@ class TimeSeriesMetaData(object):
 
             # Replace values
             self.metadata[i] = ( self.metadata[i][0], colnames, self.metadata[i][2] )
+        self._index = None
 
     def _validate_meta(self, meta):
         """
@@ -78,7 +78,8 @@ class EVESpWxTimeSeries(GenericTimeSeries):
 
         **kwargs : `dict`
             Any additional plot arguments that should be used
-            when plotting.
+            when plotting, including ``decimate``, see
+            `~sunpy.timeseries.GenericTimeSeries.plot`.
         """
         # Check we have a timeseries valid for plotting
         self._validate_data_for_ploting()
@@ -101,7 +102,8 @@ class EVESpWxTimeSeries(GenericTimeSeries):
             data = self.data[column]
             if "title" not in kwargs:
                 kwargs['title'] = 'EVE ' + column.replace('_', ' ')
-            data.plot(**kwargs)
+            decimate = kwargs.pop('decimate', None)
+            self._plot_data(data, plt.gca(), decimate, **kwargs)
         figure.show()
 
     @classmethod
@@ -14,6 +14,7 @@ import sunpy.io
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.time import parse_time, TimeRange, is_time_in_given_format
 from sunpy.util.metadata import MetaDict
+from sunpy.visualization.decimate import LineDecimator
 
 from astropy import units as u
 
@@ -54,7 +55,7 @@ class XRSTimeSeries(GenericTimeSeries):
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'xrs'
 
-    def peek(self, title="GOES Xray Flux"):
+    def peek(self, title="GOES Xray Flux", decimate=None):
         """Plots GOES XRS light curve is the usual manner. An example is shown
         below.
 
@@ -70,6 +71,10 @@ class XRSTimeSeries(GenericTimeSeries):
         title : `str`
             The title of the plot.
 
+        decimate : `bool`, optional
+            Whether to only plot the smallest and largest values in each pixel,
+            see `~sunpy.timeseries.GenericTimeSeries.plot`.
+
         **kwargs : `dict`
             Any additional plot arguments that should be used when plotting.
         """
@@ -79,12 +84,16 @@ class XRSTimeSeries(GenericTimeSeries):
         figure = plt.figure()
         axes = plt.gca()
 
-        dates = matplotlib.dates.date2num(parse_time(self.data.index))
+        dates = self.data.index.values
+        fluxes = [self.data['xrsa'].values, self.data['xrsb'].values]
+        decimator = LineDecimator(axes, dates, fluxes)
+        decimate = self._decimate(decimate)
+        indices = decimator.indices(visible=False) if decimate else slice(None)
 
-        axes.plot_date(dates, self.data['xrsa'], '-',
-                     label='0.5--4.0 $\AA$', color='blue', lw=2)
-        axes.plot_date(dates, self.data['xrsb'], '-',
-                     label='1.0--8.0 $\AA$', color='red', lw=2)
+        lines = axes.plot_date(dates[indices], fluxes[0][indices], '-',
+                               label='0.5--4.0 $\AA$', color='blue', lw=2)
+        lines += axes.plot_date(dates[indices], fluxes[1][indices], '-',
+                                label='1.0--8.0 $\AA$', color='red', lw=2)
 
         axes.set_yscale("log")
         axes.set_ylim(1e-9, 1e-2)
@@ -108,6 +117,8 @@ class XRSTimeSeries(GenericTimeSeries):
 
         axes.fmt_xdata = matplotlib.dates.DateFormatter('%H:%M')
         figure.autofmt_xdate()
+        if decimate:
+            decimator.connect(lines)
         figure.show()
 
     # ToDo: is this part of the DL pipeline? If so delete.
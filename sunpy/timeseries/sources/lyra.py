@@ -77,7 +77,8 @@ class LYRATimeSeries(GenericTimeSeries):
             The number of columns to plot.
 
         **kwargs : `dict`
-            Any additional plot arguments that should be used when plotting
+            Any additional plot arguments that should be used when plotting,
+            including ``decimate``, see `~sunpy.timeseries.GenericTimeSeries.plot`.
         """
         # Check we have a timeseries valid for plotting
         self._validate_data_for_ploting()
@@ -88,7 +89,7 @@ class LYRATimeSeries(GenericTimeSeries):
         plt.subplots_adjust(left=0.17,top=0.94,right=0.94,bottom=0.15)
         axes = plt.gca()
 
-        axes = self.data.plot(ax=axes, subplots=True, sharex=True, **kwargs)
+        axes = self.plot(axes=axes, subplots=True, sharex=True, **kwargs)
 
         for i, name in enumerate(self.data.columns):
             if names < 3:
@@ -80,6 +80,49 @@ class TestTimeSeries(object):
         ts_from_glob = sunpy.timeseries.TimeSeries(os.path.join(filepath, "eve", "*"), source='EVE', concatenate=True)
         assert isinstance(ts_from_glob, sunpy.timeseries.sources.eve.EVESpWxTimeSeries)
 
+    def test_factory_parallel(self):
+        # Test reading files in parallel gives the same TimeSeries in the same order
+        ts_list = sunpy.timeseries.TimeSeries(a_list_of_many, source='EVE')
+        ts_list_parallel = sunpy.timeseries.TimeSeries(a_list_of_many, source='EVE',
+                                                       parallel=True, max_workers=2)
+        assert len(ts_list) == len(ts_list_parallel)
+        for ts, ts_parallel in zip(ts_list, ts_list_parallel):
+            assert ts == ts_parallel
+        # Files of different sources are kept in order
+        ts_files = sunpy.timeseries.TimeSeries([goes_filepath, lyra_filepath], parallel=True)
+        assert isinstance(ts_files[0], sunpy.timeseries.sources.goes.XRSTimeSeries)
+        assert isinstance(ts_files[1], sunpy.timeseries.sources.lyra.LYRATimeSeries)
+
+    def test_concatenate_many(self):
+        # Concatenating at once gives the same TimeSeries as one at a time
+        ts_list = sunpy.timeseries.TimeSeries(sorted(a_list_of_many), source='EVE')
+        ts_concat = ts_list[0]
+        for ts in ts_list[1:]:
+            ts_concat = ts_concat.concatenate(ts)
+        ts_concat_many = ts_list[0].concatenate_many(ts_list[1:])
+        assert isinstance(ts_concat_many, sunpy.timeseries.sources.eve.EVESpWxTimeSeries)
+        assert ts_concat_many == ts_concat
+        assert ts_list[0].concatenate_many([ts_list[0]]) is ts_list[0]
+
+    def test_factory_stream(self):
+        # Streaming files gives the TimeSeries of each file in turn
+        files = sorted(a_list_of_many)
+        ts_list = sunpy.timeseries.TimeSeries(files, source='EVE')
+        streamed = list(sunpy.timeseries.TimeSeries.stream(os.path.join(filepath, "eve"),
+                                                           source='EVE'))
+        assert streamed == ts_list
+        streamed = list(sunpy.timeseries.TimeSeries.stream(files, source='EVE',
+                                                           parallel=True, max_workers=2))
+        assert streamed == ts_list
+
+        # Only the data in the time range is returned
+        tr = sunpy.time.TimeRange(ts_list[1].index.min() + datetime.timedelta(hours=1),
+                                  ts_list[-1].index.max() + datetime.timedelta(days=1))
+        streamed = list(sunpy.timeseries.TimeSeries.stream(files, source='EVE', timerange=tr))
+        assert len(streamed) == len(ts_list) - 1
+        assert streamed[0].index.min() >= tr.start
+        assert streamed[-1] == ts_list[-1].truncate(tr)
+
 #==============================================================================
 # Individual Implicit Source Tests
 #==============================================================================
@@ -662,6 +662,41 @@ def test_noaa_pre_peek(noaa_pre_test_ts):
 def test_generic_ts_peek(generic_ts):
     generic_ts.peek()
 
+
+def test_plot_decimate():
+    import matplotlib.pyplot as plt
+    index = pd.date_range('2012-01-01', periods=200000, freq='2s')
+    data = DataFrame({'a': np.sin(np.arange(200000) / 1000.)}, index=index)
+    ts = sunpy.timeseries.TimeSeries(data, MetaDict(), OrderedDict([('a', u.W)]))
+    figure = plt.figure()
+    axes = ts.plot()
+    line = axes.get_lines()[0]
+    assert len(line.get_xdata()) < 4 * axes.bbox.width
+    assert line.get_ydata().max() == data['a'].max()
+
+    # Zooming in recomputes the plotted points
+    axes.set_xlim(index[1000], index[1100])
+    assert len(line.get_xdata()) == 103
+    plt.close(figure)
+
+    figure = plt.figure()
+    axes = ts.plot(decimate=False)
+    assert len(axes.get_lines()[0].get_xdata()) == 200000
+    plt.close(figure)
+
+
+def test_eve_peek_column_decimate():
+    import matplotlib.pyplot as plt
+    index = pd.date_range('2012-01-01', periods=200000, freq='2s')
+    data = DataFrame({'a': np.sin(np.arange(200000) / 1000.), 'b': np.zeros(200000)},
+                     index=index)
+    ts = sunpy.timeseries.sources.eve.EVESpWxTimeSeries(
+        data, MetaDict(), OrderedDict([('a', u.W), ('b', u.W)]))
+    ts.peek(column='a')
+    axes = plt.gca()
+    assert len(axes.get_lines()[0].get_xdata()) < 4 * axes.bbox.width
+    plt.close(plt.gcf())
+
 #==============================================================================
 # Test Peek Of Invalid Data for all sources
 #==============================================================================
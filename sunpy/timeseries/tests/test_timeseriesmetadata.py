@@ -8,6 +8,7 @@ Created on Wed Jul 20 10:24:06 2016
 from __future__ import print_function, division
 
 import copy
+from datetime import datetime, timedelta
 
 from sunpy.timeseries import TimeSeriesMetaData
 from sunpy.time import TimeRange
@@ -154,6 +155,10 @@ def test_concatenate(basic_ascending_append_md, basic_4_md, complex_append_md):
     concatenated = concatenated.concatenate(basic_4_md)
     assert concatenated == complex_append_md
 
+def test_concatenate_list(basic_1_md, basic_2_md, basic_3_md, basic_4_md, complex_append_md):
+    concatenated = basic_3_md.concatenate([basic_4_md, basic_1_md, basic_2_md, basic_4_md])
+    assert concatenated == complex_append_md
+
 
 #==============================================================================
 # Test TimeSeriesMetaData Truncation
@@ -263,6 +268,27 @@ def test_find_both_filters(basic_2_md, basic_4_md, complex_append_md):
     assert complex_append_md.find(time='2010-01-02 20:59:57.468999', colname='column2') == basic_2_md
     assert complex_append_md.find(time='2010-01-02 20:59:57.468999', colname='md4_column1') == basic_4_md
 
+def test_find_indices_matches_scan():
+    # The indexed lookups give the same entries as looking at every entry
+    base = datetime(2010, 1, 1)
+    entries = [(TimeRange(base + timedelta(hours=7 * i), timedelta(hours=i % 5 * 6)),
+                ['column{}'.format(i % 3)], MetaDict()) for i in range(40)]
+    md = TimeSeriesMetaData(entries[::-1])
+    for hours in range(0, 300, 5):
+        dt = base + timedelta(hours=hours)
+        for colname in [None, 'column1', 'missing']:
+            expected = [i for i, entry in enumerate(md.metadata)
+                        if dt in entry[0] and (colname is None or colname in entry[1])]
+            assert md.find_indices(time=dt, colname=colname) == expected
+
+def test_find_after_append(basic_1_md, basic_2_md):
+    md = copy.deepcopy(basic_1_md)
+    assert md.find(time='2010-01-02 20:59:57.468999').metadata == []
+    md.append(*basic_2_md.metadata[0])
+    assert md.find(time='2010-01-02 20:59:57.468999') == basic_2_md
+    md._remove_columns('column2')
+    assert md.find(colname='column2').metadata == []
+
 
 #==============================================================================
 # Test TimeSeriesMetaData get and update methods
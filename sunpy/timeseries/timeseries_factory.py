@@ -5,6 +5,8 @@ import os
 import glob
 from collections import OrderedDict
 import copy
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -149,6 +151,17 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         else:
             return False, fname
 
+    def _read_files(self, files, parallel=False, max_workers=None, **kwargs):
+        """
+        Call `_read_file` on each of a list of files, optionally using a pool
+        of threads, and return the results in the same order as ``files``.
+        """
+        if not parallel:
+            return [self._read_file(afile, **kwargs) for afile in files]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(partial(self._read_file, **kwargs), files))
+
     def _validate_meta(self, meta):
         """
         Validate a meta argument for use as metadata.
@@ -263,6 +276,10 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         data_header_pairs = list()
         already_timeseries = list()
         filepaths = list()
+        files = list()
+
+        parallel = kwargs.pop('parallel', False)
+        max_workers = kwargs.pop('max_workers', None)
 
         # Take source kwarg if defined
         source = kwargs.get('source', None)
@@ -316,43 +333,19 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                   os.path.isfile(os.path.expanduser(arg))):
 
                 path = os.path.expanduser(arg)
-
-                read, result = self._read_file(path, **kwargs)
-
-                if read:
-                    data_header_pairs.append(result)
-                else:
-                    filepaths.append(result)
+                files.append(path)
 
             # Directory
             elif (isinstance(arg, six.string_types) and
                   os.path.isdir(os.path.expanduser(arg))):
 
                 path = os.path.expanduser(arg)
-                files = [os.path.join(path, elem) for elem in os.listdir(path)]
-                for afile in files:
-                    # returns a boolean telling us if it were read and either a
-                    # tuple or the original filepath for reading by a source
-                    read, result = self._read_file(afile, **kwargs)
-                    if read:
-                        data_header_pairs.append(result)
-                    else:
-                        filepaths.append(result)
+                files += [os.path.join(path, elem) for elem in os.listdir(path)]
 
             # Glob
             elif (isinstance(arg, six.string_types) and '*' in arg):
 
-                files = glob.glob(os.path.expanduser(arg))
-
-                for afile in files:
-                    # data_header_unit_tuples += self._read_file(afile, **kwargs)
-                    # returns a boolean telling us if it were read and either a
-                    # tuple or the original filepath for reading by a source
-                    read, result = self._read_file(afile, **kwargs)
-                    if read:
-                        data_header_pairs.append(result)
-                    else:
-                        filepaths.append(result)
+                files += glob.glob(os.path.expanduser(arg))
 
             # Already a TimeSeries
             elif isinstance(arg, GenericTimeSeries):
@@ -372,6 +365,16 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                 raise NoMatchError("File not found or invalid input")
             i += 1
 
+        # Read all the files at once, so that this can be done in parallel.
+        # Each result is a boolean telling us if it were read and either a
+        # tuple or the original filepath for reading by a source
+        for read, result in self._read_files(files, parallel=parallel,
+                                             max_workers=max_workers, **kwargs):
+            if read:
+                data_header_pairs.append(result)
+            else:
+                filepaths.append(result)
+
         # TODO:
         # In the end, if there are already TimeSeries it should be put in the
         # same order as the input, currently they are not.
@@ -392,6 +395,15 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         silence_errors : `bool`, optional
             If set, ignore data-header pairs which cause an exception.
 
+        parallel : `bool`, optional
+            If set, files are read using a pool of threads. The order of the
+            returned time series is the same as when reading the files one by
+            one.
+
+        max_workers : `int`, optional
+            The maximum number of threads used when ``parallel`` is set.
+            Defaults to the `concurrent.futures.ThreadPoolExecutor` default.
+
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io.read_file` such
@@ -400,23 +412,30 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
         # Hack to get around Python 2.x not backporting PEP 3102.
         silence_errors = kwargs.pop('silence_errors', False)
+        parallel = kwargs.pop('parallel', False)
+        max_workers = kwargs.pop('max_workers', None)
 
         (data_header_unit_tuples, data_header_pairs,
-         already_timeseries, filepaths) = self._parse_args(*args, **kwargs)
+         already_timeseries, filepaths) = self._parse_args(*args, parallel=parallel,
+                                                           max_workers=max_workers, **kwargs)
 
         new_timeseries = list()
 
-        # The filepaths for unreadable files
-        for filepath in filepaths:
+        # The filepaths for unreadable files, which are parsed by the source
+        # classes themselves.
+        def parse_filepath(filepath):
             try:
-                new_ts = self._check_registered_widgets(filepath=filepath, **kwargs)
+                return self._check_registered_widgets(filepath=filepath, **kwargs)
             except (NoMatchError, MultipleMatchError, ValidationFunctionError):
                 if not silence_errors:
                     raise
-            except:
-                raise
 
-            new_timeseries.append(new_ts)
+        if parallel:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(parse_filepath, filepaths))
+        else:
+            parsed = [parse_filepath(filepath) for filepath in filepaths]
+        new_timeseries += [ts for ts in parsed if ts is not None]
 
         # data_header_pairs is a list of HDUs as read by sunpy.io
         # For each set of HDus find the matching class and read the
@@ -478,9 +497,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         concatenate = kwargs.get('concatenate', False)
         if concatenate:
             # Merge all these timeseries into one.
-            full_timeseries = new_timeseries.pop(0)
-            for timeseries in new_timeseries:
-                full_timeseries = full_timeseries.concatenate(timeseries)
+            full_timeseries = new_timeseries[0].concatenate_many(new_timeseries[1:])
 
             new_timeseries = [full_timeseries]
 
@@ -493,6 +510,103 @@ class TimeSeriesFactory(BasicRegistrationFactory):
             return new_timeseries[0]
         return new_timeseries
 
+    def stream(self, *args, **kwargs):
+        """
+        Read TimeSeries one file at a time, yielding each of them truncated to
+        a time range.
+
+        Unlike calling the factory with ``concatenate=True``, only the data of
+        one file (or of ``max_workers`` files when reading ahead) is held in
+        memory at a time, so a long span of data can be processed piece by
+        piece, or the pieces passed to
+        `~sunpy.timeseries.GenericTimeSeries.concatenate_many`.
+
+        Parameters
+        ----------
+        args
+            Any of the inputs accepted by the factory. Files, directories and
+            globs are expanded to single files, which are read in the order
+            given (directories and globs in sorted order).
+
+        timerange : `~sunpy.time.TimeRange`, optional
+            Only the data in this time range is returned, and time series with
+            no data in it are skipped.
+
+        parallel : `bool`, optional
+            If set, the next files are read in a pool of threads while the
+            current time series is being used.
+
+        max_workers : `int`, optional
+            The number of files read ahead when ``parallel`` is set. Defaults
+            to 2.
+
+        Other keyword arguments are passed on to the factory.
+
+        Yields
+        ------
+        timeseries : `~sunpy.timeseries.GenericTimeSeries`
+
+        Examples
+        --------
+        >>> from sunpy.time import TimeRange
+        >>> tr = TimeRange('2011-06-07 00:00', '2011-06-08 00:00')
+        >>> for ts in sunpy.timeseries.TimeSeries.stream('goes/*.fits', timerange=tr):  # doctest: +SKIP
+        ...     print(ts.data.max())
+        """
+        timerange = kwargs.pop('timerange', None)
+        parallel = kwargs.pop('parallel', False)
+        max_workers = kwargs.pop('max_workers', None) or 2
+        kwargs.pop('concatenate', None)
+
+        inputs = []
+        for arg in expand_list(args):
+            if isinstance(arg, six.string_types):
+                path = os.path.expanduser(arg)
+                if os.path.isdir(path):
+                    inputs += [os.path.join(path, elem) for elem in sorted(os.listdir(path))]
+                    continue
+                elif not os.path.isfile(path) and '*' in arg:
+                    inputs += sorted(glob.glob(path))
+                    continue
+            inputs.append(arg)
+
+        def read(arg):
+            timeseries = self(arg, **kwargs)
+            if not isinstance(timeseries, list):
+                timeseries = [timeseries]
+            return timeseries
+
+        if parallel:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            pending = [executor.submit(read, arg) for arg in inputs[:max_workers]]
+            inputs = inputs[max_workers:]
+        try:
+            while True:
+                if parallel:
+                    if not pending:
+                        break
+                    timeseries = pending.pop(0).result()
+                    if inputs:
+                        pending.append(executor.submit(read, inputs.pop(0)))
+                else:
+                    if not inputs:
+                        break
+                    timeseries = read(inputs.pop(0))
+
+                for ts in timeseries:
+                    if timerange is not None:
+                        if (len(ts.data) == 0 or ts.index.max() < timerange.start or
+                                ts.index.min() > timerange.end):
+                            continue
+                        ts = ts.truncate(timerange)
+                    if len(ts.data) > 0:
+                        yield ts
+        finally:
+            if parallel:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
     def _get_matching_widget(self, **kwargs):
         candidate_widget_types = list()
 
@@ -6,6 +6,7 @@ import warnings
 from collections import OrderedDict
 import copy
 
+import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 
@@ -14,6 +15,7 @@ from sunpy.time import TimeRange
 from sunpy.extern import six
 from sunpy.timeseries import TimeSeriesMetaData
 from sunpy.util.metadata import MetaDict
+from sunpy.visualization.decimate import LineDecimator
 
 import astropy
 import astropy.units as u
@@ -354,9 +356,63 @@ class GenericTimeSeries:
         object._sanitize_units()
         return object
 
+    def concatenate_many(self, others, **kwargs):
+        """Concatenate with a list of other TimeSeries at once.
+
+        This gives the same result as calling `concatenate` with each of the
+        time series in turn, but the data is copied into the result once and
+        the metadata is merged in a single pass, rather than once for each
+        time series. The rows are sorted by time in the same way as by
+        `concatenate`, so with more than one other time series the rows
+        which share a time may come out in a different order.
+
+        Parameters
+        ----------
+        others : `list` of `~sunpy.timeseries.TimeSeries`
+            The other time series.
+
+        same_source : `bool` Optional
+            Set to true to check if the sources of the time series match.
+
+        Returns
+        -------
+        newts : `~sunpy.timeseries.TimeSeries`
+            A new time series.
+        """
+        same_source = kwargs.pop('same_source', False)
+        others = [ts for ts in others if self != ts]
+        if not others:
+            return self
+        if same_source and not all(isinstance(ts, self.__class__) for ts in others):
+            raise TypeError("TimeSeries classes must match if specified.")
+
+        # Concatenate the metadata and data
+        meta = self.meta.concatenate([ts.meta for ts in others])
+        data = pd.concat([self.data] + [ts.data for ts in others], **kwargs)
+        # Sort in the same way as concatenate
+        data = data.sort_index()
+
+        # Add all the new units to the dictionary.
+        units = OrderedDict()
+        units.update(self.units)
+        for ts in others:
+            units.update(ts.units)
+
+        # If sources match then build similar TimeSeries.
+        if all(ts.__class__ == self.__class__ for ts in others):
+            object = self.__class__(data, meta, units)
+        else:
+            # Build generic time series if the sources don't match.
+            object = GenericTimeSeries(data, meta, units)
+
+        # Sanatise metadata and units
+        object._sanitize_metadata()
+        object._sanitize_units()
+        return object
+
 # #### Plotting Methods #### #
 
-    def plot(self, axes=None, **plot_args):
+    def plot(self, axes=None, decimate=None, **plot_args):
         """Plot a plot of the time series
 
         Parameters
@@ -365,6 +421,14 @@ class GenericTimeSeries:
             If provided the image will be plotted on the given axes. Otherwise
             the current axes will be used.
 
+        decimate : `bool`, optional
+            If set, only the smallest and largest values of each column in
+            each pixel of the width of the axes are plotted, which looks the
+            same but is much faster for long time series. The plotted points
+            are picked again whenever the x limits of the axes change, for
+            example on zooming. By default time series with more than 100000
+            rows are decimated.
+
         **plot_args : `dict`
             Any additional plot arguments that should be used
             when plotting.
@@ -379,10 +443,48 @@ class GenericTimeSeries:
         if axes is None:
             axes = plt.gca()
 
-        axes = self.data.plot(ax=axes, **plot_args)
+        return self._plot_data(self.data, axes, decimate, **plot_args)
+
+    def _plot_data(self, data, axes, decimate=None, **plot_args):
+        """
+        Plot a `~pandas.DataFrame` or `~pandas.Series` of the data, decimated
+        as described in `~sunpy.timeseries.GenericTimeSeries.plot`.
+        """
+        if not self._decimate(decimate, data):
+            return data.plot(ax=axes, **plot_args)
+
+        # Plot the decimated data, and then keep each line up to date with
+        # the x limits of its axes.
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        decimator = LineDecimator(axes, frame.index.values,
+                                  [frame[column].values for column in frame.columns])
+        plot_args.setdefault('x_compat', True)
+        axes = data.iloc[decimator.indices(visible=False)].plot(ax=axes, **plot_args)
+        for ax in np.ravel(axes):
+            lines = {line.get_label(): line for line in ax.get_lines()}
+            columns = [column for column in frame.columns if str(column) in lines]
+            LineDecimator(ax, frame.index.values,
+                          [frame[column].values for column in columns]).connect(
+                              [lines[str(column)] for column in columns])
 
         return axes
 
+    def _decimate(self, decimate=None, data=None):
+        """
+        Whether to decimate the data, or the given part of it, when plotting:
+        by default if there are more than 100000 rows, and only if the index
+        is sorted and all of the columns are numeric.
+        """
+        if data is None:
+            data = self.data
+        if isinstance(data, pd.Series):
+            data = data.to_frame()
+        if decimate is None:
+            decimate = len(data) > 100000
+        return (decimate and len(data) > 0 and
+                data.index.is_monotonic_increasing and
+                all(dtype.kind in 'iuf' for dtype in data.dtypes))
+
     def peek(self, **kwargs):
         """Displays the time series in a new figure.
 
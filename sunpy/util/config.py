@@ -37,7 +37,8 @@ def load_config():
     # Use absolute filepaths and adjust OS-dependent paths as needed
     filepaths = [
         ('downloads', 'download_dir'),
-        ('downloads', 'sample_dir')
+        ('downloads', 'sample_dir'),
+        ('downloads', 'query_cache')
     ]
     _fix_filepaths(config, filepaths)
 
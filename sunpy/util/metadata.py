@@ -15,11 +15,15 @@ class MetaDict(OrderedDict):
 
     This class handles everything in lower case. This allows case insensitive
     indexing.
+
+    Every change to the contents increments `version`, so that objects derived
+    from the meta data can tell when they need to be recomputed.
     """
     def __init__(self, *args):
         """Creates a new MapHeader instance"""
         # Store all keys as upper-case to allow for case-insensitive indexing
         # OrderedDict can be instantiated from a list of lists or a tuple of tuples
+        self._version = 0
         tags = dict()
         if args:
             args = list(args)
@@ -34,6 +38,13 @@ class MetaDict(OrderedDict):
 
         super(MetaDict, self).__init__(*args)
 
+    @property
+    def version(self):
+        """
+        A counter which is incremented every time the contents are changed.
+        """
+        return self._version
+
     def __contains__(self, key):
         """Override __contains__"""
         return OrderedDict.__contains__(self, key.lower())
@@ -44,8 +55,14 @@ class MetaDict(OrderedDict):
 
     def __setitem__(self, key, value):
         """Override [] indexing"""
+        self._version += 1
         return OrderedDict.__setitem__(self, key.lower(), value)
 
+    def __delitem__(self, key):
+        """Override del to perform case-insensitively"""
+        self._version += 1
+        return OrderedDict.__delitem__(self, key.lower())
+
     def get(self, key, default=None):
         """Override .get() indexing"""
         return OrderedDict.get(self, key.lower(), default)
@@ -56,12 +73,25 @@ class MetaDict(OrderedDict):
 
     def pop(self, key, default=None):
         """Override .pop() to perform case-insensitively"""
+        self._version += 1
         return OrderedDict.pop(self, key.lower(), default)
 
     def update(self, d2):
         """Override .update() to perform case-insensitively"""
+        self._version += 1
         return OrderedDict.update(self, OrderedDict((k.lower(), v) for k, v in d2.items()))
 
     def setdefault(self, key, default=None):
         """Override .setdefault() to perform case-insensitively"""
+        self._version += 1
         return OrderedDict.setdefault(self, key.lower(), default)
+
+    def popitem(self, last=True):
+        """Override .popitem() to record the change"""
+        self._version += 1
+        return OrderedDict.popitem(self, last)
+
+    def clear(self):
+        """Override .clear() to record the change"""
+        self._version += 1
+        return OrderedDict.clear(self)
@@ -362,3 +362,32 @@ def test_key_case_insensitivity(seas_metadict):
     assert seas_metadict['bering'] == 'Russia'
     assert seas_metadict['BeRinG'] == 'Russia'
     assert seas_metadict.get('BERING') == 'Russia'
+
+
+def test_version(seas_metadict):
+    versions = [seas_metadict.version]
+
+    def changed():
+        versions.append(seas_metadict.version)
+        return versions[-1] != versions[-2]
+
+    assert not changed()
+    seas_metadict.get('BALTIC')
+    assert 'baltic' in seas_metadict
+    assert not changed()
+
+    seas_metadict['bering'] = 'Russia'
+    assert changed()
+    seas_metadict.update({'Kara': 'Russia'})
+    assert changed()
+    seas_metadict.setdefault('Barents', 'Russia')
+    assert changed()
+    seas_metadict.pop('KARA')
+    assert changed()
+    del seas_metadict['BARENTS']
+    assert 'barents' not in seas_metadict
+    assert changed()
+    seas_metadict.popitem()
+    assert changed()
+    seas_metadict.clear()
+    assert changed()
@@ -75,19 +75,21 @@ class MapCubeAnimator(BaseFuncAnimator):
             self.remove_obj.pop(0).remove()
 
         i = int(val)
-        im.set_array(self.data[i].data)
-        im.set_cmap(self.mapcube[i].plot_settings['cmap'])
+        # Index the mapcube once, as this reads the data of a LazyMapCube
+        smap = self.mapcube[i]
+        im.set_array(smap.data)
+        im.set_cmap(smap.plot_settings['cmap'])
 
-        norm = deepcopy(self.mapcube[i].plot_settings['norm'])
+        norm = deepcopy(smap.plot_settings['norm'])
         # The following explicit call is for bugged versions of Astropy's ImageNormalize
-        norm.autoscale_None(self.data[i].data)
+        norm.autoscale_None(smap.data)
         im.set_norm(norm)
 
         if wcsaxes_compat.is_wcsaxes(im.axes):
-            im.axes.reset_wcs(self.mapcube[i].wcs)
+            im.axes.reset_wcs(smap.wcs)
             wcsaxes_compat.default_wcs_ticks(im.axes,
-                                             self.mapcube[i].spatial_units,
-                                             self.mapcube[i].coordinate_system)
+                                             smap.spatial_units,
+                                             smap.coordinate_system)
 
         # Having this line in means the plot will resize for non-homogenous
         # maps. However it also means that if you zoom in on the plot bad
@@ -97,7 +99,7 @@ class MapCubeAnimator(BaseFuncAnimator):
             self._annotate_plot(i)
 
         self.remove_obj += list(
-            self.user_plot_function(self.fig, self.axes, self.mapcube[i]))
+            self.user_plot_function(self.fig, self.axes, smap))
 
     def _annotate_plot(self, ind):
         """
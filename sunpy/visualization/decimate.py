@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Reduce long series of data to what can be seen at the resolution of a plot.
+
+For each column of pixels of the axes only the points with the smallest and
+largest value are drawn. A line through these points covers the same pixels
+as a line through all of the data, but a month of 2 second data is drawn
+from a few thousand points rather than over a million.
+"""
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+import matplotlib.dates
+
+__all__ = ['minmax_indices', 'LineDecimator']
+
+
+def _bucket_extremes(y, starts, seg_id, reduce):
+    """
+    The index of the first point holding the extreme value of each bucket,
+    and of the first point of each bucket with no finite values.
+    """
+    extremes = reduce.reduceat(y, starts)
+    is_extreme = y == extremes[seg_id]
+    indices = np.flatnonzero(is_extreme)
+    _, first = np.unique(seg_id[indices], return_index=True)
+    # Keep a NaN point in empty buckets so that gaps in the data stay gaps
+    empty = starts[np.isnan(extremes)]
+    return np.concatenate([indices[first], empty])
+
+
+def minmax_indices(x, y, n_buckets, xlim=None):
+    """
+    The indices of the points needed to draw ``y`` against ``x`` at a
+    resolution of ``n_buckets`` along the x axis.
+
+    The x range is split into ``n_buckets`` equal parts, and the points with
+    the smallest and largest value of each column of ``y`` in each part are
+    kept, along with the first and last point.
+
+    Parameters
+    ----------
+    x : `numpy.ndarray`
+        The sorted x values, numbers or `numpy.datetime64`.
+    y : `numpy.ndarray`
+        The y values, one column for each line, or a single line.
+    n_buckets : `int`
+        The number of parts to split the x range into, usually the width of
+        the axes in pixels.
+    xlim : `tuple`, optional
+        Only the points in this range of x, and one either side of it, are
+        returned.
+
+    Returns
+    -------
+    indices : `numpy.ndarray`
+        The sorted indices of the points to draw.
+    """
+    x = np.asarray(x)
+    if x.dtype.kind == 'M':
+        x = x.astype('M8[ns]').view('i8')
+    y = np.asarray(y, dtype=float)
+    if y.ndim == 1:
+        y = y[:, np.newaxis]
+
+    lo, hi = 0, len(x)
+    if xlim is not None:
+        lo = max(np.searchsorted(x, xlim[0], 'left') - 1, 0)
+        hi = min(np.searchsorted(x, xlim[1], 'right') + 1, len(x))
+    if hi - lo <= 4 * n_buckets:
+        return np.arange(lo, hi)
+
+    xs = x[lo:hi]
+    edges = np.linspace(float(xs[0]), float(xs[-1]), n_buckets + 1)[:-1]
+    starts = np.unique(np.searchsorted(xs, edges, 'left'))
+    seg_id = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(xs))))
+
+    indices = [np.array([0, len(xs) - 1])]
+    for column in y[lo:hi].T:
+        indices.append(_bucket_extremes(column, starts, seg_id, np.fmin))
+        indices.append(_bucket_extremes(column, starts, seg_id, np.fmax))
+    return np.unique(np.concatenate(indices)) + lo
+
+
+class LineDecimator(object):
+    """
+    Draw lines through the points picked by `minmax_indices` for the current
+    x limits and size of the axes, updated whenever the x limits change, for
+    example on zooming.
+
+    Parameters
+    ----------
+    axes : `matplotlib.axes.Axes`
+        The axes the lines are drawn on.
+    x : `numpy.ndarray`
+        The sorted x values shared by the lines, numbers or
+        `numpy.datetime64`.
+    ys : `list` of `numpy.ndarray`
+        The y values of each line.
+    """
+    def __init__(self, axes, x, ys):
+        self.axes = axes
+        self.x = np.asarray(x)
+        self.ys = [np.asarray(y) for y in ys]
+        self.lines = []
+
+    @property
+    def n_buckets(self):
+        """
+        The width of the axes in pixels.
+        """
+        return max(int(self.axes.bbox.width), 1)
+
+    def _xlim(self):
+        xlim = self.axes.get_xlim()
+        if self.x.dtype.kind == 'M':
+            xlim = [np.datetime64(dt.replace(tzinfo=None), 'ns').view('i8')
+                    for dt in matplotlib.dates.num2date(xlim)]
+        return xlim
+
+    def indices(self, visible=True):
+        """
+        The indices of the points to draw, over the current x limits of the
+        axes if ``visible`` is set, or else over all of the data.
+        """
+        return minmax_indices(self.x, np.column_stack(self.ys), self.n_buckets,
+                              xlim=self._xlim() if visible else None)
+
+    def connect(self, lines):
+        """
+        Keep ``lines``, one for each of the y values, up to date with the x
+        limits of the axes.
+        """
+        self.lines = list(lines)
+        # A bound method would only be weakly referenced by the callbacks
+        self.axes.callbacks.connect('xlim_changed', lambda axes: self.update())
+        return self
+
+    def update(self):
+        """
+        Redraw the lines for the current x limits of the axes.
+        """
+        indices = self.indices()
+        x = self.x[indices]
+        for line, y in zip(self.lines, self.ys):
+            line.set_data(x, y[indices])
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from sunpy.visualization.decimate import minmax_indices, LineDecimator
+
+
+def test_minmax_indices_short():
+    x = np.arange(100)
+    assert np.all(minmax_indices(x, np.sin(x), 50) == x)
+
+
+def test_minmax_indices_envelope():
+    rng = np.random.RandomState(0)
+    x = np.arange(100000)
+    y = rng.normal(size=(100000, 2))
+    y[50000:50500, 0] = np.nan
+    indices = minmax_indices(x, y, 100)
+    assert len(indices) < 500
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+
+    # Each bucket has the same extremes as the full data
+    for bucket in range(100):
+        in_bucket = (x >= bucket * 1000) & (x < (bucket + 1) * 1000)
+        picked = indices[(indices >= bucket * 1000) & (indices < (bucket + 1) * 1000)]
+        for column in range(2):
+            assert np.nanmax(y[picked, column]) == np.nanmax(y[in_bucket, column])
+            assert np.nanmin(y[picked, column]) == np.nanmin(y[in_bucket, column])
+    # The gap in the first column is kept
+    assert np.isnan(y[indices, 0]).any()
+
+
+def test_minmax_indices_xlim():
+    x = np.arange('2012-01-01', '2012-01-02', dtype='M8[s]')
+    y = np.sin(np.arange(len(x)) / 1000.)
+    xlim = (np.datetime64('2012-01-01T06', 'ns').view('i8'),
+            np.datetime64('2012-01-01T07', 'ns').view('i8'))
+    indices = minmax_indices(x, y, 100, xlim=xlim)
+    assert x[indices[0]] == np.datetime64('2012-01-01T05:59:59')
+    assert x[indices[-1]] == np.datetime64('2012-01-01T07:00:01')
+    assert len(indices) < 500
+
+
+def test_line_decimator():
+    x = np.arange('2012-01-01', '2012-01-02', dtype='M8[s]')
+    y = np.sin(np.arange(len(x)) / 1000.)
+    figure = plt.figure()
+    axes = figure.gca()
+    decimator = LineDecimator(axes, x, [y])
+    indices = decimator.indices(visible=False)
+    line, = axes.plot(x[indices], y[indices])
+    decimator.connect([line])
+    assert len(line.get_xdata()) == len(indices) < 4 * decimator.n_buckets
+
+    # Zooming in picks points from the new range only
+    axes.set_xlim(np.datetime64('2012-01-01T06'), np.datetime64('2012-01-01T06:10'))
+    assert len(line.get_xdata()) == 603
+    assert line.get_xdata()[0] == np.datetime64('2012-01-01T05:59:59')
+    plt.close(figure)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Measure the throughput of `sunpy.time.parse_time` for each of the formats in
+`sunpy.time.time.TIME_FORMAT_LIST`, for single strings and for arrays of
+strings.
+
+Run it as::
+
+    python tools/benchmark_parse_time.py [number]
+
+where ``number`` is the number of strings parsed for each format.
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from sunpy.time import parse_time
+from sunpy.time.time import TIME_FORMAT_LIST
+
+
+def time_strings(time_format, number):
+    start = datetime(2007, 5, 4, 21, 8, 12, 123456)
+    return [(start + timedelta(seconds=37 * i)).strftime(time_format)
+            for i in range(number)]
+
+
+def main(number=2000):
+    print("{:<28} {:>14} {:>14}".format("format", "strings/s", "array str/s"))
+    for time_format in TIME_FORMAT_LIST:
+        strings = time_strings(time_format, number)
+        array = np.array(strings)
+        scalar = min(timeit.repeat(lambda: [parse_time(s) for s in strings],
+                                   number=1, repeat=3))
+        bulk = min(timeit.repeat(lambda: parse_time(array), number=1, repeat=3))
+        print("{:<28} {:>14.0f} {:>14.0f}".format(time_format, number / scalar,
+                                                  number / bulk))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])